@@ -1,34 +1,44 @@
 # -*- mode: python ; coding: utf-8 -*-
+# Build: python src/bake_assets.py && pyinstaller Zombii.spec
+import os
+import pygame
+
+# Prebaked assets skip procedural generation at startup; the game falls back to
+# generating them if the pack is missing or stale. The pack's fingerprint covers the
+# generator source, so that ships next to it.
+datas = [('src\\assets.pak', '.'), ('src\\assets_manager.py', '.')] if os.path.exists('src\\assets.pak') else []
+
+# pygame's default font is the UI fallback when a system font isn't installed
+datas.append((os.path.join(os.path.dirname(pygame.__file__), 'freesansbold.ttf'), 'pygame'))
 
 
 a = Analysis(
     ['src\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['tkinter', 'unittest', 'pydoc', 'doctest', 'numpy'],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
+# One-folder build: a one-file exe unpacks everything to a temp dir on every
+# launch, and UPX-compressed DLLs must be decompressed on load
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='Zombii',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +46,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='Zombii',
+)
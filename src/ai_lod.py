@@ -0,0 +1,46 @@
+"""
+AI level-of-detail scheduler - updates distant zombies less often with larger time steps.
+Work for each distance bucket is staggered across frames so per-frame AI cost stays bounded.
+"""
+import quality
+from settings import *
+
+
+class AIScheduler:
+    """Buckets zombies by distance to the player and decides who updates this frame."""
+
+    def __init__(self):
+        self.frame = 0
+        self.near_dist_sq = AI_LOD_NEAR_DIST ** 2
+        self.mid_dist_sq = AI_LOD_MID_DIST ** 2
+
+    def get_interval(self, x, y, player_pos):
+        """Get how many frames apart a zombie at (x, y) should be updated."""
+        dist_sq = (x - player_pos.x) ** 2 + (y - player_pos.y) ** 2
+        if dist_sq <= self.near_dist_sq:
+            return 1
+        scale = quality.get("ai_interval_scale")
+        if dist_sq <= self.mid_dist_sq:
+            return round(AI_LOD_MID_INTERVAL * scale)
+        return round(AI_LOD_FAR_INTERVAL * scale)
+
+    def schedule(self, zombies, player_pos, view_rect):
+        """
+        Return (index, steps, visible) for every zombie in the ZombieStore due an update
+        this frame. `steps` is the number of frames of movement to simulate; `visible`
+        is False for zombies outside view_rect so they can skip image rotation.
+        """
+        self.frame += 1
+        c = zombies.store.columns
+        xs, ys, ws, hs, slots = c["x"], c["y"], c["w"], c["h"], c["ai_slot"]
+        left, top, right, bottom = view_rect.left, view_rect.top, view_rect.right, view_rect.bottom
+        due = []
+        for i in range(len(zombies)):
+            x, y, w, h = xs[i], ys[i], ws[i], hs[i]
+            zx = int(x) - w // 2
+            zy = int(y) - h // 2
+            visible = zx < right and zx + w > left and zy < bottom and zy + h > top
+            interval = 1 if visible else self.get_interval(x, y, player_pos)
+            if (self.frame + slots[i]) % interval == 0:
+                due.append((i, interval, visible))
+        return due
@@ -1,7 +1,15 @@
 """
 Procedural asset generator - creates all game sprites with detailed, realistic pixel art.
 Includes obstacle generation. No external image files needed.
+
+Assets are loaded from a prebaked asset pack (see bake_asset_pack) when one matching
+this generator code and settings ships with the build; otherwise they are all
+generated at startup.
 """
+import os
+import zlib
+import types
+import struct
 import pygame
 import math
 import random
@@ -12,9 +20,9 @@ from settings import *
 #  PLAYER SPRITE — detailed human soldier (top-down)
 # ═══════════════════════════════════════════════════════════
 
-def create_player_surface(size=PLAYER_SIZE):
+def create_player_surface(size=None):
     """Create a detailed top-down soldier sprite facing right."""
-    s = size
+    s = size if size is not None else PLAYER_SIZE
     surf = pygame.Surface((s, s), pygame.SRCALPHA)
 
     # ── Legs (behind body) ──
@@ -402,10 +410,10 @@ def create_sandbag_surface(w=70, h=35):
 #  BULLETS, CROSSHAIR, GROUND, PICKUPS  (kept from original)
 # ═══════════════════════════════════════════════════════════
 
-def create_bullet_surface(color=YELLOW, size=6):
+def create_bullet_surface(color=None, size=6):
     """Create a bullet sprite."""
     surf = pygame.Surface((size, size), pygame.SRCALPHA)
-    pygame.draw.circle(surf, color, (size // 2, size // 2), size // 2)
+    pygame.draw.circle(surf, color if color is not None else YELLOW, (size // 2, size // 2), size // 2)
     pygame.draw.circle(surf, WHITE, (size // 2, size // 2), size // 4)
     return surf
 
@@ -425,8 +433,10 @@ def create_crosshair(size=32):
     return surf
 
 
-def create_ground_tile(size=TILE_SIZE):
+def create_ground_tile(size=None):
     """Create a ground tile with dirt / road texture."""
+    if size is None:
+        size = TILE_SIZE
     surf = pygame.Surface((size, size))
     surf.fill((35, 35, 30))
     for _ in range(25):
@@ -467,36 +477,155 @@ def create_ammo_pickup(size=20):
 # ═══════════════════════════════════════════════════════════
 
 class AssetManager:
-    """Loads and caches all game assets."""
+    """
+    Loads and caches all game assets. Packed assets are unpacked on first use; without
+    a valid pack everything is generated up front, so drawing never stalls mid-game.
+    """
 
-    def __init__(self):
+    def __init__(self, pack_path=None):
         self.assets = {}
-        self._generate_all()
-
-    def _generate_all(self):
-        # Player
-        self.assets["player"] = create_player_surface()
-
-        # Zombies
-        for z_type in ZOMBIE_TYPES:
-            self.assets[f"zombie_{z_type}"] = create_zombie_surface(z_type)
+        self._factories = asset_factories()
+        self._packed = read_asset_pack(pack_path if pack_path is not None else ASSET_PACK_FILE)
+        if not self._packed:
+            self.load_all()
 
-        # Bullets
-        for w_name, w_data in WEAPONS.items():
-            self.assets[f"bullet_{w_name}"] = create_bullet_surface(w_data["color"])
+    def get(self, name):
+        surface = self.assets.get(name)
+        if surface is None:
+            packed = self._packed.pop(name, None)
+            if packed is not None:
+                surface = _unpack_surface(*packed)
+            elif name in self._factories:
+                surface = self._factories[name]()
+            else:
+                return None
+            self.assets[name] = surface
+        return surface
+
+    def load_all(self):
+        """Build every asset now instead of on first use."""
+        for name in self._factories:
+            self.get(name)
+
+
+def asset_factories():
+    """Map of asset name to the function that generates it."""
+    factories = {"player": create_player_surface}
+
+    # Zombies
+    for z_type in ZOMBIE_TYPES:
+        factories[f"zombie_{z_type}"] = lambda z_type=z_type: create_zombie_surface(z_type)
+
+    # Bullets
+    for w_name, w_data in WEAPONS.items():
+        factories[f"bullet_{w_name}"] = lambda color=w_data["color"]: create_bullet_surface(color)
+
+    # Obstacles
+    factories["barricade"] = create_barricade_surface
+    factories["car"] = create_car_surface
+    factories["crate"] = create_crate_surface
+    factories["concrete_wall"] = create_concrete_wall
+    factories["sandbag"] = create_sandbag_surface
+
+    # Other
+    factories["crosshair"] = create_crosshair
+    factories["ground_tile"] = create_ground_tile
+    factories["health_pickup"] = create_health_pickup
+    factories["ammo_pickup"] = create_ammo_pickup
+    return factories
 
-        # Obstacles
-        self.assets["barricade"] = create_barricade_surface()
-        self.assets["car"] = create_car_surface()
-        self.assets["crate"] = create_crate_surface()
-        self.assets["concrete_wall"] = create_concrete_wall()
-        self.assets["sandbag"] = create_sandbag_surface()
 
-        # Other
-        self.assets["crosshair"] = create_crosshair()
-        self.assets["ground_tile"] = create_ground_tile()
-        self.assets["health_pickup"] = create_health_pickup()
-        self.assets["ammo_pickup"] = create_ammo_pickup()
+# ═══════════════════════════════════════════════════════════
+#  PREBAKED ASSET PACK
+# ═══════════════════════════════════════════════════════════
 
-    def get(self, name):
-        return self.assets.get(name)
+ASSET_PACK_MAGIC = b"ZPAK"
+ASSET_PACK_VERSION = 1
+
+_PACK_HEADER = struct.Struct("<4sHIH")  # magic, version, asset fingerprint, asset count
+_PACK_ENTRY = struct.Struct("<HH?I")    # width, height, has alpha, compressed size
+
+
+def asset_fingerprint():
+    """
+    Checksum of this module's source and of every setting the generators read; a pack
+    baked under different code or settings is stale. Frozen builds bundle the source
+    next to the pack; if it's missing there is no fingerprint and no pack is used.
+    """
+    try:
+        with open(os.path.join(BUNDLE_DIR, "assets_manager.py"), "rb") as f:
+            source = f.read()
+    except OSError:
+        return None
+    return zlib.crc32(repr(sorted(_generator_settings().items())).encode(), zlib.crc32(source))
+
+
+def _generator_settings():
+    """Settings read by the asset factories and everything they call, by name."""
+    settings, seen = {}, set()
+    factories = asset_factories()
+    stack = [asset_factories.__code__] + [f.__code__ for f in factories.values()]
+    while stack:
+        code = stack.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        stack.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+        for name in code.co_names:
+            value = globals().get(name)
+            if isinstance(value, types.FunctionType):
+                stack.append(value.__code__)
+            elif name.isupper() and name in globals():
+                settings[name] = value
+    return settings
+
+
+def bake_asset_pack(path):
+    """Generate every asset and write them to an asset pack at `path`."""
+    fingerprint = asset_fingerprint()
+    if fingerprint is None:
+        raise OSError(f"can't fingerprint the asset generators: no assets_manager.py in {BUNDLE_DIR}")
+    factories = asset_factories()
+    parts = [_PACK_HEADER.pack(ASSET_PACK_MAGIC, ASSET_PACK_VERSION, fingerprint, len(factories))]
+    for name, factory in factories.items():
+        surface = factory()
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        pixels = zlib.compress(pygame.image.tobytes(surface, "RGBA" if alpha else "RGB"), 9)
+        encoded = name.encode()
+        parts.append(bytes((len(encoded),)) + encoded)
+        parts.append(_PACK_ENTRY.pack(surface.get_width(), surface.get_height(), alpha, len(pixels)))
+        parts.append(pixels)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"".join(parts))
+
+
+def read_asset_pack(path):
+    """
+    Read a pack into {name: (width, height, has alpha, compressed pixels)}.
+    Missing, corrupt or stale packs give {} so everything is generated instead.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, fingerprint, count = _PACK_HEADER.unpack_from(data)
+        if magic != ASSET_PACK_MAGIC or version != ASSET_PACK_VERSION or fingerprint != asset_fingerprint():
+            return {}
+        packed = {}
+        offset = _PACK_HEADER.size
+        for _ in range(count):
+            name_len = data[offset]
+            name = data[offset + 1:offset + 1 + name_len].decode()
+            offset += 1 + name_len
+            width, height, alpha, size = _PACK_ENTRY.unpack_from(data, offset)
+            offset += _PACK_ENTRY.size
+            packed[name] = (width, height, alpha, data[offset:offset + size])
+            offset += size
+        return packed
+    except (OSError, struct.error, IndexError, UnicodeDecodeError):
+        return {}
+
+
+def _unpack_surface(width, height, alpha, pixels):
+    mode = "RGBA" if alpha else "RGB"
+    return pygame.image.frombytes(zlib.decompress(pixels), (width, height), mode)
@@ -0,0 +1,106 @@
+"""
+Asyncio main loop - frames are paced on the event loop and side tasks (metrics export,
+a local control socket) run cooperatively in the gaps between them.
+
+Frame deadlines take priority: the game's FramePacer sleeps on the loop until the next
+deadline (spinning the last stretch with the hybrid strategy), and side tasks only ever
+run while the frame loop is asleep. Side tasks must therefore await often and push
+blocking work to a thread.
+"""
+import os
+import json
+import asyncio
+from settings import *
+
+
+async def run_async(game, threaded=False):
+    """Run the game's frames on the event loop until game.running is cleared."""
+    tasks = [asyncio.create_task(coro) for coro in _side_tasks(game)]
+    try:
+        while game.running:
+            await game.pacer.wait_async()
+            game._frame(threaded)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _side_tasks(game):
+    tasks = []
+    if METRICS_EXPORT_FILE:
+        tasks.append(export_metrics(game, METRICS_EXPORT_FILE, METRICS_EXPORT_INTERVAL))
+    if CONTROL_SOCKET_PORT:
+        tasks.append(serve_control_socket(game, CONTROL_SOCKET_PORT))
+    return tasks
+
+
+def game_status(game):
+    """Summary of the running game for metrics and the control socket."""
+    status = {
+        "state": game.state,
+        "fps": round(game.clock.get_fps(), 1),
+        "pacing": game.pacer.stats(),
+    }
+    if game.player:
+        status.update(
+            wave=game.level_manager.wave,
+            score=game.player.score,
+            hp=round(game.player.hp, 1),
+            zombies=len(game.zombies),
+        )
+    return status
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+async def export_metrics(game, path, interval):
+    """Periodically write game_status to `path`; the write happens on a worker thread."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_write_json, path, game_status(game))
+        except OSError:
+            pass
+
+
+async def serve_control_socket(game, port):
+    """
+    Line-based control socket on localhost. Commands: status, save, pause, resume, quit;
+    each reply is one JSON line.
+    """
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                reply = _run_command(game, line.decode(errors="replace").strip().lower())
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", port)
+    async with server:
+        await server.serve_forever()
+
+
+def _run_command(game, command):
+    with game.sim_lock:
+        if command == "status":
+            return game_status(game)
+        if command == "save" and game.state in (STATE_PLAYING, STATE_PAUSED):
+            game.autosaver.save(game)
+        elif command == "pause" and game.state == STATE_PLAYING:
+            game.state = STATE_PAUSED
+        elif command == "resume" and game.state == STATE_PAUSED:
+            game.state = STATE_PLAYING
+        elif command == "quit":
+            game.running = False
+        else:
+            return {"ok": False, "error": f"unknown or unavailable command: {command}"}
+    return {"ok": True}
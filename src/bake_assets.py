@@ -0,0 +1,33 @@
+"""
+Bake every procedurally generated asset into a pack that ships with the build, so the
+packaged game loads pixels instead of drawing them at startup.
+
+Usage:
+    python src/bake_assets.py
+    pyinstaller Zombii.spec
+"""
+import os
+import sys
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Ensure we can import from src/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from settings import *
+from assets_manager import bake_asset_pack, read_asset_pack
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake the game's assets into an asset pack.")
+    parser.add_argument("--out", default=ASSET_PACK_FILE, help="pack file to write")
+    args = parser.parse_args()
+
+    bake_asset_pack(args.out)
+    count = len(read_asset_pack(args.out))
+    print(f"Baked {count} assets into {args.out} ({os.path.getsize(args.out) / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Balancing runner - plays many headless bot games in parallel across all CPU cores and
+summarizes survival wave, kills, damage taken and per-tick cost.
+
+Usage:
+    python src/balance.py --seeds 16 --difficulties hard,extreme
+    python src/balance.py --sweep DIFFICULTIES.hard.zombie_speed=3,3.5,4 --set WEAPONS.rifle.damage=40
+"""
+import os
+import sys
+import ast
+import time
+import random
+import argparse
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+# Headless runs never open a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Ensure we can import from src/
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SRC_DIR)
+
+import settings
+import game_clock
+from settings import *
+from bot import KitingBot
+
+
+def apply_overrides(overrides):
+    """
+    Apply {"DIFFICULTIES.hard.zombie_speed": 4, "PLAYER_SPEED": 5, ...} to the live settings.
+    Top-level names are also rebound in every game module that star-imported them;
+    names that are also read at import time are rejected by check_overridable.
+    Returns an undo list for restore_overrides.
+    """
+    undo = []
+    for path, value in overrides.items():
+        parts = path.split(".")
+        if len(parts) == 1:
+            name = parts[0]
+            if not hasattr(settings, name):
+                raise KeyError(f"Unknown setting {name}")
+            check_overridable(name)
+            old = getattr(settings, name)
+            for module in list(sys.modules.values()):
+                module_file = getattr(module, "__file__", None) or ""
+                if os.path.dirname(os.path.abspath(module_file)) == SRC_DIR and getattr(module, name, None) is old:
+                    undo.append((module, name, old, True))
+                    setattr(module, name, value)
+        else:
+            container = getattr(settings, parts[0])
+            for key in parts[1:-1]:
+                container = container[key]
+            if parts[-1] not in container:
+                raise KeyError(f"Unknown setting {path}")
+            undo.append((container, parts[-1], container[parts[-1]], False))
+            container[parts[-1]] = value
+    return undo
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_sources():
+    trees = {}
+    for filename in sorted(os.listdir(SRC_DIR)):
+        if filename.endswith(".py"):
+            with open(os.path.join(SRC_DIR, filename), encoding="utf-8") as f:
+                trees[filename] = ast.parse(f.read(), filename)
+    return trees
+
+
+def _names_in(nodes):
+    return {n.id for node in nodes if node is not None for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def frozen_uses(name):
+    """
+    Find where a top-level setting is read once at import: parameter defaults and
+    module or class level assignments. Rebinding the setting can't reach those.
+    """
+    uses = []
+    for filename, tree in _parse_sources().items():
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                if name in _names_in(node.args.defaults + node.args.kw_defaults):
+                    uses.append(f"{filename}:{node.lineno}")
+            elif isinstance(node, (ast.Module, ast.ClassDef)):
+                for stmt in node.body:
+                    if isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)) and name in _names_in([stmt.value]):
+                        uses.append(f"{filename}:{stmt.lineno}")
+    return uses
+
+
+def check_overridable(path):
+    """Raise ValueError if overriding `path` would not change the run."""
+    name = path.split(".")[0]
+    if "." in path or not hasattr(settings, name):
+        return
+    uses = frozen_uses(name)
+    if uses:
+        raise ValueError(f"Overriding {name} would not fully apply: it is read at import time ({', '.join(uses)})")
+
+
+def restore_overrides(undo):
+    """Undo apply_overrides."""
+    for target, key, old, is_attr in reversed(undo):
+        if is_attr:
+            setattr(target, key, old)
+        else:
+            target[key] = old
+
+
+def run_once(job):
+    """Play one headless game to death or the tick limit and return its stats."""
+    seed, difficulty_key, overrides, max_ticks = job
+    undo = apply_overrides(overrides)
+    try:
+        from main import Game
+
+        random.seed(seed)
+        game_clock.use_simulated_time(0)
+        game = Game(headless=True, bot=KitingBot(seed))
+        game._start_game(difficulty_key)
+
+        tick_ms = 1000 / FPS
+        tick_times = []
+        damage_taken = 0.0
+        ticks = 0
+        while ticks < max_ticks and game.state == STATE_PLAYING:
+            hp = game.player.hp
+            start = time.perf_counter()
+            game._update()
+            tick_times.append((time.perf_counter() - start) * 1000)
+            damage_taken += max(0.0, hp - game.player.hp)
+            game_clock.advance(tick_ms)
+            ticks += 1
+
+        tick_times.sort()
+        return {
+            "seed": seed,
+            "difficulty": difficulty_key,
+            "overrides": overrides,
+            "died": game.state == STATE_GAME_OVER,
+            "wave": game.level_manager.wave,
+            "kills": game.player.kills,
+            "score": game.player.score,
+            "damage_taken": damage_taken,
+            "survived_s": ticks * tick_ms / 1000,
+            "tick_ms_mean": sum(tick_times) / max(1, len(tick_times)),
+            "tick_ms_p95": tick_times[int(len(tick_times) * 0.95)] if tick_times else 0.0,
+        }
+    finally:
+        restore_overrides(undo)
+        game_clock.use_real_time()
+
+
+def _parse_value(text):
+    """Parse a CLI value as a Python literal, falling back to a plain string."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def build_jobs(seeds, difficulties, fixed, sweeps, max_ticks, base_seed=0):
+    """Cartesian product of sweep values x difficulties x seeds."""
+    sweep_keys = list(sweeps)
+    jobs = []
+    for combo in itertools.product(*(sweeps[k] for k in sweep_keys)):
+        overrides = dict(fixed)
+        overrides.update(zip(sweep_keys, combo))
+        for difficulty_key in difficulties:
+            for i in range(seeds):
+                jobs.append((base_seed + i, difficulty_key, overrides, max_ticks))
+    return jobs
+
+
+def summarize(results, label_keys):
+    """Group results by difficulty and swept values, returning printable table lines."""
+    groups = {}
+    for r in results:
+        label = ", ".join(f"{k}={r['overrides'][k]}" for k in label_keys) or "-"
+        groups.setdefault((r["difficulty"], label), []).append(r)
+
+    header = f"{'difficulty':<10} {'overrides':<40} {'runs':>4} {'died':>4} {'wave':>6} {'kills':>7} " \
+             f"{'dmg taken':>9} {'alive s':>8} {'tick ms':>8} {'p95 ms':>7}"
+    lines = [header, "-" * len(header)]
+    for (difficulty_key, label), runs in groups.items():
+        n = len(runs)
+        mean = lambda field: sum(r[field] for r in runs) / n
+        lines.append(
+            f"{difficulty_key:<10} {label[:40]:<40} {n:>4} {sum(r['died'] for r in runs):>4} "
+            f"{mean('wave'):>6.2f} {mean('kills'):>7.1f} {mean('damage_taken'):>9.1f} "
+            f"{mean('survived_s'):>8.1f} {mean('tick_ms_mean'):>8.3f} {mean('tick_ms_p95'):>7.3f}"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless bot games in parallel for balancing.")
+    parser.add_argument("--seeds", type=int, default=8, help="runs per difficulty and override set")
+    parser.add_argument("--base-seed", type=int, default=0)
+    parser.add_argument("--difficulties", default=",".join(DIFFICULTIES),
+                        help="comma-separated difficulty keys")
+    parser.add_argument("--minutes", type=float, default=10.0, help="simulated time limit per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="fixed settings override, e.g. WEAPONS.rifle.damage=40")
+    parser.add_argument("--sweep", action="append", default=[], metavar="KEY=V1,V2,...",
+                        help="settings override to sweep over")
+    args = parser.parse_args(argv)
+
+    fixed = {}
+    for item in args.set:
+        key, value = item.split("=", 1)
+        fixed[key] = _parse_value(value)
+    sweeps = {}
+    for item in args.sweep:
+        key, values = item.split("=", 1)
+        sweeps[key] = [_parse_value(v) for v in values.split(",")]
+
+    for key in list(fixed) + list(sweeps):
+        try:
+            check_overridable(key)
+        except ValueError as e:
+            parser.error(str(e))
+
+    difficulties = [d.strip() for d in args.difficulties.split(",") if d.strip()]
+    max_ticks = int(args.minutes * 60 * FPS)
+    jobs = build_jobs(args.seeds, difficulties, fixed, sweeps, max_ticks, args.base_seed)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(run_once, jobs))
+    elapsed = time.perf_counter() - start
+
+    if fixed:
+        print("fixed: " + ", ".join(f"{k}={v}" for k, v in fixed.items()))
+    for line in summarize(results, list(sweeps)):
+        print(line)
+    print(f"\n{len(results)} runs in {elapsed:.1f}s on {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
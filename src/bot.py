@@ -0,0 +1,88 @@
+"""
+Scripted bot player - drives the game through Controls for headless balancing runs.
+"""
+import math
+import random
+from settings import *
+from controls import Controls
+
+
+class KitingBot:
+    """Shoots the nearest zombie and backs away (strafing) when the horde gets close."""
+
+    def __init__(self, seed=None, keep_away=250, fire_range=700):
+        self.rng = random.Random(seed)
+        self.keep_away = keep_away
+        self.fire_range = fire_range
+        self.strafe_side = self.rng.choice((-1, 1))
+        self.strafe_timer = 0
+
+    def get_controls(self, game):
+        """Decide this tick's Controls for game.player."""
+        player = game.player
+        px, py = player.pos.x, player.pos.y
+
+        nearest, nearest_dist_sq = None, math.inf
+        c = game.zombies.store.columns
+        xs, ys = c["x"], c["y"]
+        for i in range(len(game.zombies)):
+            d = (xs[i] - px) ** 2 + (ys[i] - py) ** 2
+            if d < nearest_dist_sq:
+                nearest, nearest_dist_sq = (xs[i], ys[i]), d
+
+        if nearest is None:
+            # Nothing to shoot: top up the magazine and drift back toward the middle
+            to_x = WORLD_WIDTH / 2 - px
+            to_y = WORLD_HEIGHT / 2 - py
+            return Controls(
+                self._axis(to_x / 300), self._axis(to_y / 300),
+                px + 100, py, fire=False, reload=True,
+            )
+
+        dist = math.sqrt(nearest_dist_sq)
+        away_x = (px - nearest[0]) / max(dist, 1e-6)
+        away_y = (py - nearest[1]) / max(dist, 1e-6)
+
+        # Switch strafe direction now and then so the bot doesn't pin itself to a wall
+        self.strafe_timer += 1
+        if self.strafe_timer > 90:
+            self.strafe_timer = 0
+            self.strafe_side = self.rng.choice((-1, 1))
+
+        move_x = move_y = 0.0
+        if dist < self.keep_away:
+            move_x = away_x - away_y * self.strafe_side * 0.7
+            move_y = away_y + away_x * self.strafe_side * 0.7
+
+        # Steer off the world edge
+        edge = 150
+        if px < edge:
+            move_x = 1
+        elif px > WORLD_WIDTH - edge:
+            move_x = -1
+        if py < edge:
+            move_y = 1
+        elif py > WORLD_HEIGHT - edge:
+            move_y = -1
+
+        if dist < 200:
+            weapon = "shotgun"
+        elif dist > 450:
+            weapon = "rifle"
+        else:
+            weapon = "pistol"
+
+        return Controls(
+            self._axis(move_x), self._axis(move_y),
+            nearest[0], nearest[1],
+            fire=dist < self.fire_range, weapon=weapon,
+        )
+
+    @staticmethod
+    def _axis(value):
+        """Turn a continuous direction component into -1, 0 or 1."""
+        if value > 0.38:
+            return 1
+        if value < -0.38:
+            return -1
+        return 0
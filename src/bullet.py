@@ -1,46 +1,96 @@
 """
-Bullet entity - projectile fired by the player.
+Bullets - projectiles fired by the player, stored as component arrays in an EntityStore.
 """
-import pygame
 import math
+import game_clock
 from settings import *
+from ecs import EntityStore
 
 
-class Bullet(pygame.sprite.Sprite):
-    """A bullet that travels in a straight line."""
+WEAPON_NAMES = list(WEAPONS)
+BULLET_LIFETIME = 2000  # ms before auto-destroy
 
-    def __init__(self, x, y, angle_deg, weapon_name, asset_surface):
-        super().__init__()
-        self.image = asset_surface
-        self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.math.Vector2(x, y)
 
+class BulletStore:
+    """All live bullets. Movement, lifetime and rendering run over the component arrays."""
+
+    FIELDS = {
+        "x": "d", "y": "d",
+        "prev_x": "d", "prev_y": "d",  # start of this tick's travel segment
+        "vx": "d", "vy": "d",
+        "damage": "f",
+        "spawn_time": "q",
+        "weapon": "B",                 # index into WEAPON_NAMES; picks sprite and radius
+    }
+
+    def __init__(self, assets):
+        self.store = EntityStore(self.FIELDS, capacity=128)
+        self.images = [assets.get(f"bullet_{name}") for name in WEAPON_NAMES]
+        self.radii = [image.get_width() / 2 for image in self.images]
+        self.half_sizes = [(image.get_width() // 2, image.get_height() // 2) for image in self.images]
+
+    def __len__(self):
+        return self.store.count
+
+    def spawn(self, x, y, angle_deg, weapon_name, spawn_time=None):
+        """Fire a bullet from (x, y) in the given direction. Returns its handle."""
         weapon = WEAPONS[weapon_name]
-        self.speed = weapon["bullet_speed"]
-        self.damage = weapon["damage"]
+        speed = weapon["bullet_speed"]
 
         # Convert angle to radians and get velocity
         angle_rad = math.radians(angle_deg)
-        self.velocity = pygame.math.Vector2(
-            math.cos(angle_rad) * self.speed,
-            -math.sin(angle_rad) * self.speed,
+        return self.store.create(
+            x=x, y=y, prev_x=x, prev_y=y,
+            vx=math.cos(angle_rad) * speed,
+            vy=-math.sin(angle_rad) * speed,
+            damage=weapon["damage"],
+            spawn_time=game_clock.get_ticks() if spawn_time is None else spawn_time,
+            weapon=WEAPON_NAMES.index(weapon_name),
         )
 
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime = 2000  # ms before auto-destroy
+    def destroy(self, handle):
+        self.store.destroy(handle)
+
+    def clear(self):
+        self.store.clear()
 
     def update(self):
-        """Move bullet and check lifetime."""
-        self.pos += self.velocity
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
-
-        # Remove if out of world or too old
-        now = pygame.time.get_ticks()
-        if (
-            self.pos.x < -50
-            or self.pos.x > WORLD_WIDTH + 50
-            or self.pos.y < -50
-            or self.pos.y > WORLD_HEIGHT + 50
-            or now - self.spawn_time > self.lifetime
-        ):
-            self.kill()
+        """Movement system: advance every bullet, then drop old or out-of-world ones."""
+        store = self.store
+        c = store.columns
+        xs, ys, pxs, pys, vxs, vys = c["x"], c["y"], c["prev_x"], c["prev_y"], c["vx"], c["vy"]
+        spawn_times = c["spawn_time"]
+        now = game_clock.get_ticks()
+
+        expired = []
+        for i in range(store.count):
+            x, y = xs[i], ys[i]
+            pxs[i] = x
+            pys[i] = y
+            x += vxs[i]
+            y += vys[i]
+            xs[i] = x
+            ys[i] = y
+
+            # Remove if out of world or too old
+            out_of_world = not WORLD_STREAMING and (
+                x < -50 or x > WORLD_WIDTH + 50 or y < -50 or y > WORLD_HEIGHT + 50
+            )
+            if out_of_world or now - spawn_times[i] > BULLET_LIFETIME:
+                expired.append(store.handle_at(i))
+
+        for handle in expired:
+            store.destroy(handle)
+
+    def get_blits(self, cam_x, cam_y):
+        """Render system: (surface, position) pairs for every bullet."""
+        store = self.store
+        c = store.columns
+        xs, ys, weapons = c["x"], c["y"], c["weapon"]
+        images, half_sizes = self.images, self.half_sizes
+        blits = []
+        for i in range(store.count):
+            w = weapons[i]
+            half_w, half_h = half_sizes[w]
+            blits.append((images[w], (int(xs[i]) - half_w - cam_x, int(ys[i]) - half_h - cam_y)))
+        return blits
@@ -2,7 +2,7 @@
 Camera system that follows the player around the world.
 """
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, WORLD_STREAMING
 
 
 class Camera:
@@ -26,8 +26,9 @@ class Camera:
         target_y = self.target.rect.centery - SCREEN_HEIGHT // 2
 
         # Clamp to world bounds
-        target_x = max(0, min(target_x, WORLD_WIDTH - SCREEN_WIDTH))
-        target_y = max(0, min(target_y, WORLD_HEIGHT - SCREEN_HEIGHT))
+        if not WORLD_STREAMING:
+            target_x = max(0, min(target_x, WORLD_WIDTH - SCREEN_WIDTH))
+            target_y = max(0, min(target_y, WORLD_HEIGHT - SCREEN_HEIGHT))
 
         # Smooth follow with lerp
         self.offset.x += (target_x - self.offset.x) * 0.1
@@ -46,6 +47,15 @@ class Camera:
         """Apply camera offset to a position tuple."""
         return (pos[0] - int(self.offset.x), pos[1] - int(self.offset.y))
 
+    def get_view_rect(self, margin=0):
+        """Return the visible world area as a Rect, grown by margin on each side."""
+        return pygame.Rect(
+            int(self.offset.x) - margin,
+            int(self.offset.y) - margin,
+            SCREEN_WIDTH + margin * 2,
+            SCREEN_HEIGHT + margin * 2,
+        )
+
     def reverse(self, screen_pos):
         """Convert screen position to world position."""
         return (
@@ -0,0 +1,293 @@
+"""
+Network client for server mode - sends input to an authoritative server and renders
+its snapshots, interpolating entities NET_INTERP_DELAY ms behind the newest one so
+motion stays smooth between 30 Hz updates and across lost packets.
+
+Usage:
+    python src/client.py --host 127.0.0.1 --port 47800
+"""
+import os
+import sys
+import socket
+import argparse
+from collections import deque
+
+# Ensure we can import from src/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+from settings import *
+from assets_manager import AssetManager
+from camera import Camera
+from controls import Controls, read_local_controls
+from obstacle import Obstacle
+from bullet import WEAPON_NAMES
+from zombie import _get_health_bar_surface
+from ui import UI
+from render_frame import ground_blits
+from net_protocol import (
+    MSG_WELCOME, MSG_SNAPSHOT, NO_BASELINE, KIND_PLAYER, KIND_ZOMBIE, KIND_BULLET, ZOMBIE_KEYS,
+    ANGLE_STEPS, net_id, kind_of, dequantize, message_type, encode_hello, encode_bye,
+    encode_input, decode_welcome, decode_snapshot,
+)
+
+
+PLAYER_NET_ID = net_id(KIND_PLAYER, 0)
+
+
+class RemotePlayerHud:
+    """Player HUD values decoded from a snapshot, shaped like render_frame.PlayerHud."""
+
+    __slots__ = ("hp", "max_hp", "current_weapon", "ammo", "reloading", "score", "kills")
+
+    def __init__(self, hud):
+        _, hp, max_hp, weapon, ammo, reloading, score, kills, _ = hud
+        self.hp = hp
+        self.max_hp = max_hp
+        self.current_weapon = WEAPON_NAMES[weapon]
+        self.ammo = dict(zip(WEAPON_NAMES, ammo))
+        self.reloading = reloading
+        self.score = score
+        self.kills = kills
+
+
+class RemoteLevelHud:
+    """Wave HUD values decoded from a snapshot; announcements aren't replicated."""
+
+    between_waves = False
+    wave_complete = False
+
+    def __init__(self, wave):
+        self.wave = wave
+
+    def is_announcing(self):
+        return False
+
+    def get_wave_text(self):
+        return f"WAVE {self.wave}"
+
+
+class NetClient:
+    """Connects to a GameServer, streams input and renders interpolated snapshots."""
+
+    def __init__(self, host, port):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(f"{TITLE} - {host}:{port}")
+        self.clock = pygame.time.Clock()
+        self.assets = AssetManager()
+        self.ui = UI(self.screen)
+        self.ground_tile = self.assets.get("ground_tile")
+        self.crosshair = self.assets.get("crosshair")
+        pygame.mouse.set_visible(False)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.connect((host, port))
+        self.sock.setblocking(False)
+
+        self.running = True
+        self.welcomed = False
+        self.is_controller = False
+        self.last_hello = -NET_HELLO_INTERVAL
+        self.obstacles = pygame.sprite.Group()
+
+        self.baselines = {}          # tick -> decoded states, for decoding deltas
+        self.latest_tick = NO_BASELINE
+        self.latest_hud = None
+        self.buffer = deque(maxlen=32)   # (server ms, states) in tick order
+        self.clock_offset = None         # local ms - server ms, smallest seen
+
+        # The camera follows the interpolated local player through this rect
+        self.rect = pygame.Rect(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, 1, 1)
+        self.camera = Camera()
+        self.camera.follow(self)
+
+        self._rotated = {}
+
+    def run(self):
+        while self.running:
+            self.clock.tick(FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    self.running = False
+
+            now = pygame.time.get_ticks()
+            if not self.welcomed and now - self.last_hello >= NET_HELLO_INTERVAL:
+                self.last_hello = now
+                self._send(encode_hello())
+
+            self._receive()
+            states = self._interpolated_states(now)
+            player = states.get(PLAYER_NET_ID)
+            if player:
+                self.rect.center = (int(player[1]), int(player[2]))
+            self.camera.update()
+
+            if self.welcomed:
+                controls = read_local_controls(self.camera) if self.is_controller else Controls()
+                view_x = self.camera.offset.x + SCREEN_WIDTH / 2
+                view_y = self.camera.offset.y + SCREEN_HEIGHT / 2
+                self._send(encode_input(self.latest_tick, controls, view_x, view_y))
+
+            self._draw(states)
+
+        self._send(encode_bye())
+        pygame.quit()
+
+    # ─── Networking ────────────────────────────────────────
+    def _send(self, data):
+        try:
+            self.sock.send(data)
+        except OSError:
+            pass
+
+    def _receive(self):
+        while True:
+            try:
+                data = self.sock.recv(NET_MAX_PACKET)
+            except (BlockingIOError, ConnectionRefusedError):
+                return
+
+            kind = message_type(data)
+            if kind == MSG_WELCOME and not self.welcomed:
+                _, self.is_controller, obstacles = decode_welcome(data)
+                self.obstacles.empty()
+                for obs_type, x, y in obstacles:
+                    self.obstacles.add(Obstacle(x, y, obs_type, self.assets.get(obs_type)))
+                self.welcomed = True
+            elif kind == MSG_SNAPSHOT and self.welcomed:
+                self._on_snapshot(data)
+
+    def _on_snapshot(self, data):
+        decoded = decode_snapshot(data, self.baselines)
+        if decoded is None:
+            return
+        tick, hud, states = decoded
+        self.baselines[tick] = states
+        oldest = tick - NET_SNAPSHOT_HISTORY * NET_SNAPSHOT_INTERVAL
+        for old in [t for t in self.baselines if t <= oldest]:
+            del self.baselines[old]
+
+        if self.latest_tick != NO_BASELINE and tick <= self.latest_tick:
+            return  # arrived out of order; usable as a baseline but too old to show
+        self.latest_tick = tick
+        self.latest_hud = hud
+
+        server_ms = tick * 1000 / NET_TICK_RATE
+        offset = pygame.time.get_ticks() - server_ms
+        if self.clock_offset is None or offset < self.clock_offset:
+            self.clock_offset = offset
+        else:
+            # Drift slowly upward so one unusually fast packet doesn't pin the estimate
+            self.clock_offset += 0.05
+        self.buffer.append((server_ms, {nid: dequantize(state) for nid, state in states.items()}))
+
+    # ─── Interpolation ─────────────────────────────────────
+    def _interpolated_states(self, now):
+        """Entity states ({id: (sub, x, y, angle, health)}) at NET_INTERP_DELAY behind the server."""
+        buffer = self.buffer
+        if not buffer:
+            return {}
+        render_ms = now - self.clock_offset - NET_INTERP_DELAY
+        if render_ms <= buffer[0][0]:
+            return buffer[0][1]
+        if render_ms >= buffer[-1][0]:
+            return buffer[-1][1]
+
+        for i in range(len(buffer) - 1, 0, -1):
+            older_ms, older = buffer[i - 1]
+            if older_ms <= render_ms:
+                newer_ms, newer = buffer[i]
+                break
+        t = (render_ms - older_ms) / (newer_ms - older_ms)
+
+        states = {}
+        for nid, state in newer.items():
+            prev = older.get(nid)
+            if prev is None or prev[0] != state[0]:
+                states[nid] = state
+                continue
+            turn = (state[3] - prev[3] + 180) % 360 - 180
+            states[nid] = (
+                state[0],
+                prev[1] + (state[1] - prev[1]) * t,
+                prev[2] + (state[2] - prev[2]) * t,
+                prev[3] + turn * t,
+                state[4],
+            )
+        return states
+
+    # ─── Rendering ─────────────────────────────────────────
+    def _rotated_image(self, asset_key, angle):
+        """Rotated asset, cached per quantized angle."""
+        step = int(round(angle * ANGLE_STEPS / 360)) % ANGLE_STEPS
+        key = (asset_key, step)
+        image = self._rotated.get(key)
+        if image is None:
+            image = self._rotated[key] = pygame.transform.rotate(
+                self.assets.get(asset_key), step * 360 / ANGLE_STEPS,
+            )
+        return image
+
+    def _draw(self, states):
+        self.screen.fill(BG_COLOR)
+        cam_x = int(self.camera.offset.x)
+        cam_y = int(self.camera.offset.y)
+        self.screen.blits(ground_blits(self.ground_tile, cam_x, cam_y), doreturn=False)
+        if not WORLD_STREAMING:
+            pygame.draw.rect(self.screen, DARK_RED, pygame.Rect(-cam_x, -cam_y, WORLD_WIDTH, WORLD_HEIGHT), 4)
+
+        # Bullets first, then y-sorted obstacles, zombies and the player
+        bullets = []
+        sprites = [(obstacle.rect.bottom, obstacle.get_blits(self.camera)) for obstacle in self.obstacles]
+        for nid, (sub, x, y, angle, health) in states.items():
+            kind = kind_of(nid)
+            if kind == KIND_BULLET:
+                image = self.assets.get(f"bullet_{WEAPON_NAMES[sub]}")
+                bullets.append((image, (int(x) - image.get_width() // 2 - cam_x, int(y) - image.get_height() // 2 - cam_y)))
+                continue
+
+            asset_key = f"zombie_{ZOMBIE_KEYS[sub]}" if kind == KIND_ZOMBIE else "player"
+            image = self._rotated_image(asset_key, angle)
+            rect = image.get_rect(center=(int(x), int(y)))
+            blits = [(image, (rect.x - cam_x, rect.y - cam_y))]
+            if kind == KIND_ZOMBIE and health < 1:
+                bar_width = ZOMBIE_TYPES[ZOMBIE_KEYS[sub]]["size"]
+                color = HEALTH_GREEN if health > 0.5 else RED
+                bar = _get_health_bar_surface(bar_width, int(health * bar_width), color)
+                blits.append((bar, (rect.centerx - bar_width // 2 - cam_x, rect.top - 8 - cam_y)))
+            sprites.append((rect.bottom, blits))
+
+        sprites.sort(key=lambda s: s[0])
+        for _, blits in sprites:
+            bullets.extend(blits)
+        self.screen.blits(bullets, doreturn=False)
+
+        if self.latest_hud:
+            player_hud = RemotePlayerHud(self.latest_hud)
+            level_hud = RemoteLevelHud(self.latest_hud[-1])
+            if self.latest_hud[0]:
+                self.ui.draw_game_over(player_hud, level_hud)
+            else:
+                self.ui.draw_hud(player_hud, level_hud)
+        status = None if self.welcomed else "Connecting..."
+        if self.welcomed and not self.is_controller:
+            status = "SPECTATING"
+        if status:
+            text = self.ui.font_medium.render(status, True, YELLOW)
+            self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)))
+
+        self.screen.blit(self.crosshair, self.crosshair.get_rect(center=pygame.mouse.get_pos()))
+        pygame.display.flip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Connect to a ZOMBII server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    args = parser.parse_args()
+    NetClient(args.host, args.port).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Swept (continuous) collision for bullets - tests each bullet's travel segment for the tick
+against obstacle boxes and zombie circles, so fast rounds cannot tunnel through thin cover.
+"""
+import math
+from settings import *
+from spatial import SpatialGrid
+
+
+# Zombies are bucketed by center, so queries are widened by the largest hit radius
+_MAX_ZOMBIE_RADIUS = max(info["size"] for info in ZOMBIE_TYPES.values()) / 2
+
+
+def segment_vs_rect(x0, y0, dx, dy, rect, pad=0.0):
+    """
+    Slab test of the segment (x0, y0) -> (x0 + dx, y0 + dy) against rect grown by pad.
+    Returns the entry fraction t in [0, 1], or None if the segment misses.
+    """
+    t_min, t_max = 0.0, 1.0
+    for p, d, lo, hi in (
+        (x0, dx, rect.left - pad, rect.right + pad),
+        (y0, dy, rect.top - pad, rect.bottom + pad),
+    ):
+        if abs(d) < 1e-9:
+            if p < lo or p > hi:
+                return None
+            continue
+        t1 = (lo - p) / d
+        t2 = (hi - p) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_min = max(t_min, t1)
+        t_max = min(t_max, t2)
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+def segment_vs_circle(x0, y0, dx, dy, cx, cy, radius):
+    """
+    Test the segment (x0, y0) -> (x0 + dx, y0 + dy) against a circle.
+    Returns the entry fraction t in [0, 1], or None if the segment misses.
+    """
+    fx = x0 - cx
+    fy = y0 - cy
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0  # Starts inside
+
+    a = dx * dx + dy * dy
+    if a < 1e-9:
+        return None
+    b = 2 * (fx * dx + fy * dy)
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+
+    t = (-b - math.sqrt(disc)) / (2 * a)
+    return t if 0 <= t <= 1 else None
+
+
+class BulletSweeper:
+    """Resolves the earliest obstacle or zombie hit along each bullet's path for a tick."""
+
+    def __init__(self, obstacles):
+        # Obstacles never move, so their grid is built once per game
+        self.obstacle_grid = SpatialGrid(COLLISION_GRID_CELL_SIZE)
+        for obstacle in obstacles or ():
+            self.obstacle_grid.insert_rect(obstacle, obstacle.collision_rect)
+        self.zombie_grid = SpatialGrid(COLLISION_GRID_CELL_SIZE)
+        self.zombies = None
+
+    def rebuild_zombies(self, zombies):
+        """Re-bucket the ZombieStore's zombies (by handle) for this tick's queries."""
+        self.zombies = zombies
+        self.zombie_grid.clear()
+        store = zombies.store
+        xs, ys = store.columns["x"], store.columns["y"]
+        for i in range(store.count):
+            self.zombie_grid.insert(store.handle_at(i), xs[i], ys[i])
+
+    def first_hit(self, x0, y0, dx, dy, pad, ignore=()):
+        """
+        Find what a bullet of radius `pad` hit first while travelling from (x0, y0)
+        by (dx, dy), skipping zombie handles in `ignore`.
+        Returns (target, t) where t is the fraction along the segment, or (None, None);
+        a zombie target is its handle.
+        """
+        left, right = min(x0, x0 + dx) - pad, max(x0, x0 + dx) + pad
+        top, bottom = min(y0, y0 + dy) - pad, max(y0, y0 + dy) + pad
+
+        best, best_t = None, None
+
+        for obstacle in self.obstacle_grid.query_rect(left, top, right, bottom):
+            t = segment_vs_rect(x0, y0, dx, dy, obstacle.collision_rect, pad)
+            if t is not None and (best_t is None or t < best_t):
+                best, best_t = obstacle, t
+
+        reach = _MAX_ZOMBIE_RADIUS + pad
+        zombies = self.zombies
+        if zombies is None:
+            return best, best_t
+        store = zombies.store
+        c = store.columns
+        xs, ys, types = c["x"], c["y"], c["type"]
+        hit_radii = zombies.hit_radii
+        for handle in self.zombie_grid.query_rect(left - reach, top - reach, right + reach, bottom + reach):
+            i = store.index_of(handle)
+            if i < 0 or handle in ignore:
+                continue
+            t = segment_vs_circle(x0, y0, dx, dy, xs[i], ys[i], hit_radii[types[i]] + pad)
+            if t is not None and (best_t is None or t < best_t):
+                best, best_t = handle, t
+
+        return best, best_t
@@ -0,0 +1,111 @@
+"""
+Combat resolution - bullet hits are first gathered into compact per-tick event buffers,
+then damage, removals, scoring, wave accounting and effects are applied in bulk passes.
+"""
+from settings import *
+
+
+class CombatResolver:
+    """Per-tick hit/damage/kill buffers for bullets against obstacles and zombies."""
+
+    def __init__(self):
+        self.spent_bullets = []
+        self.obstacle_hits = []   # (x, y) impact points
+        self.hit_zombies = []     # handles of zombies hit this tick, in first-hit order
+        self.zombie_damage = []   # total damage per entry of hit_zombies
+        self._zombie_index = {}
+        self._doomed = set()      # zombies already dealt lethal damage this tick
+        self.killed = []          # (x, y) of zombies killed this tick
+
+    def clear(self):
+        """Reset the buffers for a new tick."""
+        self.spent_bullets.clear()
+        self.obstacle_hits.clear()
+        self.hit_zombies.clear()
+        self.zombie_damage.clear()
+        self._zombie_index.clear()
+        self._doomed.clear()
+        self.killed = []
+
+    def detect(self, bullets, sweeper):
+        """Collision phase: record what every bullet hit without applying anything."""
+        self.clear()
+        store = bullets.store
+        c = store.columns
+        xs, ys, pxs, pys = c["x"], c["y"], c["prev_x"], c["prev_y"]
+        damages, weapons = c["damage"], c["weapon"]
+        radii = bullets.radii
+        zombie_store = sweeper.zombies.store if sweeper.zombies is not None else None
+
+        for i in range(store.count):
+            x0, y0 = pxs[i], pys[i]
+            dx, dy = xs[i] - x0, ys[i] - y0
+            target, t = sweeper.first_hit(x0, y0, dx, dy, radii[weapons[i]], self._doomed)
+            if target is None:
+                continue
+            self.spent_bullets.append(store.handle_at(i))
+
+            if hasattr(target, 'obstacle_type'):
+                self.obstacle_hits.append((x0 + dx * t, y0 + dy * t))
+                continue
+
+            idx = self._zombie_index.get(target)
+            if idx is None:
+                idx = self._zombie_index[target] = len(self.hit_zombies)
+                self.hit_zombies.append(target)
+                self.zombie_damage.append(0.0)
+            self.zombie_damage[idx] += damages[i]
+            # Later bullets pass through a zombie that is already dead this tick
+            if self.zombie_damage[idx] >= zombie_store.columns["hp"][zombie_store.index_of(target)]:
+                self._doomed.add(target)
+
+    def apply(self, player, zombies, bullets, level_manager, particles, decals=None):
+        """
+        Apply buffered events to the ZombieStore in bulk. Returns the (x, y) positions
+        of zombies killed this tick. Kills and obstacle impacts also leave marks on
+        `decals` if given.
+        """
+        # Damage
+        store = zombies.store
+        c = store.columns
+        xs, ys, hps, types = c["x"], c["y"], c["hp"], c["type"]
+        killed = self.killed
+        dead_handles = []
+        hit_positions = []
+        score = 0
+        for handle, damage in zip(self.hit_zombies, self.zombie_damage):
+            i = store.index_of(handle)
+            hit_positions.append((xs[i], ys[i]))
+            hps[i] -= damage
+            if hps[i] <= 0:
+                killed.append((xs[i], ys[i]))
+                dead_handles.append(handle)
+                score += zombies.scores[types[i]]
+
+        # Removals
+        for handle in self.spent_bullets:
+            bullets.destroy(handle)
+        for handle in dead_handles:
+            zombies.destroy(handle)
+
+        # Scoring and wave accounting
+        if killed:
+            player.score += score
+            player.kills += len(killed)
+            level_manager.on_zombie_killed(len(zombies), len(killed))
+
+        # Effects, coalesced to one burst per zombie per tick
+        for x, y in hit_positions:
+            particles.emit(x, y, BLOOD_RED, 6)
+        for x, y in killed:
+            particles.emit(x, y, DARK_RED, 12)
+        for x, y in self.obstacle_hits:
+            particles.emit(x, y, (150, 150, 150), 5)
+
+        if decals:
+            for x, y in killed:
+                decals.stamp("blood", x, y)
+            for x, y in self.obstacle_hits:
+                decals.stamp("scuff", x, y)
+
+        return killed
@@ -0,0 +1,47 @@
+"""
+Player controls - one tick of player intent, sampled from the keyboard and mouse
+or supplied by a bot / remote client.
+"""
+import pygame
+
+
+class Controls:
+    """Movement direction, aim point (world coords) and actions for one tick."""
+
+    __slots__ = ("move_x", "move_y", "aim_x", "aim_y", "fire", "reload", "weapon")
+
+    def __init__(self, move_x=0, move_y=0, aim_x=0.0, aim_y=0.0, fire=False, reload=False, weapon=None):
+        self.move_x = move_x    # -1, 0 or 1
+        self.move_y = move_y    # -1, 0 or 1
+        self.aim_x = aim_x
+        self.aim_y = aim_y
+        self.fire = fire
+        self.reload = reload
+        self.weapon = weapon    # weapon to switch to, or None
+
+
+def read_local_controls(camera):
+    """Sample the keyboard and mouse for the local player."""
+    keys = pygame.key.get_pressed()
+    move_x, move_y = 0, 0
+    if keys[pygame.K_w] or keys[pygame.K_UP]:
+        move_y = -1
+    if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        move_y = 1
+    if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        move_x = -1
+    if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        move_x = 1
+
+    weapon = None
+    if keys[pygame.K_1]:
+        weapon = "pistol"
+    elif keys[pygame.K_2]:
+        weapon = "shotgun"
+    elif keys[pygame.K_3]:
+        weapon = "rifle"
+
+    # Aim toward mouse (world position)
+    aim_x, aim_y = camera.reverse(pygame.mouse.get_pos())
+    fire = pygame.mouse.get_pressed()[0]
+    return Controls(move_x, move_y, aim_x, aim_y, fire, False, weapon)
@@ -0,0 +1,100 @@
+"""
+Persistent decals - blood on kills and scuffs on obstacle hits are stamped once into
+cached world-space tile surfaces, so a long fight's history costs one blit per visible
+tile. Tiles are created on first stamp and the least recently used are evicted past
+DECAL_MAX_TILES.
+
+Stamps may be queued from the simulation thread; they are applied and drawn on the
+render thread only.
+"""
+import math
+import random
+from collections import OrderedDict, deque
+import pygame
+from settings import *
+
+
+def _make_blood_stamp(rng):
+    size = 44
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = size // 2
+    for _ in range(rng.randint(5, 9)):
+        angle = rng.uniform(0, math.pi * 2)
+        dist = rng.uniform(0, size * 0.3)
+        radius = rng.randint(3, 9)
+        color = (*rng.choice((BLOOD_RED, DARK_RED)), rng.randint(120, 190))
+        pygame.draw.circle(
+            stamp, color,
+            (int(center + math.cos(angle) * dist), int(center + math.sin(angle) * dist)), radius,
+        )
+    return stamp
+
+
+def _make_scuff_stamp(rng):
+    size = 10
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(stamp, (20, 20, 20, rng.randint(90, 140)), (size // 2, size // 2), rng.randint(2, 4))
+    return stamp
+
+
+class DecalLayer:
+    """World-space tiles of permanent marks, drawn between the ground and entities."""
+
+    def __init__(self, tile_size=None, max_tiles=None, seed=None):
+        self.tile_size = tile_size if tile_size is not None else DECAL_TILE_SIZE
+        self.max_tiles = max_tiles if max_tiles is not None else DECAL_MAX_TILES
+        self.tiles = OrderedDict()   # (col, row) -> surface, least recently used first
+        self.pending = deque()       # (stamp, x, y) waiting for apply_pending
+        self.rng = random.Random(seed)
+        self.stamps = {
+            "blood": [_make_blood_stamp(self.rng) for _ in range(DECAL_VARIANTS)],
+            "scuff": [_make_scuff_stamp(self.rng) for _ in range(DECAL_VARIANTS)],
+        }
+
+    def stamp(self, kind, x, y):
+        """Queue a decal of `kind` ("blood" or "scuff") centred on world (x, y)."""
+        self.pending.append((self.rng.choice(self.stamps[kind]), x, y))
+
+    def clear(self):
+        self.tiles.clear()
+        self.pending.clear()
+
+    def apply_pending(self):
+        """Stamp queued decals into their tiles. Returns the tile surfaces that changed."""
+        changed = set()
+        size = self.tile_size
+        while self.pending:
+            stamp, x, y = self.pending.popleft()
+            w, h = stamp.get_size()
+            left, top = int(x) - w // 2, int(y) - h // 2
+            # A stamp on a tile edge goes into every tile it overlaps
+            for row in range(top // size, (top + h - 1) // size + 1):
+                for col in range(left // size, (left + w - 1) // size + 1):
+                    tile = self._get_tile(col, row)
+                    tile.blit(stamp, (left - col * size, top - row * size))
+                    changed.add(tile)
+        return changed
+
+    def _get_tile(self, col, row):
+        key = (col, row)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.tiles[key] = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+            while len(self.tiles) > self.max_tiles:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(key)
+        return tile
+
+    def get_blits(self, cam_x, cam_y):
+        """(surface, position) pairs for the tiles overlapping the view."""
+        size = self.tile_size
+        blits = []
+        for row in range(cam_y // size, (cam_y + SCREEN_HEIGHT) // size + 1):
+            for col in range(cam_x // size, (cam_x + SCREEN_WIDTH) // size + 1):
+                key = (col, row)
+                tile = self.tiles.get(key)
+                if tile is not None:
+                    self.tiles.move_to_end(key)
+                    blits.append((tile, (col * size - cam_x, row * size - cam_y)))
+        return blits
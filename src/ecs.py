@@ -0,0 +1,102 @@
+"""
+Entity-component storage - typed component arrays with generational entity handles.
+Live entities are kept densely packed (swap-remove on destroy), so systems iterate
+contiguous arrays instead of walking sprite groups and per-object attribute dicts.
+"""
+from array import array
+
+
+INDEX_BITS = 24
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityStore:
+    """
+    Sparse-set store of entities whose components are array columns.
+    `fields` maps component name -> array typecode ('d', 'f', 'i', 'q', 'B', ...).
+    Component values for the entity at dense index i live at columns[name][i].
+    """
+
+    def __init__(self, fields, capacity=64):
+        self.fields = dict(fields)
+        self.columns = {name: array(code, bytes(array(code).itemsize * capacity))
+                        for name, code in self.fields.items()}
+        self.capacity = capacity
+        self.count = 0
+
+        # Handle bookkeeping: id -> dense index, dense index -> id, id -> generation
+        self.dense_of = array("i", [-1] * capacity)
+        self.ids = array("i", [0] * capacity)
+        self.generations = array("I", [0] * capacity)
+        self._free_ids = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Double capacity of every column and the handle tables."""
+        extra = self.capacity
+        for name, column in self.columns.items():
+            column.extend(array(column.typecode, bytes(column.itemsize * extra)))
+        self.dense_of.extend([-1] * extra)
+        self.ids.extend([0] * extra)
+        self.generations.extend([0] * extra)
+        self._free_ids.extend(range(self.capacity + extra - 1, self.capacity - 1, -1))
+        self.capacity += extra
+
+    def create(self, **values):
+        """Add an entity with the given component values and return its handle."""
+        if not self._free_ids:
+            self._grow()
+        entity_id = self._free_ids.pop()
+        i = self.count
+        self.count += 1
+        self.dense_of[entity_id] = i
+        self.ids[i] = entity_id
+
+        columns = self.columns
+        for name, value in values.items():
+            columns[name][i] = value
+        return entity_id | (self.generations[entity_id] << INDEX_BITS)
+
+    def index_of(self, handle):
+        """Dense index of a live entity, or -1 if the handle is stale."""
+        entity_id = handle & INDEX_MASK
+        if entity_id >= self.capacity or self.generations[entity_id] != handle >> INDEX_BITS:
+            return -1
+        return self.dense_of[entity_id]
+
+    def handle_at(self, i):
+        """Handle of the entity at dense index i."""
+        entity_id = self.ids[i]
+        return entity_id | (self.generations[entity_id] << INDEX_BITS)
+
+    def is_alive(self, handle):
+        return self.index_of(handle) >= 0
+
+    def destroy(self, handle):
+        """Remove an entity; its handle (and any copies) become stale. Returns False if already gone."""
+        i = self.index_of(handle)
+        if i < 0:
+            return False
+        entity_id = handle & INDEX_MASK
+        last = self.count - 1
+
+        # Move the last entity into the hole to keep the arrays dense
+        if i != last:
+            for column in self.columns.values():
+                column[i] = column[last]
+            moved_id = self.ids[last]
+            self.ids[i] = moved_id
+            self.dense_of[moved_id] = i
+
+        self.count = last
+        self.dense_of[entity_id] = -1
+        self.generations[entity_id] = (self.generations[entity_id] + 1) & 0xFF
+        self._free_ids.append(entity_id)
+        return True
+
+    def clear(self):
+        """Destroy every entity."""
+        for i in range(self.count - 1, -1, -1):
+            self.destroy(self.handle_at(i))
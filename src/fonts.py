@@ -0,0 +1,113 @@
+"""
+Font provider - resolves UI font families to files once and caches the result, so
+later launches open the files directly instead of scanning system fonts (SysFont).
+Families that aren't installed use pygame's bundled default font. That result is
+cached too, stamped with the font directories' modification times, so a family
+installed later is found once the directories change.
+"""
+import os
+import sys
+import json
+import pygame
+from settings import *
+
+
+def load_fonts(specs, cache_path=None):
+    """Load {key: (family, size, bold)} into {key: Font}, resolving through the cache."""
+    if cache_path is None:
+        cache_path = FONT_CACHE_FILE
+    cache = _read_cache(cache_path)
+    changed = False
+    stamp = None
+    fonts = {}
+    for key, (family, size, bold) in specs.items():
+        cache_key = f"{family.lower()}:{int(bold)}"
+        entry = cache.get(cache_key)
+        if entry is not None and not entry["path"]:
+            # Not installed when resolved: still valid until the font directories change
+            if stamp is None:
+                stamp = font_dirs_stamp()
+            if entry.get("stamp") != stamp:
+                entry = None
+        if entry is None or (entry["path"] and not os.path.exists(entry["path"])):
+            entry = resolve_font(family, bold)
+            if not entry["path"]:
+                if stamp is None:
+                    stamp = font_dirs_stamp()
+                entry["stamp"] = stamp
+            cache[cache_key] = entry
+            changed = True
+        fonts[key] = _open_font(entry, size, bold)
+    if changed:
+        _write_cache(cache_path, cache)
+    return fonts
+
+
+def resolve_font(family, bold=False):
+    """
+    Find the file for a font family (this is the slow system font scan).
+    `path` is None when the family isn't installed; `fake_bold` is set when there
+    is no bold face and pygame has to embolden the regular one, as SysFont does.
+    """
+    path = pygame.font.match_font(family, bold=bold)
+    fake_bold = bold and (path is None or path == pygame.font.match_font(family))
+    return {"path": path, "fake_bold": fake_bold}
+
+
+def font_dirs_stamp():
+    """
+    Latest modification time of the system and user font directories and their
+    immediate subdirectories (font packages usually install into a subdirectory).
+    """
+    if sys.platform == "win32":
+        dirs = [os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts")]
+    elif sys.platform == "darwin":
+        dirs = ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+    else:
+        dirs = ["/usr/share/fonts", "/usr/local/share/fonts",
+                os.path.expanduser("~/.fonts"), os.path.expanduser("~/.local/share/fonts")]
+    stamp = 0.0
+    for path in dirs:
+        try:
+            stamp = max(stamp, os.stat(path).st_mtime)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        stamp = max(stamp, entry.stat().st_mtime)
+        except OSError:
+            continue
+    return stamp
+
+
+def _open_font(entry, size, bold):
+    font = None
+    if entry["path"]:
+        try:
+            font = pygame.font.Font(entry["path"], size)
+        except (OSError, pygame.error):
+            font = None
+    if font is None:
+        font = pygame.font.Font(None, size)
+        font.set_bold(bold)
+    elif entry["fake_bold"]:
+        font.set_bold(True)
+    return font
+
+
+def _read_cache(path):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path, cache):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(cache, f, indent=1)
+    except OSError:
+        pass  # Resolved again next launch
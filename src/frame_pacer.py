@@ -0,0 +1,150 @@
+"""
+Frame pacing - selectable strategies for capping the frame rate, plus frame-interval
+jitter statistics so strategies can be compared objectively on each machine.
+
+Strategies:
+    sleep     clock.tick(FPS), cheap but only as precise as the OS sleep (the default)
+    hybrid    sleeps to just before an exact perf_counter deadline, then spins; unlike
+              clock.tick_busy_loop it isn't limited to whole-millisecond frame times, but
+              the spin keeps a core busy for FRAME_PACING_SPIN every frame
+    vsync     display flip waits for the monitor refresh (falls back to hybrid)
+    uncapped  no cap, for measuring raw throughput
+
+The blocking loop calls wait(); the asyncio loop awaits wait_async(), which keeps to
+the same deadline schedule but sleeps on the event loop so side tasks can run.
+"""
+import time
+import asyncio
+from collections import deque
+from settings import *
+
+
+PACING_STRATEGIES = ("sleep", "hybrid", "vsync", "uncapped")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+class FramePacer:
+    """Waits out each frame by the chosen strategy and records frame intervals."""
+
+    def __init__(self, clock, strategy=None, fps=None, window=None):
+        strategy = strategy if strategy is not None else FRAME_PACING
+        if strategy not in PACING_STRATEGIES:
+            raise ValueError(f"Unknown frame pacing strategy {strategy!r}; pick one of {PACING_STRATEGIES}")
+        self.clock = clock
+        self.strategy = strategy
+        self.fps = fps if fps is not None else FPS
+        self.intervals = deque(maxlen=window if window is not None else FRAME_PACING_WINDOW)
+        self._last = None
+        self._deadline = None
+        self.overruns = 0           # frames whose work ran past the next deadline
+        self.late_wakeups = 0       # wakeups more than 1 ms after the deadline
+        self.max_lateness_ms = 0.0
+
+    def vsync_failed(self):
+        """Call if the display couldn't enable vsync; pacing falls back to hybrid."""
+        if self.strategy == "vsync":
+            self.strategy = "hybrid"
+
+    def wait(self):
+        """Wait for the next frame and record the interval since the previous one."""
+        if self.strategy == "sleep":
+            self.clock.tick(self.fps)
+            self._record(None)
+            return
+        deadline = self.next_deadline() if self.strategy == "hybrid" else None
+        if deadline is not None:
+            remaining = deadline - time.perf_counter()
+            if remaining > FRAME_PACING_SPIN:
+                time.sleep(remaining - FRAME_PACING_SPIN)
+            _spin_until(deadline)
+        # vsync paces inside display.flip(); uncapped doesn't wait at all
+        self.clock.tick()
+        self._record(deadline)
+
+    async def wait_async(self):
+        """
+        wait() for the asyncio loop: sleeps on the event loop until the deadline, so
+        other tasks run in the gap. Yields once even when there's no time to wait.
+        """
+        deadline = self.next_deadline() if self.strategy in ("sleep", "hybrid") else None
+        if deadline is None:
+            await asyncio.sleep(0)
+        else:
+            # sleep trusts the event loop's timer; hybrid spins the last stretch
+            spin = FRAME_PACING_SPIN if self.strategy == "hybrid" else 0
+            remaining = deadline - time.perf_counter()
+            if remaining > spin:
+                await asyncio.sleep(remaining - spin)
+            _spin_until(deadline)
+        self.clock.tick()
+        self._record(deadline)
+
+    def next_deadline(self):
+        """
+        Advance the schedule by one frame and return its perf_counter deadline, or None
+        if the frame is due now (the first frame, or the previous one overran).
+        """
+        now = time.perf_counter()
+        if self._deadline is None:
+            self._deadline = now
+            return None
+        self._deadline += 1.0 / self.fps
+        if now > self._deadline:
+            # Fell more than a frame behind: restart the schedule rather than catch up
+            self.overruns += 1
+            self._deadline = now
+            return None
+        return self._deadline
+
+    def _record(self, deadline):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.intervals.append((now - self._last) * 1000)
+        self._last = now
+        if deadline is not None:
+            lateness_ms = (now - deadline) * 1000
+            if lateness_ms > 1.0:
+                self.late_wakeups += 1
+            self.max_lateness_ms = max(self.max_lateness_ms, lateness_ms)
+
+    def stats(self):
+        """Frame-interval statistics (ms) over the recent window, or None before two frames."""
+        if not self.intervals:
+            return None
+        values = sorted(self.intervals)
+        target = 1000 / self.fps
+        mean = sum(values) / len(values)
+        return {
+            "strategy": self.strategy,
+            "frames": len(values),
+            "mean": mean,
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99),
+            "max": values[-1],
+            # Mean absolute deviation from the target interval
+            "jitter": sum(abs(v - target) for v in values) / len(values),
+            "overruns": self.overruns,
+            "late_wakeups": self.late_wakeups,
+            "max_lateness": self.max_lateness_ms,
+        }
+
+    def summary(self):
+        """One-line report of stats()."""
+        s = self.stats()
+        if s is None:
+            return f"pacing {self.strategy}: no frames yet"
+        return (
+            f"pacing {s['strategy']}: p50 {s['p50']:.2f}  p95 {s['p95']:.2f}  p99 {s['p99']:.2f}  "
+            f"max {s['max']:.2f}  jitter {s['jitter']:.2f} ms  overruns {s['overruns']}"
+        )
+
+
+def _spin_until(deadline):
+    while time.perf_counter() < deadline:
+        pass
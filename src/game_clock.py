@@ -0,0 +1,34 @@
+"""
+Game clock - the single time source for simulation timers (cooldowns, waves, lifetimes).
+Reads pygame's real-time ticks by default; headless runs switch to simulated time
+so they can run faster than real time.
+"""
+import pygame
+
+
+_sim_time = None
+
+
+def get_ticks():
+    """Milliseconds of game time, like pygame.time.get_ticks()."""
+    if _sim_time is None:
+        return pygame.time.get_ticks()
+    return int(_sim_time)
+
+
+def use_simulated_time(start=0):
+    """Freeze time at `start` ms; it then only moves through advance()."""
+    global _sim_time
+    _sim_time = start
+
+
+def use_real_time():
+    """Go back to pygame's real-time ticks."""
+    global _sim_time
+    _sim_time = None
+
+
+def advance(ms):
+    """Move simulated time forward by ms."""
+    global _sim_time
+    _sim_time += ms
@@ -0,0 +1,89 @@
+"""
+GC scheduling tied to the wave cycle - long-lived objects are frozen out of the
+collector, automatic collection is held back during waves, and full collections run
+in the between-wave break and in menus where a pause can't cause a hitch.
+"""
+import gc
+import time
+from settings import *
+
+
+PHASE_MENU = "menu"
+PHASE_WAVE = "wave"
+PHASE_BREAK = "break"
+
+
+class GCPolicy:
+    """Switches GC behaviour by game phase and records every collection's pause."""
+
+    def __init__(self):
+        self.default_thresholds = gc.get_threshold()
+        self.phase = None
+        self.collect_pending = False
+        # phase -> [collections, total ms, max ms]
+        self.pauses = {PHASE_MENU: [0, 0.0, 0.0], PHASE_WAVE: [0, 0.0, 0.0], PHASE_BREAK: [0, 0.0, 0.0]}
+        self._gc_start = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        pause_ms = (time.perf_counter() - self._gc_start) * 1000
+        entry = self.pauses[self.phase or PHASE_MENU]
+        entry[0] += 1
+        entry[1] += pause_ms
+        entry[2] = max(entry[2], pause_ms)
+
+    def refreeze(self):
+        """
+        Collect and move every surviving object into the permanent generation.
+        Call after loading assets and after building a world; unfreezing first lets
+        the previous run's frozen objects be reclaimed.
+        """
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+
+    @staticmethod
+    def _phase_of(game):
+        if game.state != STATE_PLAYING or game.level_manager is None:
+            return PHASE_MENU
+        if game.level_manager.between_waves:
+            return PHASE_BREAK
+        return PHASE_WAVE
+
+    def update(self, game):
+        """Call once per frame; applies the phase's GC settings and runs deferred collections."""
+        phase = self._phase_of(game)
+        if phase != self.phase:
+            self.phase = phase
+            if phase == PHASE_WAVE:
+                if GC_WAVE_THRESHOLDS:
+                    gc.set_threshold(*GC_WAVE_THRESHOLDS)
+                else:
+                    gc.disable()
+            else:
+                gc.set_threshold(*self.default_thresholds)
+                gc.enable()
+                self.collect_pending = True
+        elif phase == PHASE_WAVE and not gc.isenabled() and gc.get_count()[0] > GC_WAVE_GEN0_LIMIT:
+            # Safety valve while collection is disabled: a young-generation pass is cheap
+            gc.collect(0)
+
+        if self.collect_pending:
+            self.collect_pending = False
+            gc.collect()
+
+    def summary(self):
+        """Collections and pause times (ms) per phase."""
+        return {
+            phase: {"collections": n, "total_ms": round(total, 3), "max_ms": round(worst, 3)}
+            for phase, (n, total, worst) in self.pauses.items()
+        }
+
+    def close(self):
+        """Restore default GC behaviour."""
+        gc.callbacks.remove(self._on_gc)
+        gc.set_threshold(*self.default_thresholds)
+        gc.enable()
@@ -1,8 +1,10 @@
 """
 Wave / level management system.
 """
-import pygame
+import game_clock
+from collections import deque
 from settings import *
+from spawning import build_spawn_timeline
 
 
 class LevelManager:
@@ -18,9 +20,12 @@ class LevelManager:
         self.wave_complete = False
         self.wave_announce_time = 0
         self.announce_duration = 2000  # ms to show wave announcement
-        self.last_spawn_time = 0
+        self.spawn_timeline = []
+        self.spawn_timeline_index = 0
+        self.spawn_start_time = 0
+        self.pending_groups = deque()
         self.between_waves = True
-        self.between_wave_start = pygame.time.get_ticks()
+        self.between_wave_start = game_clock.get_ticks()
         self.between_wave_duration = 3000  # 3s break
 
         # Start first wave
@@ -37,50 +42,69 @@ class LevelManager:
         self.zombies_killed = 0
         self.wave_active = True
         self.wave_complete = False
-        self.wave_announce_time = pygame.time.get_ticks()
+        self.wave_announce_time = game_clock.get_ticks()
         self.between_waves = False
-
-    def should_spawn(self, current_zombie_count):
-        """Check if it's time to spawn a new zombie."""
+        self.schedule_spawns(self.zombies_to_spawn, self.wave_announce_time + self.announce_duration)
+
+    def schedule_spawns(self, count, start_time):
+        """Precompute the spawn timeline for `count` zombies starting at start_time."""
+        self.spawn_timeline = build_spawn_timeline(count, self.difficulty, self.wave)
+        self.spawn_timeline_index = 0
+        self.spawn_start_time = start_time
+        self.pending_groups = deque()
+
+    def due_spawns(self, current_zombie_count):
+        """
+        Advance the wave's spawn timeline and return the group sizes due now,
+        trimmed so the live horde never exceeds max_zombies.
+        """
         if not self.wave_active or self.between_waves:
-            return False
-
-        now = pygame.time.get_ticks()
-
-        # Don't spawn during wave announcement
-        if now - self.wave_announce_time < self.announce_duration:
-            return False
-
-        # Check spawn cooldown
-        if now - self.last_spawn_time < self.difficulty["spawn_interval"]:
-            return False
-
-        # Check if we have more to spawn and haven't hit max
-        if (
-            self.zombies_spawned < self.zombies_to_spawn
-            and current_zombie_count < self.difficulty["max_zombies"]
-        ):
-            self.last_spawn_time = now
-            self.zombies_spawned += 1
-            return True
-
-        return False
-
-    def on_zombie_killed(self, current_zombie_count):
-        """Call when a zombie dies."""
-        self.zombies_killed += 1
+            return []
+
+        # Nothing spawns during the wave announcement
+        elapsed = game_clock.get_ticks() - self.spawn_start_time
+        if elapsed < 0:
+            return []
+
+        timeline = self.spawn_timeline
+        while self.spawn_timeline_index < len(timeline) and timeline[self.spawn_timeline_index][0] <= elapsed:
+            self.pending_groups.append(timeline[self.spawn_timeline_index][1])
+            self.spawn_timeline_index += 1
+
+        room = self.difficulty["max_zombies"] - current_zombie_count
+        groups = []
+        while self.pending_groups and room > 0:
+            size = self.pending_groups[0]
+            take = min(size, room)
+            groups.append(take)
+            room -= take
+            if take == size:
+                self.pending_groups.popleft()
+            else:
+                self.pending_groups[0] -= take
+        return groups
+
+    def on_zombies_spawned(self, count, unplaced=0):
+        """Record spawned zombies; unplaced ones go back to the front of the queue."""
+        self.zombies_spawned += count
+        if unplaced:
+            self.pending_groups.appendleft(unplaced)
+
+    def on_zombie_killed(self, current_zombie_count, count=1):
+        """Call when zombies die (`count` of them this tick)."""
+        self.zombies_killed += count
 
         # Wave complete when all spawned zombies are killed
         if self.zombies_killed >= self.zombies_to_spawn and current_zombie_count <= 1:
             self.wave_active = False
             self.wave_complete = True
             self.between_waves = True
-            self.between_wave_start = pygame.time.get_ticks()
+            self.between_wave_start = game_clock.get_ticks()
 
     def update(self):
         """Check for wave transitions."""
         if self.between_waves and self.wave_complete:
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             if now - self.between_wave_start >= self.between_wave_duration:
                 self._start_next_wave()
 
@@ -88,7 +112,7 @@ class LevelManager:
         """Check if we're in the wave announcement phase."""
         return (
             self.wave_active
-            and pygame.time.get_ticks() - self.wave_announce_time < self.announce_duration
+            and game_clock.get_ticks() - self.wave_announce_time < self.announce_duration
         )
 
     def get_wave_text(self):
@@ -6,43 +6,108 @@ import pygame
 import sys
 import math
 import os
+import time
+import asyncio
+import threading
 
 # Ensure we can import from src/
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import startup  # first, so the startup profile covers the imports below
 from settings import *
 from assets_manager import AssetManager
 from player import Player
-from zombie import Zombie, spawn_zombie
-from bullet import Bullet
+from zombie import ZombieStore
+from spawning import ZombieSpawner
+from bullet import BulletStore
 from weapon import fire_weapon
 from level import LevelManager
 from camera import Camera
 from particles import ParticleManager
 from ui import UI
-from obstacle import generate_obstacles, resolve_entity_obstacle_collision, check_player_behind_cover
+from obstacle import generate_obstacles, resolve_entity_obstacle_collision
+from pathfinding import FlowField
+from ai_lod import AIScheduler
+from crowd import CrowdSeparation
+from collision import BulletSweeper
+from visibility import VisibilityMap
+from combat import CombatResolver
+from world import ChunkedWorld
+from controls import Controls, read_local_controls
+from render_frame import FrameBuffer, capture_render_frame, ground_blits
+from async_loop import run_async
+from render_scale import ScaledWorldBuffer, NativeWorldTarget
+from decals import DecalLayer
+from frame_pacer import FramePacer
+from memory_probe import MemoryProbe
+from gc_policy import GCPolicy
+from telemetry import Telemetry, new_session_path
+import quality
+from quality import QualityGovernor
+from snapshot import Autosaver, restore_snapshot, read_snapshot_file, SnapshotError
+
+startup.mark("imports")
 
 
 class Game:
     """Main game class - manages the entire game lifecycle."""
 
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(TITLE)
+    def __init__(self, headless=False, bot=None):
+        """
+        `headless` runs the simulation only (no window, audio or UI), and `bot`
+        replaces keyboard/mouse input with an object providing get_controls(game).
+        """
+        # Only the subsystems the game uses; pygame.init() also opens audio and
+        # joystick devices, which can cost hundreds of ms on a cold start
+        pygame.display.init()
+        pygame.font.init()
+        self.headless = headless
+        self.bot = bot
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(self.clock)
+        self.show_pacing = False  # F3 overlay
+
+        if not headless:
+            flags = 0
+            if WINDOW_SCALED or WINDOW_RESIZABLE or FRAME_PACING == "vsync":
+                # SDL only offers vsync on the scaled renderer
+                flags |= pygame.SCALED
+            if WINDOW_RESIZABLE:
+                flags |= pygame.RESIZABLE
+            try:
+                self.screen = pygame.display.set_mode(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), flags, vsync=int(FRAME_PACING == "vsync"),
+                )
+            except pygame.error:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+                self.pacer.vsync_failed()
+            pygame.display.set_caption(TITLE)
+            startup.mark("display")
+
+            # The world may render at a lower internal resolution; the HUD stays native
+            if RENDER_SCALE < 1:
+                self.world_target = ScaledWorldBuffer(RENDER_SCALE)
+            else:
+                self.world_target = NativeWorldTarget(self.screen)
+        else:
+            self.screen = None
+            self.world_target = None
 
-        # Load assets
+        # Load assets (from the baked pack when present, otherwise generated now)
         self.assets = AssetManager()
+        startup.mark("assets")
 
-        # Custom cursor
-        pygame.mouse.set_visible(False)
-        self.crosshair = self.assets.get("crosshair")
+        if not headless:
+            # Custom cursor
+            pygame.mouse.set_visible(False)
+            self.crosshair = self.assets.get("crosshair")
 
-        # UI
-        self.ui = UI(self.screen)
+            # UI
+            self.ui = UI(self.screen)
+            startup.mark("ui")
+        else:
+            self.crosshair = None
+            self.ui = None
 
         # Game state
         self.state = STATE_MENU
@@ -50,8 +115,7 @@ class Game:
         self.difficulty_key = None
         self.difficulty = None
 
-        # Sprite groups (initialized on game start)
-        self.all_sprites = None
+        # Entities (initialized on game start)
         self.zombies = None
         self.bullets = None
         self.player = None
@@ -59,19 +123,59 @@ class Game:
         self.level_manager = None
         self.particles = None
         self.obstacles = None
-
-        # Ground tile cache
+        self.flow_field = None
+        self.ai_scheduler = None
+        self.crowd = None
+        self.bullet_sweeper = None
+        self.visibility = None
+        self.combat = None
+        self.spawner = None
+        self.world = None
+        self.decals = None
+
+        # Ground tile cache (and its flat colour for the lowest quality level)
         self.ground_tile = self.assets.get("ground_tile")
-
-    def _start_game(self, difficulty_key):
-        """Initialize a new game with the given difficulty."""
+        self.ground_color = pygame.transform.average_color(self.ground_tile)
+
+        # Threaded simulation: the sim thread holds sim_lock while ticking, the main
+        # thread while handling events; frames are handed over through frame_buffer
+        self.sim_lock = threading.Lock()
+        self.frame_buffer = FrameBuffer()
+        self.input_controls = Controls()
+
+        # Saving (F5 quicksave / F9 quickload, optional autosave)
+        self.autosaver = Autosaver() if not headless else None
+
+        # Optional memory instrumentation for soak runs
+        self.memory_probe = MemoryProbe() if MEMORY_PROBE_ENABLED else None
+
+        # Adaptive quality keeps frame work inside the budget
+        self.quality_governor = QualityGovernor() if QUALITY_GOVERNOR_ENABLED and not headless else None
+
+        # Per-frame field telemetry
+        self.telemetry = Telemetry(new_session_path()) if TELEMETRY_ENABLED and not headless else None
+        self._last_frame_start = time.perf_counter()
+
+        # Wave-aware GC scheduling; assets are long-lived, so freeze them now
+        self.gc_policy = GCPolicy() if GC_POLICY_ENABLED and not headless else None
+        if self.gc_policy:
+            self.gc_policy.refreeze()
+        startup.mark("game")
+
+    def _start_game(self, difficulty_key, obstacles=None, world_seed=None):
+        """
+        Initialize a new game with the given difficulty.
+        `obstacles` and `world_seed` let a restored snapshot reuse its saved layout;
+        by default the seed comes from WORLD_SEED.
+        """
+        if world_seed is None:
+            world_seed = WORLD_SEED
         self.difficulty_key = difficulty_key
         self.difficulty = DIFFICULTIES[difficulty_key]
 
-        # Sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.zombies = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
+        # Entities
+        self.zombies = ZombieStore(self.assets, self.difficulty)
+        self.bullets = BulletStore(self.assets)
 
         # Player
         player_surf = self.assets.get("player")
@@ -79,7 +183,6 @@ class Game:
             WORLD_WIDTH // 2, WORLD_HEIGHT // 2,
             player_surf, self.difficulty,
         )
-        self.all_sprites.add(self.player)
 
         # Camera
         self.camera = Camera()
@@ -88,25 +191,132 @@ class Game:
         # Level manager
         self.level_manager = LevelManager(self.difficulty)
 
-        # Particles
+        # Particles, and the lasting marks they leave (render-only, so not headless)
         self.particles = ParticleManager()
+        self.decals = DecalLayer() if not self.headless else None
+
+        # Obstacles (streamed per chunk around the player in a streamed world)
+        player_start = (self.player.pos.x, self.player.pos.y)
+        if WORLD_STREAMING:
+            self.world = ChunkedWorld(self.assets, player_start, world_seed)
+            self.world.update(self.player.pos, self.zombies)
+            self.obstacles = self.world.obstacles
+        else:
+            self.world = None
+            self.obstacles = obstacles if obstacles is not None else generate_obstacles(self.assets, player_start)
+
+        self.ai_scheduler = AIScheduler()
+        self.crowd = CrowdSeparation()
+        self.combat = CombatResolver()
+        self.spawner = ZombieSpawner()
+        self._build_obstacle_systems()
+
+        if self.gc_policy:
+            self.gc_policy.refreeze()
+
+        self.frame_buffer.clear()
+        self.state = STATE_PLAYING
 
-        # Obstacles
-        self.obstacles = generate_obstacles(self.assets, (self.player.pos.x, self.player.pos.y))
+    def _build_obstacle_systems(self):
+        """(Re)build everything derived from the current obstacle layout."""
+        bounds = self.world.bounds if self.world else None
 
-        self.state = STATE_PLAYING
+        # Shared pathfinding field for the horde
+        self.flow_field = FlowField(self.obstacles, bounds=bounds)
+        self.bullet_sweeper = BulletSweeper(self.obstacles)
+        self.visibility = VisibilityMap(self.obstacles)
 
     def run(self):
         """Main game loop."""
-        while self.running:
-            dt = self.clock.tick(FPS)
+        sim_thread = None
+        if THREADED_SIMULATION:
+            sim_thread = threading.Thread(target=self._simulation_loop, name="simulation", daemon=True)
+            sim_thread.start()
+
+        if ASYNC_MAIN_LOOP:
+            asyncio.run(run_async(self, threaded=sim_thread is not None))
+        else:
+            while self.running:
+                self.pacer.wait()
+                self._frame(threaded=sim_thread is not None)
+
+        if sim_thread:
+            sim_thread.join()
+        self._shutdown()
+
+    def _frame(self, threaded=False):
+        """One main-loop frame: events, update (unless the sim thread does it) and draw."""
+        if self.memory_probe:
+            self.memory_probe.begin_frame()
+        frame_start = time.perf_counter()
+        hp_before = self.player.hp if self.player else 0
+        spawned_before = self.level_manager.zombies_spawned if self.level_manager else 0
+
+        if threaded:
+            # Events and rendering here; the sim thread updates and publishes frames
+            with self.sim_lock:
+                self._handle_events()
+            frame = self.frame_buffer.latest()
+            if frame:
+                self.input_controls = read_local_controls(frame)
+        else:
             self._handle_events()
             self._update()
-            self._draw()
-
+            frame = capture_render_frame(self) if self.player else None
+        draw_start = time.perf_counter()
+        self._draw(frame)
+        draw_end = time.perf_counter()
+
+        if self.quality_governor:
+            self.quality_governor.update((draw_end - frame_start) * 1000)
+        if self.telemetry and self.player:
+            self.telemetry.record(
+                (frame_start - self._last_frame_start) * 1000,
+                (draw_start - frame_start) * 1000,
+                (draw_end - draw_start) * 1000,
+                len(self.zombies), len(self.bullets), len(self.particles.particles),
+                self.level_manager.wave,
+                max(0, self.level_manager.zombies_spawned - spawned_before),
+                max(0.0, hp_before - self.player.hp),
+            )
+        self._last_frame_start = frame_start
+        if self.gc_policy:
+            self.gc_policy.update(self)
+        if self.memory_probe:
+            self.memory_probe.end_frame(self)
+
+    def _shutdown(self):
+        """Flush reports and saves, then quit."""
+        if FRAME_PACING_REPORT:
+            print(self.pacer.summary())
+        if self.memory_probe:
+            self.memory_probe.close(self)
+        if self.telemetry:
+            self.telemetry.close()
+        if self.gc_policy:
+            self.gc_policy.close()
+        self.autosaver.close()
         pygame.quit()
         sys.exit()
 
+    def _simulation_loop(self):
+        """THREADED_SIMULATION worker: fixed-rate ticks, publishing a RenderFrame after each."""
+        tick = 1.0 / SIM_TICK_RATE
+        next_tick = time.perf_counter()
+        while self.running:
+            with self.sim_lock:
+                if self.state == STATE_PLAYING:
+                    self._update()
+                    self.frame_buffer.publish(capture_render_frame(self))
+
+            next_tick += tick
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind - drop the backlog rather than spiral
+                next_tick = time.perf_counter()
+
     def _handle_events(self):
         """Process input events based on current state."""
         for event in pygame.event.get():
@@ -166,100 +376,121 @@ class Game:
             if self.player:
                 self.player.start_reload()
 
+        if key == pygame.K_F3:
+            self.show_pacing = not self.show_pacing
+
+        if key == pygame.K_F5 and self.state in (STATE_PLAYING, STATE_PAUSED):
+            self.autosaver.save(self)
+        elif key == pygame.K_F9:
+            self._load_game()
+
+    def _load_game(self):
+        """Restore the last saved run, if there is one."""
+        try:
+            blob = read_snapshot_file(self.autosaver.path)
+            restore_snapshot(self, blob)
+        except (OSError, SnapshotError):
+            return
+        self.state = STATE_PLAYING
+
+    def _read_controls(self):
+        """Get this tick's player Controls from the bot if one is driving, else keyboard/mouse."""
+        if self.bot:
+            return self.bot.get_controls(self)
+        if THREADED_SIMULATION:
+            # Sampled by the main thread, which owns SDL input
+            return self.input_controls
+        return read_local_controls(self.camera)
+
     def _update(self):
         """Update game logic."""
         if self.state != STATE_PLAYING:
             return
 
         # Player
-        self.player.update(self.camera)
+        controls = self._read_controls()
+        self.player.update(controls)
 
         # Camera
         self.camera.update()
 
+        # Stream world chunks around the player
+        if self.world and self.world.update(self.player.pos, self.zombies):
+            self._build_obstacle_systems()
+
         # Player-Obstacle collision
         if self.obstacles:
             resolve_entity_obstacle_collision(self.player, self.obstacles)
 
         # Shooting (hold to fire)
-        mouse_buttons = pygame.mouse.get_pressed()
-        if mouse_buttons[0]:
-            new_bullets = fire_weapon(self.player, self.assets)
-            for b in new_bullets:
-                self.bullets.add(b)
-                self.all_sprites.add(b)
+        if controls.fire:
+            fire_weapon(self.player, self.bullets)
 
         # Bullets
-        for bullet in list(self.bullets):
-            bullet.update()
-
-        # Zombie spawning
-        if self.level_manager.should_spawn(len(self.zombies)):
-            zombie = spawn_zombie(self.player.pos, self.difficulty, self.assets)
-            self.zombies.add(zombie)
-            self.all_sprites.add(zombie)
-
-        # Zombie AI
-        for zombie in self.zombies:
-            zombie.update(self.player.pos)
-            if self.obstacles:
-                resolve_entity_obstacle_collision(zombie, self.obstacles)
-
-        # Bullet-obstacle collisions
-        for bullet in list(self.bullets):
-            for obstacle in self.obstacles:
-                if bullet.rect.colliderect(obstacle.collision_rect):
-                    self.particles.emit(bullet.pos.x, bullet.pos.y, (150, 150, 150), 5)
-                    bullet.kill()
-                    break
-
-        # Bullet-zombie collisions
-        for bullet in list(self.bullets):
-            for zombie in list(self.zombies):
-                if bullet.rect.colliderect(zombie.rect):
-                    # Hit!
-                    self.particles.emit(
-                        zombie.pos.x, zombie.pos.y,
-                        BLOOD_RED, 6,
-                    )
-                    if zombie.take_damage(bullet.damage):
-                        # Kill
-                        self.particles.emit(
-                            zombie.pos.x, zombie.pos.y,
-                            DARK_RED, 12,
-                        )
-                        self.player.score += zombie.score_value
-                        self.player.kills += 1
-                        zombie.kill()
-                        self.level_manager.on_zombie_killed(len(self.zombies))
-                    bullet.kill()
-                    break
+        self.bullets.update()
+
+        # Zombie spawning (bursts from the wave's precomputed timeline)
+        self.flow_field.update(self.player.pos)
+        horde = len(self.zombies) + (self.world.dormant_count() if self.world else 0)
+        groups = self.level_manager.due_spawns(horde)
+        if groups:
+            spawned, unplaced = self.spawner.spawn_groups(self.zombies, groups, self.player.pos, self.flow_field)
+            self.level_manager.on_zombies_spawned(spawned, unplaced)
+
+        # Parked zombies can't be killed, so once they are all that is left alive
+        # they return as a group in the spawn ring and the wave can still finish
+        if self.world and not self.zombies and self.world.dormant_count():
+            placed, unplaced = self.spawner.relocate(self.world.take_dormant(), self.player.pos, self.flow_field)
+            for row in placed:
+                self.zombies.put(row)
+            for row in unplaced:
+                self.world.park(row)
+
+        # Crowd separation keeps the horde from stacking on the same pixels
+        self.crowd.apply(self.zombies)
+
+        # Zombie AI (distant zombies update less often, off-screen ones skip rotation)
+        view_rect = self.camera.get_view_rect(AI_LOD_VIEW_MARGIN)
+        due = self.ai_scheduler.schedule(self.zombies, self.player.pos, view_rect)
+        self.zombies.update(due, self.player.pos, self.flow_field)
+        if self.obstacles:
+            self.zombies.push_out(due, self.obstacles)
+
+        # Bullet collisions, swept along each bullet's travel this tick (earliest hit wins).
+        # Hits are buffered first, then applied in bulk.
+        self.bullet_sweeper.rebuild_zombies(self.zombies)
+        self.combat.detect(self.bullets, self.bullet_sweeper)
+        self.combat.apply(self.player, self.zombies, self.bullets, self.level_manager, self.particles, self.decals)
 
         # Zombie-player collision (damage)
-        for zombie in self.zombies:
-            if zombie.rect.colliderect(self.player.rect):
-                if zombie.can_attack():
-                    # Check cover
-                    is_covered = check_player_behind_cover(self.player, self.obstacles, zombie.pos)
-                    dmg = zombie.damage * (1 - COVER_DAMAGE_REDUCTION) if is_covered else zombie.damage
-                    dead = self.player.take_damage(dmg)
-
-                    self.particles.emit(
-                        self.player.pos.x, self.player.pos.y,
-                        RED, 4,
-                    )
-                    if dead:
-                        self.state = STATE_GAME_OVER
-                        return
+        c = self.zombies.store.columns
+        for i in self.zombies.attackers(self.player.rect):
+            # Check cover
+            zombie_pos = pygame.math.Vector2(c["x"][i], c["y"][i])
+            is_covered = self.visibility.is_player_covered(self.player.pos, zombie_pos)
+            damage = c["damage"][i]
+            dmg = damage * (1 - COVER_DAMAGE_REDUCTION) if is_covered else damage
+            dead = self.player.take_damage(dmg)
+
+            self.particles.emit(
+                self.player.pos.x, self.player.pos.y,
+                RED, 4,
+            )
+            if dead:
+                self.state = STATE_GAME_OVER
+                return
 
         # Level / wave management
         self.level_manager.update()
 
+        if AUTOSAVE_ENABLED and self.autosaver:
+            self.autosaver.update(self)
+
         # Particles
         self.particles.update()
 
-    def _draw(self):
-        """Render everything."""
+    def _draw(self, frame):
+        """Render everything; the game world and HUD come from `frame` (a RenderFrame or None)."""
         if self.state == STATE_MENU:
             self.ui.draw_main_menu()
 
@@ -267,14 +498,22 @@ class Game:
             self.ui.draw_difficulty_select()
 
         elif self.state in (STATE_PLAYING, STATE_PAUSED):
-            self._draw_game_world()
-            self.ui.draw_hud(self.player, self.level_manager)
+            self._draw_game_world(frame)
+            if frame:
+                self.ui.draw_hud(
+                    frame.player, frame.level,
+                    quality.get("label") if self.quality_governor else None,
+                )
             if self.state == STATE_PAUSED:
                 self.ui.draw_pause()
 
         elif self.state == STATE_GAME_OVER:
-            self._draw_game_world()
-            self.ui.draw_game_over(self.player, self.level_manager)
+            self._draw_game_world(frame)
+            if frame:
+                self.ui.draw_game_over(frame.player, frame.level)
+
+        if self.show_pacing:
+            self.ui.draw_debug_text(self.pacer.summary())
 
         # Custom crosshair cursor (always on top)
         mouse_pos = pygame.mouse.get_pos()
@@ -283,62 +522,46 @@ class Game:
             self.screen.blit(self.crosshair, ch_rect)
 
         pygame.display.flip()
+        startup.first_frame_shown()
 
-    def _draw_game_world(self):
-        """Draw the game world with camera offset."""
-        self.screen.fill(BG_COLOR)
-
-        if not self.camera:
-            return
+    def _draw_game_world(self, frame):
+        """Draw the game world from a RenderFrame.
 
-        cam_x = int(self.camera.offset.x)
-        cam_y = int(self.camera.offset.y)
-
-        # Draw ground tiles
-        tile_size = TILE_SIZE
-        start_col = max(0, cam_x // tile_size)
-        end_col = min(WORLD_WIDTH // tile_size, (cam_x + SCREEN_WIDTH) // tile_size + 1)
-        start_row = max(0, cam_y // tile_size)
-        end_row = min(WORLD_HEIGHT // tile_size, (cam_y + SCREEN_HEIGHT) // tile_size + 1)
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                x = col * tile_size - cam_x
-                y = row * tile_size - cam_y
-                self.screen.blit(self.ground_tile, (x, y))
-
-        # Draw world border
-        border_rect = pygame.Rect(-cam_x, -cam_y, WORLD_WIDTH, WORLD_HEIGHT)
-        pygame.draw.rect(self.screen, DARK_RED, border_rect, 4)
-
-        # Draw bullets
-        for bullet in self.bullets:
-            screen_rect = self.camera.apply(bullet)
-            self.screen.blit(bullet.image, screen_rect)
-
-        # Y-sort rendering for depth (obstacles, zombies, player)
-        render_group = []
-        if self.obstacles:
-            render_group.extend(self.obstacles.sprites())
-        if self.zombies:
-            render_group.extend(self.zombies.sprites())
-        if self.player:
-            render_group.append(self.player)
+        Each layer is a draw list of (surface, position) pairs submitted with a
+        single blits call to the world target (the display, or the low-resolution
+        buffer when RENDER_SCALE < 1, which is then scaled up over the display).
+        """
+        target = self.world_target
+        target.fill(BG_COLOR)
 
-        render_group.sort(key=lambda s: s.rect.bottom)
+        if frame:
+            cam_x = frame.cam_x
+            cam_y = frame.cam_y
 
-        for sprite in render_group:
-            if hasattr(sprite, 'obstacle_type'):
-                sprite.draw(self.screen, self.camera)
+            # Ground tiles (a flat fill at the lowest quality level)
+            if quality.get("ground_tiles"):
+                target.blits(ground_blits(self.ground_tile, cam_x, cam_y))
             else:
-                screen_rect = self.camera.apply(sprite)
-                self.screen.blit(sprite.image, screen_rect)
-                if hasattr(sprite, 'draw_health_bar'):
-                    sprite.draw_health_bar(self.screen, self.camera)
+                ground_area = None if WORLD_STREAMING else (-cam_x, -cam_y, WORLD_WIDTH, WORLD_HEIGHT)
+                target.fill(self.ground_color, ground_area)
+
+            # Draw world border
+            if not WORLD_STREAMING:
+                target.draw_rect(DARK_RED, (-cam_x, -cam_y, WORLD_WIDTH, WORLD_HEIGHT), 4)
+
+            # Decals, stamped here so their tiles are only touched on the render thread
+            if self.decals:
+                for tile in self.decals.apply_pending():
+                    target.invalidate(tile)
+                target.blits(self.decals.get_blits(cam_x, cam_y))
+
+            # Bullets, then y-sorted obstacles / zombies / player
+            target.blits(frame.entity_layer)
 
-        # Draw particles
-        self.particles.draw(self.screen, self.camera.offset)
+            # Particles
+            target.blits(frame.particle_layer)
 
+        target.present(self.screen)
 
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,187 @@
+"""
+Memory instrumentation for long soak runs - periodic tracemalloc snapshots grouped by
+subsystem, live surface and entity counts, per-frame allocation deltas and GC pauses,
+written to a JSON report at exit.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import tracemalloc
+import pygame
+import game_clock
+from settings import *
+
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _subsystem_of(filename):
+    """Map a source file to the subsystem its allocations are charged to."""
+    path = os.path.abspath(filename)
+    if os.path.dirname(path) == SRC_DIR:
+        return os.path.splitext(os.path.basename(path))[0]
+    if f"{os.sep}pygame{os.sep}" in path:
+        return "pygame"
+    return "other"
+
+
+def count_surfaces():
+    """
+    Count live pygame Surfaces and their pixel memory.
+    Surfaces aren't GC-tracked, so they are found through the containers that hold them;
+    this walks every tracked object and is only meant for periodic samples.
+    gc.get_objects() skips the permanent generation, so objects frozen by the GC policy
+    are unfrozen for the walk and frozen again after (with anything allocated since).
+    """
+    frozen = gc.get_freeze_count()
+    if frozen:
+        gc.unfreeze()
+    seen = {}
+    try:
+        for obj in gc.get_objects():
+            for ref in gc.get_referents(obj):
+                if type(ref) is pygame.Surface:
+                    seen[id(ref)] = ref
+    finally:
+        if frozen:
+            gc.freeze()
+    pixel_bytes = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in seen.values())
+    return len(seen), pixel_bytes
+
+
+class MemoryProbe:
+    """Collects allocation and GC statistics per interval and writes a report at exit."""
+
+    def __init__(self, interval=None, report_path=None):
+        self.interval = interval if interval is not None else MEMORY_PROBE_INTERVAL
+        self.report_path = report_path if report_path is not None else MEMORY_PROBE_REPORT
+        self.started = time.time()
+        self.samples = []
+        self._prev_snapshot = None
+
+        tracemalloc.start(MEMORY_PROBE_TRACE_DEPTH)
+        gc.callbacks.append(self._on_gc)
+        self._gc_start = 0.0
+        self._reset_interval()
+        self._last_sample = game_clock.get_ticks()
+        self._frame_blocks = 0
+
+    def _reset_interval(self):
+        self.frames = 0
+        self.block_delta_total = 0
+        self.block_delta_max = 0
+        self.gc_collections = [0, 0, 0]
+        self.gc_pause_total_ms = 0.0
+        self.gc_pause_max_ms = 0.0
+        self.frame_gc_pause_ms = 0.0
+        self.worst_frame_gc_ms = 0.0
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        pause_ms = (time.perf_counter() - self._gc_start) * 1000
+        self.gc_collections[info["generation"]] += 1
+        self.gc_pause_total_ms += pause_ms
+        self.gc_pause_max_ms = max(self.gc_pause_max_ms, pause_ms)
+        self.frame_gc_pause_ms += pause_ms
+
+    def begin_frame(self):
+        """Call at the start of a frame."""
+        self._frame_blocks = sys.getallocatedblocks()
+        self.frame_gc_pause_ms = 0.0
+
+    def end_frame(self, game):
+        """Call at the end of a frame; takes a sample when the interval has elapsed."""
+        delta = sys.getallocatedblocks() - self._frame_blocks
+        self.frames += 1
+        self.block_delta_total += delta
+        self.block_delta_max = max(self.block_delta_max, delta)
+        self.worst_frame_gc_ms = max(self.worst_frame_gc_ms, self.frame_gc_pause_ms)
+
+        if game_clock.get_ticks() - self._last_sample >= self.interval:
+            self.sample(game)
+
+    def sample(self, game):
+        """Record one interval: memory per subsystem, growth hot spots, surfaces and entities."""
+        self._last_sample = game_clock.get_ticks()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+        by_subsystem = {}
+        for stat in snapshot.statistics("filename"):
+            name = _subsystem_of(stat.traceback[0].filename)
+            entry = by_subsystem.setdefault(name, [0, 0])
+            entry[0] += stat.size
+            entry[1] += stat.count
+
+        growth = []
+        if self._prev_snapshot is not None:
+            for stat in snapshot.compare_to(self._prev_snapshot, "lineno")[:MEMORY_PROBE_TOP_LINES]:
+                frame = stat.traceback[0]
+                growth.append({
+                    "where": f"{os.path.basename(frame.filename)}:{frame.lineno}",
+                    "size_diff": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                })
+        self._prev_snapshot = snapshot
+
+        frozen_objects = gc.get_freeze_count()
+        surfaces, surface_bytes = count_surfaces()
+        traced, peak = tracemalloc.get_traced_memory()
+        frames = max(1, self.frames)
+        self.samples.append({
+            "elapsed_s": round(time.time() - self.started, 1),
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "subsystems": {k: {"bytes": v[0], "blocks": v[1]} for k, v in sorted(by_subsystem.items())},
+            "growth": growth,
+            "surfaces": surfaces,
+            "surface_pixel_bytes": surface_bytes,
+            # Surfaces held by objects in the frozen (permanent) generation are included
+            "frozen_objects": frozen_objects,
+            "entities": self._count_entities(game),
+            "gc_policy": game.gc_policy.summary() if game.gc_policy else None,
+            "frames": self.frames,
+            "blocks_per_frame_mean": round(self.block_delta_total / frames, 2),
+            "blocks_per_frame_max": self.block_delta_max,
+            "gc_collections": list(self.gc_collections),
+            "gc_pause_total_ms": round(self.gc_pause_total_ms, 3),
+            "gc_pause_max_ms": round(self.gc_pause_max_ms, 3),
+            "worst_frame_gc_ms": round(self.worst_frame_gc_ms, 3),
+        })
+        self._reset_interval()
+
+    @staticmethod
+    def _count_entities(game):
+        if game.player is None:
+            return {}
+        return {
+            "zombies": len(game.zombies),
+            "dormant_zombies": game.world.dormant_count() if game.world else 0,
+            "bullets": len(game.bullets),
+            "particles": len(game.particles.particles),
+            "obstacles": len(game.obstacles),
+        }
+
+    def write_report(self):
+        """Write all samples to the JSON report file."""
+        os.makedirs(os.path.dirname(self.report_path) or ".", exist_ok=True)
+        with open(self.report_path, "w") as f:
+            json.dump({
+                "started": self.started,
+                "duration_s": round(time.time() - self.started, 1),
+                "interval_ms": self.interval,
+                "samples": self.samples,
+            }, f, indent=1)
+
+    def close(self, game):
+        """Take a final sample, write the report and stop tracing."""
+        self.sample(game)
+        self.write_report()
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
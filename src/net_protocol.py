@@ -0,0 +1,227 @@
+"""
+Network protocol for server mode - fixed struct messages over UDP. Entity states are
+quantized and delta-compressed against the last snapshot the client acknowledged, so
+an idle or unchanged entity costs nothing on the wire.
+"""
+import struct
+from settings import *
+from controls import Controls
+from bullet import WEAPON_NAMES
+from zombie import ZOMBIE_KEYS
+
+
+# Message types
+MSG_HELLO = 1
+MSG_INPUT = 2
+MSG_BYE = 3
+MSG_WELCOME = 10
+MSG_SNAPSHOT = 11
+
+NO_BASELINE = 0xFFFFFFFF
+
+# Entity kinds, stored in the top two bits of a network id
+KIND_PLAYER = 0
+KIND_ZOMBIE = 1
+KIND_BULLET = 2
+_KIND_SHIFT = 30
+_ID_MASK = (1 << _KIND_SHIFT) - 1
+
+# Quantization
+POS_SCALE = 8       # positions in 1/8 px
+ANGLE_STEPS = 256   # angles in 1/256 turn
+HEALTH_STEPS = 255  # health as a fraction of max
+
+DIFFICULTY_KEYS = list(DIFFICULTIES)
+OBSTACLE_KEYS = list(OBSTACLE_TYPES)
+
+# Field mask bits of an entity update
+F_NEW = 0x01        # sub type follows; all other fields are present and absolute
+F_POS = 0x02
+F_POS_DELTA = 0x04  # position is an int16 delta from the baseline
+F_ANGLE = 0x08
+F_HEALTH = 0x10
+
+# Record layouts (little-endian, no padding)
+_TYPE = struct.Struct("<B")
+_INPUT = struct.Struct("<BIbbff??bff")      # type, ack tick, move x/y, aim x/y, fire, reload, weapon (-1 = none), view center x/y
+_WELCOME = struct.Struct("<BB?H")           # type, difficulty, controls the player, obstacle count
+_OBSTACLE = struct.Struct("<Bii")           # type, x, y
+_SNAPSHOT = struct.Struct("<BII?fHB3H?IHHHH")  # type, tick, baseline tick, game over, hp, max hp, weapon, ammo x3, reloading, score, kills, wave, updates, removes
+_ID = struct.Struct("<I")
+_UPDATE = struct.Struct("<IB")              # network id, field mask
+_POS_ABS = struct.Struct("<ii")
+_POS_DELTA = struct.Struct("<hh")
+
+
+def net_id(kind, ident):
+    """Network id for entity `ident` of the given kind."""
+    return (kind << _KIND_SHIFT) | (ident & _ID_MASK)
+
+
+def kind_of(nid):
+    return nid >> _KIND_SHIFT
+
+
+def quantize(sub, x, y, angle_deg, health):
+    """Quantized entity state: (sub type, x, y, angle, health)."""
+    return (
+        sub,
+        int(round(x * POS_SCALE)),
+        int(round(y * POS_SCALE)),
+        int(round(angle_deg * ANGLE_STEPS / 360)) % ANGLE_STEPS,
+        max(0, min(HEALTH_STEPS, int(health * HEALTH_STEPS))),
+    )
+
+
+def dequantize(state):
+    """(sub type, x, y, angle degrees, health fraction) from a quantized state."""
+    sub, qx, qy, qa, qh = state
+    return sub, qx / POS_SCALE, qy / POS_SCALE, qa * 360 / ANGLE_STEPS, qh / HEALTH_STEPS
+
+
+def message_type(data):
+    return data[0] if data else None
+
+
+# ─── Client -> server ──────────────────────────────────────
+def encode_hello():
+    return _TYPE.pack(MSG_HELLO)
+
+
+def encode_bye():
+    return _TYPE.pack(MSG_BYE)
+
+
+def encode_input(ack_tick, controls, view_x, view_y):
+    weapon = WEAPON_NAMES.index(controls.weapon) if controls.weapon else -1
+    return _INPUT.pack(
+        MSG_INPUT, ack_tick, controls.move_x, controls.move_y,
+        controls.aim_x, controls.aim_y, bool(controls.fire), bool(controls.reload),
+        weapon, view_x, view_y,
+    )
+
+
+def decode_input(data):
+    """Returns (ack tick, Controls, (view x, view y))."""
+    _, ack, mx, my, ax, ay, fire, reload, weapon, vx, vy = _INPUT.unpack_from(data)
+    controls = Controls(mx, my, ax, ay, fire, reload, WEAPON_NAMES[weapon] if weapon >= 0 else None)
+    return ack, controls, (vx, vy)
+
+
+# ─── Server -> client ──────────────────────────────────────
+def encode_welcome(difficulty_key, is_controller, obstacles):
+    parts = [_WELCOME.pack(MSG_WELCOME, DIFFICULTY_KEYS.index(difficulty_key), is_controller, len(obstacles))]
+    for obstacle in obstacles:
+        parts.append(_OBSTACLE.pack(
+            OBSTACLE_KEYS.index(obstacle.obstacle_type), int(obstacle.pos.x), int(obstacle.pos.y),
+        ))
+    return b"".join(parts)
+
+
+def decode_welcome(data):
+    """Returns (difficulty key, is controller, [(obstacle type, x, y), ...])."""
+    _, difficulty, is_controller, count = _WELCOME.unpack_from(data)
+    obstacles = []
+    for i in range(count):
+        obs_type, x, y = _OBSTACLE.unpack_from(data, _WELCOME.size + i * _OBSTACLE.size)
+        obstacles.append((OBSTACLE_KEYS[obs_type], x, y))
+    return DIFFICULTY_KEYS[difficulty], is_controller, obstacles
+
+
+def encode_snapshot(tick, baseline_tick, baseline, states, hud):
+    """
+    Encode `states` ({network id: quantized state}) as a delta from `baseline`, the
+    states of `baseline_tick` (NO_BASELINE and {} for a full snapshot).
+    `hud` is (game over, hp, max hp, weapon, (ammo x3), reloading, score, kills, wave).
+    """
+    updates = []
+    for nid, state in states.items():
+        old = baseline.get(nid)
+        if old is None or old[0] != state[0]:
+            updates.append(
+                _UPDATE.pack(nid, F_NEW | F_POS | F_ANGLE | F_HEALTH)
+                + bytes((state[0],)) + _POS_ABS.pack(state[1], state[2]) + bytes((state[3], state[4]))
+            )
+            continue
+        if state == old:
+            continue
+
+        mask = 0
+        fields = []
+        if state[1] != old[1] or state[2] != old[2]:
+            dx, dy = state[1] - old[1], state[2] - old[2]
+            if -32768 <= dx <= 32767 and -32768 <= dy <= 32767:
+                mask |= F_POS | F_POS_DELTA
+                fields.append(_POS_DELTA.pack(dx, dy))
+            else:
+                mask |= F_POS
+                fields.append(_POS_ABS.pack(state[1], state[2]))
+        if state[3] != old[3]:
+            mask |= F_ANGLE
+            fields.append(bytes((state[3],)))
+        if state[4] != old[4]:
+            mask |= F_HEALTH
+            fields.append(bytes((state[4],)))
+        updates.append(_UPDATE.pack(nid, mask) + b"".join(fields))
+
+    removes = [nid for nid in baseline if nid not in states]
+    game_over, hp, max_hp, weapon, ammo, reloading, score, kills, wave = hud
+    return b"".join((
+        _SNAPSHOT.pack(
+            MSG_SNAPSHOT, tick, baseline_tick, game_over, hp, max_hp, weapon, *ammo,
+            reloading, score, kills, wave, len(updates), len(removes),
+        ),
+        b"".join(_ID.pack(nid) for nid in removes),
+        b"".join(updates),
+    ))
+
+
+def decode_snapshot(data, baselines):
+    """
+    Decode a snapshot against `baselines` ({tick: states}).
+    Returns (tick, hud, states), or None if its baseline isn't held any more.
+    """
+    (_, tick, baseline_tick, game_over, hp, max_hp, weapon, a0, a1, a2,
+     reloading, score, kills, wave, n_updates, n_removes) = _SNAPSHOT.unpack_from(data)
+    if baseline_tick == NO_BASELINE:
+        states = {}
+    elif baseline_tick in baselines:
+        states = dict(baselines[baseline_tick])
+    else:
+        return None
+
+    offset = _SNAPSHOT.size
+    for _ in range(n_removes):
+        states.pop(_ID.unpack_from(data, offset)[0], None)
+        offset += _ID.size
+
+    for _ in range(n_updates):
+        nid, mask = _UPDATE.unpack_from(data, offset)
+        offset += _UPDATE.size
+        if mask & F_NEW:
+            sub = data[offset]
+            qx, qy = _POS_ABS.unpack_from(data, offset + 1)
+            qa, qh = data[offset + 9], data[offset + 10]
+            offset += 11
+            states[nid] = (sub, qx, qy, qa, qh)
+            continue
+
+        sub, qx, qy, qa, qh = states[nid]
+        if mask & F_POS:
+            if mask & F_POS_DELTA:
+                dx, dy = _POS_DELTA.unpack_from(data, offset)
+                qx, qy = qx + dx, qy + dy
+                offset += _POS_DELTA.size
+            else:
+                qx, qy = _POS_ABS.unpack_from(data, offset)
+                offset += _POS_ABS.size
+        if mask & F_ANGLE:
+            qa = data[offset]
+            offset += 1
+        if mask & F_HEALTH:
+            qh = data[offset]
+            offset += 1
+        states[nid] = (sub, qx, qy, qa, qh)
+
+    hud = (game_over, hp, max_hp, weapon, (a0, a1, a2), reloading, score, kills, wave)
+    return tick, hud, states
@@ -5,6 +5,9 @@ Blocks bullets and player/zombie movement. Provides damage reduction when player
 import pygame
 import random
 import math
+import itertools
+import warnings
+import quality
 from settings import *
 
 
@@ -21,77 +24,128 @@ class Obstacle(pygame.sprite.Sprite):
         # Collision rect (slightly smaller than visual for forgiving gameplay)
         self.collision_rect = self.rect.inflate(-6, -6)
 
-    def draw(self, surface, camera):
-        """Draw the obstacle."""
-        screen_rect = camera.apply(self)
-        surface.blit(self.image, screen_rect)
+        # Shadow is pre-rendered once so it can join the batched blits
+        self.shadow_image = _get_shadow_surface(self.rect.width - 4, self.rect.height - 4)
 
-        # Optional: draw shadow underneath
-        shadow_rect = screen_rect.inflate(-4, -4)
-        shadow_rect.y += 3
-        shadow_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 30))
-        surface.blit(shadow_surf, shadow_rect)
+    def get_blits(self, camera):
+        """Return the (surface, position) pairs that draw this obstacle."""
+        screen_x, screen_y = camera.apply_pos(self.rect.topleft)
+        if not quality.get("shadows"):
+            return [(self.image, (screen_x, screen_y))]
+        return [
+            (self.image, (screen_x, screen_y)),
+            (self.shadow_image, (screen_x + 2, screen_y + 5)),
+        ]
 
 
-def generate_obstacles(assets, player_start_pos):
-    """Generate random obstacles spread across the world, avoiding player spawn area."""
-    obstacles = pygame.sprite.Group()
-    placed = []
+_shadow_cache = {}
 
-    attempts = 0
-    max_attempts = OBSTACLE_COUNT * 20
 
-    # Weighted random type selection
-    types = list(OBSTACLE_TYPES.keys())
-    weights = [OBSTACLE_TYPES[t]["weight"] for t in types]
+def _get_shadow_surface(width, height):
+    """Get a cached translucent shadow surface of the given size."""
+    key = (width, height)
+    shadow_surf = _shadow_cache.get(key)
+    if shadow_surf is None:
+        shadow_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        shadow_surf.fill((0, 0, 0, 30))
+        _shadow_cache[key] = shadow_surf
+    return shadow_surf
 
-    while len(placed) < OBSTACLE_COUNT and attempts < max_attempts:
-        attempts += 1
 
-        # Pick type
-        obs_type = random.choices(types, weights=weights, k=1)[0]
-        info = OBSTACLE_TYPES[obs_type]
+def scatter_points(bounds, min_dist, footprints, weights, count, exclusion_zones=(), rng=random,
+                   attempts=30):
+    """
+    Scatter up to `count` typed points inside bounds (left, top, right, bottom) by dart
+    throwing. Every pair of points is at least max(min_dist, radius_a + radius_b) apart,
+    where the radius comes from each type's footprint. Exclusion zones are
+    (x, y, inner, outer) rings; points with inner <= distance < outer are rejected.
+    Gives up after attempts * count misses. Returns a list of (x, y, type).
+    """
+    left, top, right, bottom = bounds
+    types = list(footprints)
+    cum_weights = list(itertools.accumulate(weights[t] for t in types))
+
+    # Background grid: at most one point per cell, neighbours found in O(1)
+    cell = min_dist / math.sqrt(2)
+    cols = int((right - left) / cell) + 1
+    rows = int((bottom - top) / cell) + 1
+    grid = [-1] * (cols * rows)
+    span = math.ceil(max(min_dist, 2 * max(footprints.values())) / cell)
+
+    points = []
+
+    def fits(x, y, radius):
+        for zx, zy, inner, outer in exclusion_zones:
+            if inner <= math.hypot(x - zx, y - zy) < outer:
+                return False
+        col = int((x - left) / cell)
+        row = int((y - top) / cell)
+        for r in range(max(0, row - span), min(rows, row + span + 1)):
+            base = r * cols
+            for c in range(max(0, col - span), min(cols, col + span + 1)):
+                idx = grid[base + c]
+                if idx >= 0:
+                    px, py, ptype = points[idx]
+                    need = max(min_dist, radius + footprints[ptype])
+                    if (x - px) ** 2 + (y - py) ** 2 < need * need:
+                        return False
+        return True
+
+    misses = 0
+    while len(points) < count and misses < attempts * count:
+        obs_type = rng.choices(types, cum_weights=cum_weights, k=1)[0]
+        x = rng.randint(int(left), int(right))
+        y = rng.randint(int(top), int(bottom))
+        if fits(x, y, footprints[obs_type]):
+            grid[int((y - top) / cell) * cols + int((x - left) / cell)] = len(points)
+            points.append((x, y, obs_type))
+        else:
+            misses += 1
+    return points
+
+
+def generate_obstacles(assets, player_start_pos, count=None, bounds=None,
+                       exclusion_zones=(), rng=random):
+    """
+    Generate obstacles spread across the world, avoiding the player spawn area.
+    Positions are scattered with a guaranteed minimum spacing; if the area can't fit
+    `count` obstacles a RuntimeWarning reports how many were placed.
+    """
+    obstacles = pygame.sprite.Group()
+    if count is None:
+        count = OBSTACLE_COUNT
 
-        # Random position (avoid edges and player start)
+    if bounds is None:
+        # Avoid edges
         margin = 150
-        x = random.randint(margin, WORLD_WIDTH - margin)
-        y = random.randint(margin, WORLD_HEIGHT - margin)
+        bounds = (margin, margin, WORLD_WIDTH - margin, WORLD_HEIGHT - margin)
 
-        # Don't spawn too close to player start
-        dist_to_player = math.hypot(x - player_start_pos[0], y - player_start_pos[1])
-        if dist_to_player < 200:
-            continue
+    # Don't spawn too close to player start
+    zones = [(player_start_pos[0], player_start_pos[1], 0, OBSTACLE_PLAYER_CLEARANCE)]
+    zones.extend(exclusion_zones)
 
-        # Don't spawn too close to other obstacles
-        too_close = False
-        for ox, oy in placed:
-            if math.hypot(x - ox, y - oy) < OBSTACLE_MIN_DIST:
-                too_close = True
-                break
-        if too_close:
-            continue
+    footprints = {
+        t: math.hypot(info["width"], info["height"]) / 2
+        for t, info in OBSTACLE_TYPES.items()
+    }
+    weights = {t: info["weight"] for t, info in OBSTACLE_TYPES.items()}
+
+    points = scatter_points(bounds, OBSTACLE_MIN_DIST, footprints, weights, count, zones, rng)
+    if len(points) < count:
+        warnings.warn(f"only {len(points)} of {count} obstacles fit in {bounds}", RuntimeWarning, stacklevel=2)
 
-        # Create obstacle
+    for x, y, obs_type in points:
         surface = assets.get(obs_type)
         if surface is None:
             continue
-
-        obstacle = Obstacle(x, y, obs_type, surface)
-        obstacles.add(obstacle)
-        placed.append((x, y))
+        obstacles.add(Obstacle(x, y, obs_type, surface))
 
     return obstacles
 
 
-def check_player_behind_cover(player, obstacles, zombie_pos):
-    """
-    Check if the player is behind an obstacle relative to a zombie's position.
-    Returns True if the player is hidden behind cover from this zombie.
-    """
+def is_behind_cover(px, py, zx, zy, obstacles):
+    """Exact cover test for a player at (px, py) against a zombie at (zx, zy)."""
     # Cast a line from zombie to player and check if any obstacle intersects
-    px, py = player.pos.x, player.pos.y
-    zx, zy = zombie_pos.x, zombie_pos.y
 
     # Direction from zombie to player
     dx = px - zx
@@ -111,8 +165,8 @@ def check_player_behind_cover(player, obstacles, zombie_pos):
         if obs_dist_to_zombie > dist or obs_dist_to_player > dist:
             continue
 
-        # Player must be close to the obstacle (within ~60px) to count as "hiding"
-        if obs_dist_to_player > 70:
+        # Player must be close to the obstacle to count as "hiding"
+        if obs_dist_to_player > COVER_HIDE_DIST:
             continue
 
         # Point-to-line distance: check if obstacle center is near the zombie→player line
@@ -120,38 +174,53 @@ def check_player_behind_cover(player, obstacles, zombie_pos):
         cross = abs(dx * (zy - oy) - dy * (zx - ox))
         line_dist = cross / dist
 
-        if line_dist < 40:  # obstacle radius threshold
+        if line_dist < COVER_LINE_DIST:  # obstacle radius threshold
             return True
 
     return False
 
 
-def resolve_entity_obstacle_collision(entity, obstacles):
+def push_out_of_obstacles(x, y, width, height, obstacles):
     """
-    Push an entity (player or zombie) out of any obstacles it overlaps with.
-    Returns True if a collision was resolved.
+    Push a width x height box centred on (x, y) out of any obstacles it overlaps with.
+    Returns the corrected (x, y), or None if it overlapped nothing.
     """
+    rect = pygame.Rect(0, 0, width, height)
+    rect.center = (int(x), int(y))
     collided = False
     for obstacle in obstacles:
-        if entity.rect.colliderect(obstacle.collision_rect):
+        if rect.colliderect(obstacle.collision_rect):
             collided = True
             # Find the shortest push-out direction
-            overlap_left = entity.rect.right - obstacle.collision_rect.left
-            overlap_right = obstacle.collision_rect.right - entity.rect.left
-            overlap_top = entity.rect.bottom - obstacle.collision_rect.top
-            overlap_bottom = obstacle.collision_rect.bottom - entity.rect.top
+            overlap_left = rect.right - obstacle.collision_rect.left
+            overlap_right = obstacle.collision_rect.right - rect.left
+            overlap_top = rect.bottom - obstacle.collision_rect.top
+            overlap_bottom = obstacle.collision_rect.bottom - rect.top
 
             min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
 
             if min_overlap == overlap_left:
-                entity.pos.x -= overlap_left
+                x -= overlap_left
             elif min_overlap == overlap_right:
-                entity.pos.x += overlap_right
+                x += overlap_right
             elif min_overlap == overlap_top:
-                entity.pos.y -= overlap_top
+                y -= overlap_top
             elif min_overlap == overlap_bottom:
-                entity.pos.y += overlap_bottom
+                y += overlap_bottom
+
+            rect.center = (int(x), int(y))
+
+    return (x, y) if collided else None
 
-            entity.rect.center = (int(entity.pos.x), int(entity.pos.y))
 
-    return collided
+def resolve_entity_obstacle_collision(entity, obstacles):
+    """
+    Push an entity (the player) out of any obstacles it overlaps with.
+    Returns True if a collision was resolved.
+    """
+    moved = push_out_of_obstacles(entity.pos.x, entity.pos.y, entity.rect.width, entity.rect.height, obstacles)
+    if moved is None:
+        return False
+    entity.pos.update(moved)
+    entity.rect.center = (int(entity.pos.x), int(entity.pos.y))
+    return True
@@ -4,6 +4,8 @@ Particle effects for hits and kills.
 import pygame
 import random
 import math
+import game_clock
+import quality
 from settings import PARTICLE_COUNT, PARTICLE_SPEED, PARTICLE_LIFETIME
 
 
@@ -17,7 +19,7 @@ class Particle:
         self.vel = pygame.math.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
         self.color = color
         self.size = random.randint(2, 5)
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = game_clock.get_ticks()
         self.lifetime = PARTICLE_LIFETIME + random.randint(-50, 50)
         self.alive = True
 
@@ -26,16 +28,38 @@ class Particle:
         self.pos += self.vel
         self.vel *= 0.95  # friction
         self.size = max(0, self.size - 0.05)
-        if pygame.time.get_ticks() - self.spawn_time > self.lifetime:
+        if game_clock.get_ticks() - self.spawn_time > self.lifetime:
             self.alive = False
 
-    def draw(self, surface, camera_offset):
-        """Draw the particle."""
+    def get_blit(self, camera_offset, view_size):
+        """Return a (surface, position) pair for the particle, or None if off-screen."""
         screen_x = int(self.pos.x - camera_offset.x)
         screen_y = int(self.pos.y - camera_offset.y)
-        if 0 <= screen_x <= surface.get_width() and 0 <= screen_y <= surface.get_height():
-            pygame.draw.circle(surface, self.color, (screen_x, screen_y), max(1, int(self.size)))
+        if 0 <= screen_x <= view_size[0] and 0 <= screen_y <= view_size[1]:
+            radius = max(1, int(self.size))
+            return (_get_particle_surface(self.color, radius), (screen_x - radius, screen_y - radius))
+        return None
+
+    def draw(self, surface, camera_offset):
+        """Draw the particle."""
+        blit = self.get_blit(camera_offset, surface.get_size())
+        if blit:
+            surface.blit(*blit)
+
 
+_particle_cache = {}
+
+
+def _get_particle_surface(color, radius):
+    """Get a cached pre-rendered particle circle."""
+    key = (color, radius)
+    surf = _particle_cache.get(key)
+    if surf is None:
+        size = radius * 2 + 1
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        _particle_cache[key] = surf
+    return surf
 
 class ParticleManager:
     """Manages all active particles."""
@@ -43,8 +67,11 @@ class ParticleManager:
     def __init__(self):
         self.particles = []
 
-    def emit(self, x, y, color, count=PARTICLE_COUNT):
-        """Spawn a burst of particles."""
+    def emit(self, x, y, color, count=None):
+        """Spawn a burst of particles (fewer at lower quality levels)."""
+        if count is None:
+            count = PARTICLE_COUNT
+        count = max(1, round(count * quality.get("particle_scale")))
         for _ in range(count):
             self.particles.append(Particle(x, y, color))
 
@@ -54,7 +81,15 @@ class ParticleManager:
         for p in self.particles:
             p.update()
 
+    def get_blits(self, camera_offset, view_size):
+        """Collect (surface, position) pairs for all visible particles."""
+        blits = []
+        for p in self.particles:
+            blit = p.get_blit(camera_offset, view_size)
+            if blit:
+                blits.append(blit)
+        return blits
+
     def draw(self, surface, camera_offset):
         """Draw all particles."""
-        for p in self.particles:
-            p.draw(surface, camera_offset)
+        surface.blits(self.get_blits(camera_offset, surface.get_size()), doreturn=False)
@@ -0,0 +1,154 @@
+"""
+Flow-field pathfinding - a shared distance field that steers the horde around obstacles.
+The field is rebuilt only when the player changes grid cell and sampled by every zombie in O(1).
+"""
+import pygame
+import math
+from collections import deque
+from settings import *
+
+
+# Neighbour offsets (d_col, d_row); diagonals are checked for corner cutting
+_ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class FlowField:
+    """Grid distance field from the player's cell, shared by all zombies."""
+
+    def __init__(self, obstacles, cell_size=None, bounds=None):
+        cell_size = cell_size if cell_size is not None else FLOW_FIELD_CELL_SIZE
+        self.cell_size = cell_size
+        # World area covered by the grid (the whole map unless streaming chunks)
+        self.bounds = bounds or pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
+        self.cols = math.ceil(self.bounds.width / cell_size)
+        self.rows = math.ceil(self.bounds.height / cell_size)
+        self.blocked = self._build_occupancy(obstacles)
+        self.distance = [-1] * (self.cols * self.rows)
+        self.target_cell = None
+
+        # Best next cell per grid cell, filled lazily after each rebuild
+        self._next_cell = {}
+
+    def _build_occupancy(self, obstacles):
+        """Mark every cell overlapped by an obstacle (plus clearance) as blocked."""
+        blocked = bytearray(self.cols * self.rows)
+        cs = self.cell_size
+        pad = FLOW_FIELD_CLEARANCE * 2
+        for obstacle in obstacles or ():
+            r = obstacle.collision_rect.inflate(pad, pad).move(-self.bounds.x, -self.bounds.y)
+            start_col = max(0, r.left // cs)
+            end_col = min(self.cols - 1, (r.right - 1) // cs)
+            start_row = max(0, r.top // cs)
+            end_row = min(self.rows - 1, (r.bottom - 1) // cs)
+            for row in range(start_row, end_row + 1):
+                base = row * self.cols
+                for col in range(start_col, end_col + 1):
+                    blocked[base + col] = 1
+        return blocked
+
+    def cell_index(self, x, y):
+        """Get the flat grid index of the cell containing a world position."""
+        col = min(self.cols - 1, max(0, int(x - self.bounds.x) // self.cell_size))
+        row = min(self.rows - 1, max(0, int(y - self.bounds.y) // self.cell_size))
+        return row * self.cols + col
+
+    def update(self, target_pos):
+        """Rebuild the field if the target moved to a new cell. Returns True if rebuilt."""
+        cell = self.cell_index(target_pos.x, target_pos.y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._compute(cell)
+        return True
+
+    def _compute(self, start):
+        """Breadth-first distance field over open cells, seeded at the target cell."""
+        cols, rows = self.cols, self.rows
+        blocked = self.blocked
+        dist = [-1] * (cols * rows)
+        dist[start] = 0
+        queue = deque([start])
+
+        while queue:
+            idx = queue.popleft()
+            d = dist[idx] + 1
+            col = idx % cols
+            if col > 0 and dist[idx - 1] < 0 and not blocked[idx - 1]:
+                dist[idx - 1] = d
+                queue.append(idx - 1)
+            if col < cols - 1 and dist[idx + 1] < 0 and not blocked[idx + 1]:
+                dist[idx + 1] = d
+                queue.append(idx + 1)
+            if idx >= cols and dist[idx - cols] < 0 and not blocked[idx - cols]:
+                dist[idx - cols] = d
+                queue.append(idx - cols)
+            if idx < (rows - 1) * cols and dist[idx + cols] < 0 and not blocked[idx + cols]:
+                dist[idx + cols] = d
+                queue.append(idx + cols)
+
+        self.distance = dist
+        self._next_cell = {}
+
+    def is_open(self, x, y):
+        """Check a world position is on the grid, not blocked and reachable from the target."""
+        if not self.bounds.collidepoint(x, y):
+            return False
+        idx = self.cell_index(x, y)
+        return not self.blocked[idx] and self.distance[idx] >= 0
+
+    def _open(self, col, row):
+        """Check whether a cell is inside the grid and has been reached."""
+        return 0 <= col < self.cols and 0 <= row < self.rows and self.distance[row * self.cols + col] >= 0
+
+    def _best_neighbor(self, idx):
+        """Find the neighbouring cell with the lowest distance (no corner cutting)."""
+        if idx in self._next_cell:
+            return self._next_cell[idx]
+
+        cols = self.cols
+        col, row = idx % cols, idx // cols
+        best = None
+        best_dist = self.distance[idx] if self.distance[idx] >= 0 else math.inf
+
+        for dc, dr in _ORTHOGONAL:
+            if self._open(col + dc, row + dr):
+                n = (row + dr) * cols + col + dc
+                if self.distance[n] < best_dist:
+                    best, best_dist = n, self.distance[n]
+
+        for dc, dr in _DIAGONAL:
+            if (
+                self._open(col + dc, row + dr)
+                and self._open(col + dc, row)
+                and self._open(col, row + dr)
+            ):
+                n = (row + dr) * cols + col + dc
+                # Diagonals only win when they skip a whole step
+                if self.distance[n] < best_dist:
+                    best, best_dist = n, self.distance[n]
+
+        self._next_cell[idx] = best
+        return best
+
+    def sample(self, pos, target_pos):
+        """
+        Get the steering direction (unnormalized Vector2) for an entity at pos.
+        Falls back to heading straight for the target near it or off the field.
+        """
+        if not self.bounds.collidepoint(pos.x, pos.y):
+            return target_pos - pos
+
+        idx = self.cell_index(pos.x, pos.y)
+        d = self.distance[idx]
+        if 0 <= d <= 1:
+            return target_pos - pos
+
+        best = self._best_neighbor(idx)
+        if best is None:
+            return target_pos - pos
+
+        cs = self.cell_size
+        next_x = self.bounds.x + (best % self.cols) * cs + cs / 2
+        next_y = self.bounds.y + (best // self.cols) * cs + cs / 2
+        return pygame.math.Vector2(next_x - pos.x, next_y - pos.y)
@@ -3,6 +3,7 @@ Player entity - movement, rotation, health, and weapon management.
 """
 import pygame
 import math
+import game_clock
 from settings import *
 
 
@@ -42,18 +43,10 @@ class Player(pygame.sprite.Sprite):
     def weapon(self):
         return WEAPONS[self.current_weapon]
 
-    def handle_input(self, camera):
-        """Handle movement and aiming."""
-        keys = pygame.key.get_pressed()
-        dx, dy = 0, 0
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -self.speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = self.speed
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -self.speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = self.speed
+    def handle_input(self, controls):
+        """Apply movement and aiming from this tick's Controls."""
+        dx = controls.move_x * self.speed
+        dy = controls.move_y * self.speed
 
         # Normalize diagonal movement
         if dx != 0 and dy != 0:
@@ -64,16 +57,15 @@ class Player(pygame.sprite.Sprite):
         self.pos.y += dy
 
         # Clamp to world
-        self.pos.x = max(PLAYER_SIZE, min(self.pos.x, WORLD_WIDTH - PLAYER_SIZE))
-        self.pos.y = max(PLAYER_SIZE, min(self.pos.y, WORLD_HEIGHT - PLAYER_SIZE))
+        if not WORLD_STREAMING:
+            self.pos.x = max(PLAYER_SIZE, min(self.pos.x, WORLD_WIDTH - PLAYER_SIZE))
+            self.pos.y = max(PLAYER_SIZE, min(self.pos.y, WORLD_HEIGHT - PLAYER_SIZE))
 
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
-        # Aim toward mouse (world position)
-        mouse_screen = pygame.mouse.get_pos()
-        mouse_world = camera.reverse(mouse_screen)
-        rel_x = mouse_world[0] - self.pos.x
-        rel_y = mouse_world[1] - self.pos.y
+        # Aim toward the aim point (world position)
+        rel_x = controls.aim_x - self.pos.x
+        rel_y = controls.aim_y - self.pos.y
         self.angle = math.degrees(math.atan2(-rel_y, rel_x))
 
         # Rotate image
@@ -81,12 +73,10 @@ class Player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=self.rect.center)
 
         # Weapon switching
-        if keys[pygame.K_1]:
-            self.switch_weapon("pistol")
-        elif keys[pygame.K_2]:
-            self.switch_weapon("shotgun")
-        elif keys[pygame.K_3]:
-            self.switch_weapon("rifle")
+        if controls.weapon:
+            self.switch_weapon(controls.weapon)
+        if controls.reload:
+            self.start_reload()
 
     def switch_weapon(self, weapon_name):
         """Switch to a different weapon."""
@@ -96,7 +86,7 @@ class Player(pygame.sprite.Sprite):
 
     def can_shoot(self):
         """Check if player can fire."""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.reloading:
             if now - self.reload_start >= self.weapon["reload_time"]:
                 self.ammo[self.current_weapon] = self.weapon["mag_size"]
@@ -116,13 +106,13 @@ class Player(pygame.sprite.Sprite):
     def shoot(self):
         """Consume ammo and mark shot time."""
         self.ammo[self.current_weapon] -= 1
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = game_clock.get_ticks()
 
     def start_reload(self):
         """Begin reload timer."""
         if not self.reloading and self.ammo[self.current_weapon] < self.weapon["mag_size"]:
             self.reloading = True
-            self.reload_start = pygame.time.get_ticks()
+            self.reload_start = game_clock.get_ticks()
 
     def take_damage(self, amount):
         """Receive damage."""
@@ -136,6 +126,6 @@ class Player(pygame.sprite.Sprite):
         """Heal player."""
         self.hp = min(self.max_hp, self.hp + amount)
 
-    def update(self, camera):
+    def update(self, controls):
         """Update player per frame."""
-        self.handle_input(camera)
+        self.handle_input(controls)
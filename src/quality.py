@@ -0,0 +1,63 @@
+"""
+Adaptive render quality - a governor watches frame work time and steps through
+QUALITY_LEVELS, trading visual detail for frame rate when a wave gets heavy and
+restoring it once there is headroom again. Systems read the active level through get().
+"""
+from settings import *
+
+
+_level = 0
+
+
+def get(name):
+    """Value of a QUALITY_LEVELS setting at the active level."""
+    return QUALITY_LEVELS[_level][name]
+
+
+def get_level():
+    return _level
+
+
+def set_level(level):
+    global _level
+    _level = max(0, min(level, len(QUALITY_LEVELS) - 1))
+
+
+class QualityGovernor:
+    """
+    Steps quality down after QUALITY_DOWN_FRAMES frames over budget and back up after
+    the longer QUALITY_UP_FRAMES well under it, with a cooldown after every change.
+    """
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = budget_ms if budget_ms is not None else 1000 / FPS
+        self.average_ms = 0.0
+        self.frames_over = 0
+        self.frames_under = 0
+        self.cooldown = 0
+
+    def update(self, work_ms):
+        """Feed one frame's work time (update + draw, excluding the frame-cap sleep)."""
+        self.average_ms += (work_ms - self.average_ms) * QUALITY_SMOOTHING
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+
+        if self.average_ms > self.budget_ms * QUALITY_DOWN_LOAD:
+            self.frames_over += 1
+            self.frames_under = 0
+        elif self.average_ms < self.budget_ms * QUALITY_UP_LOAD:
+            self.frames_under += 1
+            self.frames_over = 0
+        else:
+            self.frames_over = self.frames_under = 0
+
+        if self.frames_over >= QUALITY_DOWN_FRAMES and _level < len(QUALITY_LEVELS) - 1:
+            self._change(_level + 1)
+        elif self.frames_under >= QUALITY_UP_FRAMES and _level > 0:
+            self._change(_level - 1)
+
+    def _change(self, level):
+        set_level(level)
+        self.frames_over = self.frames_under = 0
+        self.cooldown = QUALITY_COOLDOWN_FRAMES
@@ -0,0 +1,138 @@
+"""
+Render frames - immutable per-tick views of everything the renderer needs (draw lists,
+camera offset, HUD values), so drawing never reads live simulation state. With the
+threaded simulation, frames are handed over through a double buffer.
+"""
+import threading
+from operator import itemgetter
+import game_clock
+from settings import *
+
+
+class PlayerHud:
+    """The player values shown on the HUD and game-over screen."""
+
+    __slots__ = ("hp", "max_hp", "current_weapon", "ammo", "reloading", "score", "kills")
+
+    def __init__(self, player):
+        self.hp = player.hp
+        self.max_hp = player.max_hp
+        self.current_weapon = player.current_weapon
+        self.ammo = dict(player.ammo)
+        self.reloading = player.reloading
+        self.score = player.score
+        self.kills = player.kills
+
+
+class LevelHud:
+    """The wave values shown on the HUD and game-over screen."""
+
+    __slots__ = ("wave", "wave_active", "wave_announce_time", "announce_duration",
+                 "between_waves", "wave_complete", "between_wave_start", "between_wave_duration")
+
+    def __init__(self, level_manager):
+        for name in self.__slots__:
+            setattr(self, name, getattr(level_manager, name))
+
+    def is_announcing(self):
+        return (
+            self.wave_active
+            and game_clock.get_ticks() - self.wave_announce_time < self.announce_duration
+        )
+
+    def get_wave_text(self):
+        return f"WAVE {self.wave}"
+
+
+class RenderFrame:
+    """One tick's draw lists in screen space plus HUD values."""
+
+    __slots__ = ("cam_x", "cam_y", "entity_layer", "particle_layer", "player", "level")
+
+    def __init__(self, cam_x, cam_y, entity_layer, particle_layer, player, level):
+        self.cam_x = cam_x
+        self.cam_y = cam_y
+        self.entity_layer = entity_layer
+        self.particle_layer = particle_layer
+        self.player = player
+        self.level = level
+
+    def reverse(self, screen_pos):
+        """Convert screen position to world position (as Camera.reverse, for this frame)."""
+        return (screen_pos[0] + self.cam_x, screen_pos[1] + self.cam_y)
+
+
+def ground_blits(tile, cam_x, cam_y):
+    """(surface, position) pairs tiling the ground across the view at (cam_x, cam_y)."""
+    tile_size = TILE_SIZE
+    start_col = cam_x // tile_size
+    end_col = (cam_x + SCREEN_WIDTH) // tile_size + 1
+    start_row = cam_y // tile_size
+    end_row = (cam_y + SCREEN_HEIGHT) // tile_size + 1
+    if not WORLD_STREAMING:
+        start_col = max(0, start_col)
+        end_col = min(WORLD_WIDTH // tile_size, end_col)
+        start_row = max(0, start_row)
+        end_row = min(WORLD_HEIGHT // tile_size, end_row)
+
+    return [
+        (tile, (col * tile_size - cam_x, row * tile_size - cam_y))
+        for row in range(start_row, end_row)
+        for col in range(start_col, end_col)
+    ]
+
+
+def capture_render_frame(game):
+    """Build the RenderFrame for the game's current state."""
+    camera = game.camera
+    cam_x = int(camera.offset.x)
+    cam_y = int(camera.offset.y)
+
+    # Bullets go first so they sit underneath everything else
+    entity_layer = game.bullets.get_blits(cam_x, cam_y)
+
+    # Y-sort rendering for depth (obstacles, zombies, player) as (rect bottom, blits)
+    draw_items = []
+    if game.obstacles:
+        draw_items.extend((obstacle.rect.bottom, obstacle.get_blits(camera)) for obstacle in game.obstacles)
+    if game.zombies:
+        draw_items.extend(game.zombies.get_draw_items(cam_x, cam_y))
+    player = game.player
+    draw_items.append((player.rect.bottom, [(player.image, (player.rect.x - cam_x, player.rect.y - cam_y))]))
+
+    draw_items.sort(key=itemgetter(0))
+
+    for _, blits in draw_items:
+        entity_layer.extend(blits)
+
+    particle_layer = game.particles.get_blits(camera.offset, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    return RenderFrame(
+        cam_x, cam_y, entity_layer, particle_layer,
+        PlayerHud(game.player), LevelHud(game.level_manager),
+    )
+
+
+class FrameBuffer:
+    """
+    Double buffer between the simulation thread (publish) and the render thread (latest).
+    The simulation fills the back slot, then flips it to the front under the lock.
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, frame):
+        back = 1 - self._front
+        self._slots[back] = frame
+        with self._lock:
+            self._front = back
+
+    def latest(self):
+        with self._lock:
+            return self._slots[self._front]
+
+    def clear(self):
+        with self._lock:
+            self._slots = [None, None]
@@ -0,0 +1,85 @@
+"""
+Internal render scale - the world is drawn into a smaller offscreen buffer and scaled
+up to the display once per frame, trading sharpness for fill rate. Draw lists keep
+their native screen coordinates; surfaces are downscaled on first use and cached.
+"""
+import math
+import weakref
+import pygame
+from settings import *
+
+
+class ScaledWorldBuffer:
+    """Low-resolution target for the world layers (ground, entities, particles)."""
+
+    def __init__(self, scale, smooth=None):
+        self.scale = scale
+        self.smooth = smooth if smooth is not None else RENDER_SCALE_SMOOTH
+        self.surface = pygame.Surface((round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))).convert()
+        # Entries vanish with their source surface (e.g. a zombie's replaced rotation)
+        self._scaled = weakref.WeakKeyDictionary()
+
+    def scaled(self, surface):
+        """`surface` at render scale, rounded up so neighbouring tiles never leave gaps."""
+        small = self._scaled.get(surface)
+        if small is None:
+            w, h = surface.get_size()
+            size = (max(1, math.ceil(w * self.scale)), max(1, math.ceil(h * self.scale)))
+            small = self._scaled[surface] = pygame.transform.scale(surface, size)
+        return small
+
+    def invalidate(self, surface):
+        """Forget the cached downscale of a surface that has been drawn into."""
+        self._scaled.pop(surface, None)
+
+    def fill(self, color, rect=None):
+        if rect is not None:
+            s = self.scale
+            rect = pygame.Rect(rect[0] * s, rect[1] * s, math.ceil(rect[2] * s), math.ceil(rect[3] * s))
+        self.surface.fill(color, rect)
+
+    def blits(self, layer):
+        """Draw a native-resolution (surface, position) list at render scale."""
+        s = self.scale
+        scaled = self.scaled
+        self.surface.blits(
+            [(scaled(surf), (int(pos[0] * s), int(pos[1] * s))) for surf, pos in layer],
+            doreturn=False,
+        )
+
+    def draw_rect(self, color, rect, width):
+        s = self.scale
+        pygame.draw.rect(
+            self.surface, color,
+            pygame.Rect(rect[0] * s, rect[1] * s, rect[2] * s, rect[3] * s),
+            max(1, round(width * s)),
+        )
+
+    def present(self, screen):
+        """Scale the buffer up over the whole display."""
+        if self.smooth:
+            pygame.transform.smoothscale(self.surface, screen.get_size(), screen)
+        else:
+            pygame.transform.scale(self.surface, screen.get_size(), screen)
+
+
+class NativeWorldTarget:
+    """Same interface as ScaledWorldBuffer, drawing straight to the display."""
+
+    def __init__(self, screen):
+        self.surface = screen
+
+    def invalidate(self, surface):
+        pass
+
+    def fill(self, color, rect=None):
+        self.surface.fill(color, rect)
+
+    def blits(self, layer):
+        self.surface.blits(layer, doreturn=False)
+
+    def draw_rect(self, color, rect, width):
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def present(self, screen):
+        pass
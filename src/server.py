@@ -0,0 +1,292 @@
+"""
+Authoritative game server - runs the simulation headlessly and streams quantized,
+delta-compressed snapshots to clients over UDP. Each client only receives the entities
+around its own view (capped at NET_MAX_ENTITIES), so per-client bandwidth and encoding
+cost stay flat however large the horde gets. The first client to connect controls the
+player; later clients spectate.
+
+Usage:
+    python src/server.py --difficulty hard
+    python src/client.py
+"""
+import os
+import sys
+import math
+import time
+import socket
+import argparse
+import itertools
+
+# The server never opens a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Ensure we can import from src/
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import game_clock
+from settings import *
+from controls import Controls
+from bullet import WEAPON_NAMES
+from net_protocol import (
+    MSG_HELLO, MSG_INPUT, MSG_BYE, NO_BASELINE, KIND_PLAYER, KIND_ZOMBIE, KIND_BULLET,
+    net_id, quantize, message_type, decode_input, encode_welcome, encode_snapshot,
+)
+
+
+class RemoteControls:
+    """Stands in for a bot: replays the controlling client's latest input."""
+
+    def __init__(self):
+        self.controls = Controls()
+
+    def get_controls(self, game):
+        return self.controls
+
+
+class ClientSession:
+    """Server-side state for one connected client."""
+
+    def __init__(self, address, is_controller):
+        self.address = address
+        self.is_controller = is_controller
+        self.view = None                 # client's camera center, world coords
+        self.acked_tick = NO_BASELINE
+        self.sent = {}                   # tick -> states, the candidate delta baselines
+        self.last_heard = time.monotonic()
+        # Bullet handles are recycled, so in-view bullets get session-unique net ids
+        self.bullet_ids = {}             # bullet handle -> net id
+        self.next_bullet_id = itertools.count()
+
+
+class GameServer:
+    """Fixed-rate authoritative simulation plus per-client snapshot streaming."""
+
+    def __init__(self, difficulty_key, host="127.0.0.1", port=None):
+        from main import Game
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port if port is not None else NET_PORT))
+        self.sock.setblocking(False)
+
+        self.remote = RemoteControls()
+        self.game = Game(headless=True, bot=self.remote)
+        self.game._start_game(difficulty_key)
+        self.difficulty_key = difficulty_key
+        self.game_over_time = None
+
+        self.clients = {}
+        self.tick = 0
+
+        # Stats for the periodic status line
+        self.tick_ms_total = 0.0
+        self.ticks_measured = 0
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+
+    def serve_forever(self):
+        """Tick at NET_TICK_RATE until interrupted."""
+        period = 1.0 / NET_TICK_RATE
+        next_tick = time.perf_counter()
+        next_report = time.monotonic() + 5
+        while True:
+            start = time.perf_counter()
+            self._receive()
+            self._step()
+            self.tick_ms_total += (time.perf_counter() - start) * 1000
+            self.ticks_measured += 1
+
+            if time.monotonic() >= next_report:
+                next_report += 5
+                self._report()
+
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
+
+    # ─── Networking ────────────────────────────────────────
+    def _receive(self):
+        while True:
+            try:
+                data, address = self.sock.recvfrom(NET_MAX_PACKET)
+            except (BlockingIOError, ConnectionResetError):
+                return
+
+            kind = message_type(data)
+            session = self.clients.get(address)
+            if kind == MSG_HELLO:
+                if session is None:
+                    is_controller = not any(s.is_controller for s in self.clients.values())
+                    session = self.clients[address] = ClientSession(address, is_controller)
+                session.last_heard = time.monotonic()
+                self.sock.sendto(
+                    encode_welcome(self.difficulty_key, session.is_controller, self.game.obstacles.sprites()),
+                    address,
+                )
+            elif kind == MSG_INPUT and session is not None:
+                ack, controls, view = decode_input(data)
+                session.last_heard = time.monotonic()
+                session.view = view
+                if ack in session.sent and (session.acked_tick == NO_BASELINE or ack > session.acked_tick):
+                    session.acked_tick = ack
+                if session.is_controller:
+                    self.remote.controls = controls
+            elif kind == MSG_BYE and session is not None:
+                self._drop(session)
+
+    def _drop(self, session):
+        del self.clients[session.address]
+        if session.is_controller:
+            self.remote.controls = Controls()
+
+    # ─── Simulation ────────────────────────────────────────
+    def _step(self):
+        game = self.game
+        if game.state == STATE_PLAYING:
+            game._update()
+        elif self.game_over_time is None:
+            self.game_over_time = game_clock.get_ticks()
+        elif game_clock.get_ticks() - self.game_over_time >= NET_RESTART_DELAY:
+            # New run on the same layout, so clients keep their obstacles
+            game._start_game(self.difficulty_key, obstacles=game.obstacles)
+            self.game_over_time = None
+
+        self.tick += 1
+        if self.tick % NET_SNAPSHOT_INTERVAL == 0:
+            self._broadcast()
+
+        now = time.monotonic()
+        for session in list(self.clients.values()):
+            if now - session.last_heard > NET_CLIENT_TIMEOUT:
+                self._drop(session)
+
+    # ─── Snapshots ─────────────────────────────────────────
+    def _broadcast(self):
+        if not self.clients:
+            return
+        game = self.game
+        player = game.player
+        player_id = net_id(KIND_PLAYER, 0)
+        player_state = quantize(
+            WEAPON_NAMES.index(player.current_weapon), player.pos.x, player.pos.y,
+            player.angle, player.hp / player.max_hp,
+        )
+        bullets = self._bullet_states()
+        hud = (
+            game.state == STATE_GAME_OVER, player.hp, player.max_hp,
+            WEAPON_NAMES.index(player.current_weapon),
+            tuple(player.ammo[name] for name in WEAPON_NAMES),
+            player.reloading, player.score, player.kills, game.level_manager.wave,
+        )
+
+        zombie_states = {}   # shared between clients whose views overlap
+        store = game.zombies.store
+        c = store.columns
+        xs, ys, angles, hps, max_hps = c["x"], c["y"], c["angle"], c["hp"], c["max_hp"]
+        types, slots = c["type"], c["ai_slot"]
+        for session in self.clients.values():
+            cx, cy = session.view or (player.pos.x, player.pos.y)
+            half_w = SCREEN_WIDTH / 2 + NET_AOI_MARGIN
+            half_h = SCREEN_HEIGHT / 2 + NET_AOI_MARGIN
+            left, top, right, bottom = cx - half_w, cy - half_h, cx + half_w, cy + half_h
+
+            candidates = []
+            for handle in game.bullet_sweeper.zombie_grid.query_rect(left, top, right, bottom):
+                i = store.index_of(handle)
+                if i < 0:
+                    continue
+                x, y = xs[i], ys[i]
+                if left <= x <= right and top <= y <= bottom:
+                    nid = net_id(KIND_ZOMBIE, slots[i])
+                    state = zombie_states.get(nid)
+                    if state is None:
+                        state = zombie_states[nid] = quantize(
+                            types[i], x, y, angles[i], hps[i] / max_hps[i],
+                        )
+                    candidates.append(((x - cx) ** 2 + (y - cy) ** 2, nid, state))
+            bullet_ids = {}
+            for handle, x, y, state in bullets:
+                if left <= x <= right and top <= y <= bottom:
+                    nid = session.bullet_ids.get(handle)
+                    if nid is None:
+                        nid = net_id(KIND_BULLET, next(session.next_bullet_id))
+                    bullet_ids[handle] = nid
+                    candidates.append(((x - cx) ** 2 + (y - cy) ** 2, nid, state))
+            session.bullet_ids = bullet_ids
+
+            if len(candidates) > NET_MAX_ENTITIES - 1:
+                candidates.sort(key=lambda c: c[0])
+                del candidates[NET_MAX_ENTITIES - 1:]
+            states = {nid: state for _, nid, state in candidates}
+            states[player_id] = player_state
+
+            self._send_snapshot(session, states, hud)
+
+    def _bullet_states(self):
+        store = self.game.bullets.store
+        c = store.columns
+        xs, ys, vxs, vys, weapons = c["x"], c["y"], c["vx"], c["vy"], c["weapon"]
+        return [
+            (
+                store.handle_at(i), xs[i], ys[i],
+                quantize(weapons[i], xs[i], ys[i], math.degrees(math.atan2(-vys[i], vxs[i])), 1.0),
+            )
+            for i in range(store.count)
+        ]
+
+    def _send_snapshot(self, session, states, hud):
+        baseline_tick = session.acked_tick
+        baseline = session.sent.get(baseline_tick)
+        if baseline is None:
+            baseline_tick, baseline = NO_BASELINE, {}
+
+        packet = encode_snapshot(self.tick, baseline_tick, baseline, states, hud)
+        session.sent[self.tick] = states
+        oldest = self.tick - NET_SNAPSHOT_HISTORY * NET_SNAPSHOT_INTERVAL
+        for tick in [t for t in session.sent if t <= oldest]:
+            del session.sent[tick]
+        try:
+            self.sock.sendto(packet, session.address)
+        except OSError:
+            return
+        self.bytes_sent += len(packet)
+        self.snapshots_sent += 1
+
+    def _report(self):
+        ticks = max(1, self.ticks_measured)
+        snapshots = max(1, self.snapshots_sent)
+        print(
+            f"tick {self.tick}  clients {len(self.clients)}  zombies {len(self.game.zombies)}  "
+            f"tick {self.tick_ms_total / ticks:.2f} ms  snapshot {self.bytes_sent / snapshots:.0f} B  "
+            f"{self.bytes_sent / 5 / 1024:.1f} KiB/s",
+            flush=True,
+        )
+        self.tick_ms_total = 0.0
+        self.ticks_measured = 0
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an authoritative ZOMBII server.")
+    parser.add_argument("--difficulty", default="medium", choices=list(DIFFICULTIES))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    args = parser.parse_args()
+
+    if WORLD_STREAMING:
+        parser.error("server mode needs a fixed world; turn WORLD_STREAMING off")
+
+    server = GameServer(args.difficulty, args.host, args.port)
+    print(f"Serving {args.difficulty} on udp://{args.host}:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
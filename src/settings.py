@@ -1,6 +1,8 @@
 """
 Game settings, constants, and difficulty configurations.
 """
+import os
+import sys
 import pygame
 
 # ─── Display ───────────────────────────────────────────────
@@ -8,12 +10,36 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 TITLE = "🧟 ZOMBII - Zombie Shooter"
+RENDER_SCALE = 1.0            # world render resolution relative to the screen (e.g. 0.5 - 1.0)
+RENDER_SCALE_SMOOTH = False   # bilinear upscale of the world buffer instead of nearest
+WINDOW_SCALED = False         # let SDL scale the canvas to the desktop/window (pygame.SCALED)
+WINDOW_RESIZABLE = False      # resizable window; the canvas is scaled to fit (implies SCALED)
+# "hybrid" paces more evenly than "sleep" but busy-waits the last FRAME_PACING_SPIN of
+# every frame, keeping a CPU core busy (costly on battery), so it is opt-in
+FRAME_PACING = "sleep"        # "sleep", "hybrid" (sleep + spin), "vsync" or "uncapped"
+FRAME_PACING_SPIN = 0.002     # s before the deadline the hybrid pacer stops sleeping and spins
+FRAME_PACING_WINDOW = 600     # recent frame intervals kept for jitter percentiles
+FRAME_PACING_REPORT = False   # print the pacing summary when the game exits
+
+# ─── Startup ───────────────────────────────────────────────
+# Bundled read-only data sits next to the sources, or in PyInstaller's unpack dir
+BUNDLE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+ASSET_PACK_FILE = os.path.join(BUNDLE_DIR, "assets.pak")  # built by src/bake_assets.py
+STARTUP_PROFILE = bool(os.environ.get("ZOMBII_STARTUP_PROFILE"))  # time-to-first-frame report
+STARTUP_BUDGET_MS = 500
 
 # ─── World ─────────────────────────────────────────────────
 WORLD_WIDTH = 3000
 WORLD_HEIGHT = 3000
 TILE_SIZE = 64
 
+# ─── Streamed World ────────────────────────────────────────
+WORLD_STREAMING = False       # Chunked, effectively unbounded world instead of the fixed map
+WORLD_SEED = None             # Seed for procedural chunks (None = random per game)
+CHUNK_SIZE = 1024             # px per chunk side
+CHUNK_ACTIVE_RADIUS = 1       # Chunks around the player's chunk kept active
+CHUNK_OBSTACLE_COUNT = 6      # Obstacles generated per chunk
+
 # ─── Colors ────────────────────────────────────────────────
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -176,6 +202,11 @@ PARTICLE_COUNT = 8
 PARTICLE_SPEED = 4
 PARTICLE_LIFETIME = 300  # ms
 
+# ─── Decals ────────────────────────────────────────────────
+DECAL_TILE_SIZE = 512         # px per world-space decal tile (1 MiB each)
+DECAL_MAX_TILES = 24          # memory budget; least recently used tiles are evicted
+DECAL_VARIANTS = 4            # pre-rendered variants per decal kind
+
 # ─── Obstacles ─────────────────────────────────────────────
 OBSTACLE_TYPES = {
     "barricade": {"width": 80, "height": 30, "weight": 30},
@@ -186,7 +217,111 @@ OBSTACLE_TYPES = {
 }
 OBSTACLE_COUNT = 40          # Total obstacles in the world
 OBSTACLE_MIN_DIST = 120       # Min distance between obstacles
+OBSTACLE_PLAYER_CLEARANCE = 200  # No obstacles this close to the player start
 COVER_DAMAGE_REDUCTION = 0.8  # 80% damage blocked when behind cover
+COVER_HIDE_DIST = 70          # Player must be this close to an obstacle to hide behind it
+COVER_LINE_DIST = 40          # Max obstacle distance from the zombie→player line
+
+# ─── Visibility Cache ──────────────────────────────────────
+VISIBILITY_CELL_SIZE = 32     # px per player cell of the cover tables
+VISIBILITY_SECTORS = 32       # angular sectors per cell
+
+# ─── Pathfinding ───────────────────────────────────────────
+FLOW_FIELD_CELL_SIZE = 40     # px per flow-field grid cell
+FLOW_FIELD_CLEARANCE = 12     # px of padding around obstacles when blocking cells
+
+# ─── AI Level of Detail ────────────────────────────────────
+AI_LOD_NEAR_DIST = 700        # px from player: full update every frame
+AI_LOD_MID_DIST = 1400        # px from player: update every AI_LOD_MID_INTERVAL frames
+AI_LOD_MID_INTERVAL = 2
+AI_LOD_FAR_INTERVAL = 4       # beyond AI_LOD_MID_DIST
+AI_LOD_VIEW_MARGIN = 100      # px around the screen still treated as visible
+
+# ─── Crowd Separation ──────────────────────────────────────
+CROWD_SEPARATION_FACTOR = 0.9    # fraction of sprite size zombies keep between centers
+CROWD_SEPARATION_STRENGTH = 0.5  # fraction of the overlap resolved per frame
+CROWD_MAX_PUSH = 3.0             # px cap on separation movement per frame
+
+# ─── Spawning ──────────────────────────────────────────────
+SPAWN_MIN_DIST = 400          # px from the player
+SPAWN_MAX_DIST = 800
+SPAWN_BURST_MAX = 5           # Largest group spawned at once
+SPAWN_BURST_WAVE_STEP = 2     # Waves per +1 to the burst size cap
+SPAWN_GROUP_SPREAD = 60       # px scatter of a burst around its spawn point
+SPAWN_POINT_ATTEMPTS = 12     # Candidate positions tried per spawn point / zombie
+
+# ─── Collision ─────────────────────────────────────────────
+COLLISION_GRID_CELL_SIZE = 64    # px per cell of the bullet sweep grids
+
+# ─── Save / Load ───────────────────────────────────────────
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".zombii")
+SAVE_FILE = os.path.join(DATA_DIR, "save.zsav")
+FONT_CACHE_FILE = os.path.join(DATA_DIR, "fonts.json")  # resolved UI font files
+AUTOSAVE_ENABLED = False      # Periodically snapshot the run in the background
+AUTOSAVE_INTERVAL = 30000     # ms between autosaves
+SAVE_COMPRESSION_LEVEL = 6    # zlib level used by the writer thread
+
+# ─── Adaptive Quality ──────────────────────────────────────
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_SMOOTHING = 0.1          # EMA weight of the newest frame time
+QUALITY_DOWN_LOAD = 0.9          # step down above this fraction of the frame budget...
+QUALITY_DOWN_FRAMES = 30         # ...sustained this many frames
+QUALITY_UP_LOAD = 0.55           # step up below this fraction of the budget...
+QUALITY_UP_FRAMES = 240          # ...sustained this many frames
+QUALITY_COOLDOWN_FRAMES = 60     # frames to let a change settle before the next
+
+# Highest quality first
+QUALITY_LEVELS = [
+    {"label": "HIGH", "particle_scale": 1.0, "shadows": True, "health_bars": True,
+     "rotation_step": 1, "ai_interval_scale": 1, "ground_tiles": True},
+    {"label": "MEDIUM", "particle_scale": 0.6, "shadows": True, "health_bars": True,
+     "rotation_step": 4, "ai_interval_scale": 1.5, "ground_tiles": True},
+    {"label": "LOW", "particle_scale": 0.3, "shadows": False, "health_bars": True,
+     "rotation_step": 8, "ai_interval_scale": 2, "ground_tiles": True},
+    {"label": "MINIMAL", "particle_scale": 0.15, "shadows": False, "health_bars": False,
+     "rotation_step": 15, "ai_interval_scale": 3, "ground_tiles": False},
+]
+
+# ─── Threading ─────────────────────────────────────────────
+THREADED_SIMULATION = False  # simulate on a worker thread, render on the main thread
+SIM_TICK_RATE = FPS           # fixed simulation ticks per second in threaded mode
+
+# ─── Async Main Loop ───────────────────────────────────────
+ASYNC_MAIN_LOOP = False       # pace frames on an asyncio loop with side tasks between them
+CONTROL_SOCKET_PORT = None    # localhost port for the line-based control socket, None = off
+METRICS_EXPORT_FILE = os.path.join(DATA_DIR, "metrics.json")  # None = off
+METRICS_EXPORT_INTERVAL = 5.0  # s
+
+# ─── Network (server mode) ─────────────────────────────────
+NET_PORT = 47800
+NET_TICK_RATE = FPS           # server simulation ticks per second
+NET_SNAPSHOT_INTERVAL = 2     # ticks between snapshots (30 Hz)
+NET_SNAPSHOT_HISTORY = 32     # sent snapshots kept per client as delta baselines
+NET_AOI_MARGIN = 200          # px around a client's view that it receives entities for
+NET_MAX_ENTITIES = 64         # nearest entities per snapshot, keeps packets under ~1.2 KB
+NET_INTERP_DELAY = 100        # ms clients render behind the newest snapshot
+NET_CLIENT_TIMEOUT = 5.0      # s without input before a client is dropped
+NET_HELLO_INTERVAL = 500      # ms between connection attempts
+NET_RESTART_DELAY = 5000      # ms after game over before the server starts a new run
+NET_MAX_PACKET = 65507
+
+# ─── Garbage Collection ────────────────────────────────────
+GC_POLICY_ENABLED = True
+GC_WAVE_THRESHOLDS = (20000, 50, 100)  # gc thresholds during a wave; None disables automatic GC
+GC_WAVE_GEN0_LIMIT = 200000  # young-gen pass if allocations pile up while GC is disabled
+
+# ─── Telemetry ─────────────────────────────────────────────
+TELEMETRY_ENABLED = False
+TELEMETRY_DIR = os.path.join(DATA_DIR, "telemetry")
+TELEMETRY_CAPACITY = 4096          # records in the ring buffer
+TELEMETRY_FLUSH_INTERVAL = 1.0     # s between background flushes
+
+# ─── Memory Instrumentation ────────────────────────────────
+MEMORY_PROBE_ENABLED = False  # tracemalloc/GC sampling for soak runs (slows the game)
+MEMORY_PROBE_INTERVAL = 30000  # ms between samples
+MEMORY_PROBE_TRACE_DEPTH = 1  # traceback frames kept per allocation
+MEMORY_PROBE_TOP_LINES = 10   # growth hot spots listed per sample
+MEMORY_PROBE_REPORT = os.path.join(DATA_DIR, "memory_report.json")
 
 # ─── Game States ───────────────────────────────────────────
 STATE_MENU = "menu"
@@ -0,0 +1,294 @@
+"""
+World snapshots - compact, versioned binary save format plus a background autosaver.
+State is packed with fixed struct records (no pickling of sprites); timers are stored
+as ages relative to the capture time so a restored run resumes mid-wave.
+"""
+import os
+import zlib
+import queue
+import struct
+import threading
+import pygame
+import game_clock
+from settings import *
+from zombie import ZOMBIE_KEYS
+from bullet import WEAPON_NAMES
+from obstacle import Obstacle
+from particles import Particle
+
+
+SNAPSHOT_MAGIC = b"ZMBS"
+SNAPSHOT_VERSION = 2
+
+_DIFFICULTY_KEYS = list(DIFFICULTIES)
+_OBSTACLE_KEYS = list(OBSTACLE_TYPES)
+
+# Record layouts (little-endian, no padding)
+_HEADER = struct.Struct("<4sHB?I")        # magic, version, difficulty, streaming, world seed
+_PLAYER = struct.Struct("<ffffB3H?iiII")  # x, y, angle, hp, weapon, ammo x3, reloading, reload age, shot age, score, kills
+_LEVEL = struct.Struct("<4H3?2i")         # wave, spawned, to spawn, killed, active, complete, between, announce/break ages
+_CAMERA = struct.Struct("<ff")
+_COUNTS = struct.Struct("<4I")            # obstacles, zombies, bullets, particles
+_OBSTACLE = struct.Struct("<Bii")         # type, x, y
+_ZOMBIE = struct.Struct("<Bfffiff")       # type, x, y, hp, attack age, wobble offset, wobble timer
+_BULLET = struct.Struct("<Bffffi")        # weapon, x, y, vx, vy, age
+_PARTICLE = struct.Struct("<ffff3Bfii")   # x, y, vx, vy, color, size, age, lifetime
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot blob cannot be restored."""
+
+
+def capture_snapshot(game):
+    """Pack the simulation state of a running game into bytes."""
+    now = game_clock.get_ticks()
+    player = game.player
+    level = game.level_manager
+    world = game.world
+
+    zombies = game.zombies.rows()
+    if world:
+        for chunk in world.chunks.values():
+            zombies.extend(chunk.dormant_zombies)
+    # Streamed obstacles are regenerated from the seed, so only fixed maps store them
+    obstacles = [] if world else list(game.obstacles)
+    particles = game.particles.particles
+
+    parts = [
+        _HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+            _DIFFICULTY_KEYS.index(game.difficulty_key),
+            world is not None, world.seed if world else 0,
+        ),
+        _PLAYER.pack(
+            player.pos.x, player.pos.y, player.angle, player.hp,
+            player.weapons_list.index(player.current_weapon),
+            *(player.ammo[w] for w in player.weapons_list),
+            player.reloading, now - player.reload_start, now - player.last_shot_time,
+            player.score, player.kills,
+        ),
+        _LEVEL.pack(
+            level.wave, level.zombies_spawned, level.zombies_to_spawn, level.zombies_killed,
+            level.wave_active, level.wave_complete, level.between_waves,
+            now - level.wave_announce_time, now - level.between_wave_start,
+        ),
+        _CAMERA.pack(game.camera.offset.x, game.camera.offset.y),
+        _COUNTS.pack(len(obstacles), len(zombies), len(game.bullets), len(particles)),
+    ]
+
+    parts.extend(
+        _OBSTACLE.pack(_OBSTACLE_KEYS.index(o.obstacle_type), int(o.pos.x), int(o.pos.y))
+        for o in obstacles
+    )
+    parts.extend(
+        _ZOMBIE.pack(
+            z["type"], z["x"], z["y"], z["hp"],
+            now - z["last_attack"], z["wobble_offset"], z["wobble_timer"],
+        )
+        for z in zombies
+    )
+    c = game.bullets.store.columns
+    parts.extend(
+        _BULLET.pack(
+            c["weapon"][i], c["x"][i], c["y"][i],
+            c["vx"][i], c["vy"][i], now - c["spawn_time"][i],
+        )
+        for i in range(len(game.bullets))
+    )
+    parts.extend(
+        _PARTICLE.pack(
+            p.pos.x, p.pos.y, p.vel.x, p.vel.y, *p.color, p.size,
+            now - p.spawn_time, p.lifetime,
+        )
+        for p in particles
+    )
+    return b"".join(parts)
+
+
+def restore_snapshot(game, blob):
+    """Rebuild a game from a snapshot made by capture_snapshot."""
+    if len(blob) < _HEADER.size:
+        raise SnapshotError("Snapshot is truncated")
+    magic, version, difficulty_idx, streaming, seed = _HEADER.unpack_from(blob, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a Zombii snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    if streaming != WORLD_STREAMING:
+        mode = "a streamed" if streaming else "a fixed"
+        raise SnapshotError(f"Snapshot is of {mode} world; WORLD_STREAMING is {WORLD_STREAMING}")
+
+    try:
+        offset = _HEADER.size
+        player_rec = _PLAYER.unpack_from(blob, offset)
+        offset += _PLAYER.size
+        level_rec = _LEVEL.unpack_from(blob, offset)
+        offset += _LEVEL.size
+        cam_x, cam_y = _CAMERA.unpack_from(blob, offset)
+        offset += _CAMERA.size
+        n_obstacles, n_zombies, n_bullets, n_particles = _COUNTS.unpack_from(blob, offset)
+        offset += _COUNTS.size
+
+        records = []
+        for rec, count in (
+            (_OBSTACLE, n_obstacles), (_ZOMBIE, n_zombies),
+            (_BULLET, n_bullets), (_PARTICLE, n_particles),
+        ):
+            end = offset + rec.size * count
+            records.append(list(rec.iter_unpack(blob[offset:end])))
+            offset = end
+    except struct.error as e:
+        raise SnapshotError(f"Corrupt snapshot: {e}") from e
+    obstacle_recs, zombie_recs, bullet_recs, particle_recs = records
+
+    now = game_clock.get_ticks()
+    assets = game.assets
+    difficulty_key = _DIFFICULTY_KEYS[difficulty_idx]
+
+    obstacles = None
+    if not streaming:
+        obstacles = pygame.sprite.Group()
+        for type_idx, x, y in obstacle_recs:
+            obs_type = _OBSTACLE_KEYS[type_idx]
+            obstacles.add(Obstacle(x, y, obs_type, assets.get(obs_type)))
+    game._start_game(difficulty_key, obstacles=obstacles, world_seed=seed if streaming else None)
+
+    # Player
+    player = game.player
+    (x, y, player.angle, player.hp, weapon_idx, *ammo,
+     player.reloading, reload_age, shot_age, player.score, player.kills) = player_rec
+    player.pos.update(x, y)
+    player.rect.center = (int(x), int(y))
+    player.current_weapon = player.weapons_list[weapon_idx]
+    for name, count in zip(player.weapons_list, ammo):
+        player.ammo[name] = count
+    player.reload_start = now - reload_age
+    player.last_shot_time = now - shot_age
+
+    # Waves
+    level = game.level_manager
+    (level.wave, level.zombies_spawned, level.zombies_to_spawn, level.zombies_killed,
+     level.wave_active, level.wave_complete, level.between_waves,
+     announce_age, between_age) = level_rec
+    level.wave_announce_time = now - announce_age
+    level.between_wave_start = now - between_age
+    # Re-roll the timeline for whatever is left to spawn this wave
+    level.schedule_spawns(
+        level.zombies_to_spawn - level.zombies_spawned,
+        max(now, level.wave_announce_time + level.announce_duration),
+    )
+
+    game.camera.offset.update(cam_x, cam_y)
+
+    # Stream the world to the restored player position before placing entities
+    world = game.world
+    if world:
+        world.center_key = None
+        if world.update(player.pos, game.zombies):
+            game._build_obstacle_systems()
+
+    # Entities (zombies outside the active chunks go straight back to dormant)
+    zombies = game.zombies
+    c = zombies.store.columns
+    for type_idx, x, y, hp, attack_age, wobble_offset, wobble_timer in zombie_recs:
+        handle = zombies.spawn(x, y, ZOMBIE_KEYS[type_idx])
+        i = zombies.store.index_of(handle)
+        c["hp"][i] = hp
+        c["last_attack"][i] = now - attack_age
+        c["wobble_offset"][i] = wobble_offset
+        c["wobble_timer"][i] = wobble_timer
+        if world and not world.is_active(x, y):
+            world.park(zombies.take(handle))
+
+    bullets = game.bullets
+    for weapon_idx, x, y, vx, vy, age in bullet_recs:
+        handle = bullets.spawn(x, y, 0, WEAPON_NAMES[weapon_idx], spawn_time=now - age)
+        i = bullets.store.index_of(handle)
+        bullets.store.columns["vx"][i] = vx
+        bullets.store.columns["vy"][i] = vy
+
+    for x, y, vx, vy, r, g, b, size, age, lifetime in particle_recs:
+        particle = Particle(x, y, (r, g, b))
+        particle.vel.update(vx, vy)
+        particle.size = size
+        particle.spawn_time = now - age
+        particle.lifetime = lifetime
+        game.particles.particles.append(particle)
+
+
+def write_snapshot_file(path, blob):
+    """Compress and atomically write a snapshot to disk."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(zlib.compress(blob, SAVE_COMPRESSION_LEVEL))
+    os.replace(tmp_path, path)
+
+
+def read_snapshot_file(path):
+    """Read and decompress a snapshot from disk."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return zlib.decompress(data)
+    except zlib.error as e:
+        raise SnapshotError(f"Corrupt save file: {e}") from e
+
+
+class Autosaver:
+    """
+    Captures snapshots on the game thread and compresses/writes them on a background
+    thread. Only the newest pending snapshot is kept, so a slow disk never backs up.
+    """
+
+    def __init__(self, path=None, interval=None):
+        self.path = path if path is not None else SAVE_FILE
+        self.interval = interval if interval is not None else AUTOSAVE_INTERVAL
+        self.last_save = game_clock.get_ticks()
+        self.saves_written = 0
+        self.last_error = None
+        self._pending = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._writer, name="autosave", daemon=True)
+        self._thread.start()
+
+    def save(self, game):
+        """Snapshot the game now and hand it to the writer thread."""
+        self.submit(capture_snapshot(game))
+
+    def submit(self, blob):
+        """Queue a captured snapshot, replacing any that hasn't been written yet."""
+        self.last_save = game_clock.get_ticks()
+        while True:
+            try:
+                self._pending.put_nowait(blob)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def update(self, game):
+        """Autosave if the interval has elapsed."""
+        if game_clock.get_ticks() - self.last_save >= self.interval:
+            self.save(game)
+
+    def _writer(self):
+        while True:
+            blob = self._pending.get()
+            if blob is None:
+                return
+            try:
+                write_snapshot_file(self.path, blob)
+                self.saves_written += 1
+            except OSError as e:
+                self.last_error = e
+
+    def close(self):
+        """Flush the pending snapshot and stop the writer thread (waits up to 5 s)."""
+        try:
+            # Waits for the writer to take the pending snapshot; a stuck disk gives up
+            self._pending.put(None, timeout=5)
+        except queue.Full:
+            return  # The writer is a daemon thread, so exiting doesn't wait for it
+        self._thread.join(timeout=5)
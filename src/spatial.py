@@ -0,0 +1,64 @@
+"""
+Uniform spatial grid - buckets items by world position for fast neighbour queries.
+"""
+
+
+class SpatialGrid:
+    """Hash grid of square cells mapping (col, row) to the items inside."""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Remove all items."""
+        self.cells.clear()
+
+    def cell_of(self, x, y):
+        """Get the (col, row) key for a world position."""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item, x, y):
+        """Add an item at a world position."""
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [item]
+        else:
+            bucket.append(item)
+
+    def insert_rect(self, item, rect):
+        """Add an item to every cell its rect overlaps."""
+        cs = self.cell_size
+        for row in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+            for col in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                bucket = self.cells.get((col, row))
+                if bucket is None:
+                    self.cells[(col, row)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, x, y, radius):
+        """Return all items in cells overlapping the square of `radius` around (x, y)."""
+        cs = self.cell_size
+        start_col, end_col = int((x - radius) // cs), int((x + radius) // cs)
+        start_row, end_row = int((y - radius) // cs), int((y + radius) // cs)
+        found = []
+        for row in range(start_row, end_row + 1):
+            for col in range(start_col, end_col + 1):
+                bucket = self.cells.get((col, row))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def query_rect(self, left, top, right, bottom):
+        """Return the unique items in cells overlapping a world-space box."""
+        cs = self.cell_size
+        found = {}
+        for row in range(int(top // cs), int(bottom // cs) + 1):
+            for col in range(int(left // cs), int(right // cs) + 1):
+                bucket = self.cells.get((col, row))
+                if bucket:
+                    for item in bucket:
+                        found[item] = None
+        return list(found)
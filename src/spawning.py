@@ -0,0 +1,128 @@
+"""
+Zombie spawning - precomputed per-wave spawn timelines with burst groups, O(1) weighted
+type sampling via an alias table, and spawn positions validated against the obstacle
+occupancy grid so zombies never start inside cover or pinned against the world edge.
+"""
+import math
+import random
+from settings import *
+
+
+class AliasTable:
+    """Vose's alias method: O(n) setup, O(1) weighted sampling."""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        n = len(self.items)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        """Pick one item with probability proportional to its weight."""
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+def build_spawn_timeline(total, difficulty, wave, rng=random):
+    """
+    Precompute a wave's spawns as [(offset_ms, group_size), ...].
+    Later waves spawn in bigger bursts; gaps scale with group size so the average
+    rate still follows the difficulty's spawn_interval.
+    """
+    max_burst = min(SPAWN_BURST_MAX, 1 + (wave - 1) // SPAWN_BURST_WAVE_STEP)
+    interval = difficulty["spawn_interval"]
+    timeline = []
+    offset = 0
+    remaining = total
+    while remaining > 0:
+        size = min(remaining, rng.randint(1, max_burst))
+        timeline.append((offset, size))
+        remaining -= size
+        offset += interval * size
+    return timeline
+
+
+class ZombieSpawner:
+    """Places spawn groups around the player at obstacle-free, reachable positions."""
+
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.type_table = AliasTable(ZOMBIE_TYPES, [info["weight"] for info in ZOMBIE_TYPES.values()])
+
+    def _is_valid(self, x, y, flow_field):
+        """Check a candidate position is inside the world, off obstacles and reachable."""
+        if not WORLD_STREAMING and not (20 <= x <= WORLD_WIDTH - 20 and 20 <= y <= WORLD_HEIGHT - 20):
+            return False
+        return flow_field.is_open(x, y)
+
+    def _pick_spawn_point(self, player_pos, flow_field):
+        """Random valid point in the spawn ring around the player, or None."""
+        rng = self.rng
+        for _ in range(SPAWN_POINT_ATTEMPTS):
+            angle = rng.uniform(0, math.tau)
+            dist = rng.uniform(SPAWN_MIN_DIST, SPAWN_MAX_DIST)
+            x = player_pos.x + math.cos(angle) * dist
+            y = player_pos.y + math.sin(angle) * dist
+            if self._is_valid(x, y, flow_field):
+                return x, y
+        return None
+
+    def _scatter_point(self, px, py, flow_field):
+        """Valid point near a spawn point for another member of its group."""
+        rng = self.rng
+        for _ in range(SPAWN_POINT_ATTEMPTS):
+            angle = rng.uniform(0, math.tau)
+            spread = rng.uniform(0, SPAWN_GROUP_SPREAD)
+            x = px + math.cos(angle) * spread
+            y = py + math.sin(angle) * spread
+            if self._is_valid(x, y, flow_field):
+                return x, y
+        return px, py
+
+    def spawn_groups(self, zombies, groups, player_pos, flow_field):
+        """
+        Spawn each group into the ZombieStore around its own spawn point.
+        Returns (spawned, unplaced) where unplaced counts zombies with no valid spot.
+        """
+        rng = self.rng
+        spawned = 0
+        unplaced = 0
+        for size in groups:
+            point = self._pick_spawn_point(player_pos, flow_field)
+            if point is None:
+                unplaced += size
+                continue
+            px, py = point
+            for i in range(size):
+                # Scatter the rest of the burst around the spawn point
+                x, y = self._scatter_point(px, py, flow_field) if i > 0 else point
+
+                zombies.spawn(x, y, self.type_table.sample(rng))
+                spawned += 1
+        return spawned, unplaced
+
+    def relocate(self, rows, player_pos, flow_field):
+        """
+        Move parked zombie rows (see ZombieStore.take) to a fresh spawn point as one group.
+        Returns (placed, unplaced); nothing moves if no valid spot is found.
+        """
+        point = self._pick_spawn_point(player_pos, flow_field)
+        if point is None:
+            return [], rows
+        for i, row in enumerate(rows):
+            row["x"], row["y"] = self._scatter_point(*point, flow_field) if i > 0 else point
+        return rows, []
@@ -0,0 +1,58 @@
+"""
+Startup profiling - time-to-first-frame split into phases, for keeping the packaged
+build's cold start within STARTUP_BUDGET_MS. Enabled with ZOMBII_STARTUP_PROFILE=1.
+Timing starts when this module is first imported, at the top of main.py.
+"""
+import os
+import json
+import time
+from settings import *
+
+
+_start = time.perf_counter()
+_last = _start
+phases = []
+finished = False
+
+
+def mark(phase):
+    """Close the current phase under `phase`, timed since the previous mark."""
+    global _last
+    now = time.perf_counter()
+    phases.append((phase, (now - _last) * 1000))
+    _last = now
+
+
+def first_frame_shown():
+    """Record the first presented frame and, if profiling, write the report."""
+    global finished
+    if finished:
+        return
+    finished = True
+    mark("first frame")
+    if STARTUP_PROFILE:
+        write_report()
+
+
+def report():
+    total = sum(ms for _, ms in phases)
+    return {
+        "phases_ms": {name: round(ms, 2) for name, ms in phases},
+        "total_ms": round(total, 2),
+        "budget_ms": STARTUP_BUDGET_MS,
+        "within_budget": total <= STARTUP_BUDGET_MS,
+    }
+
+
+def write_report(path=None):
+    """Print the report and save it (windowed builds have no console)."""
+    if path is None:
+        path = os.path.join(DATA_DIR, "startup.json")
+    data = report()
+    print(json.dumps(data, indent=1))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+    except OSError:
+        pass
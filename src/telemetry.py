@@ -0,0 +1,122 @@
+"""
+Field telemetry - per-frame metrics packed into a preallocated ring buffer on the game
+thread and flushed to a compact binary file by a background writer thread.
+
+File layout: magic, version, record format (length-prefixed), then fixed-size records.
+"""
+import os
+import time
+import struct
+import threading
+from settings import *
+
+
+TELEMETRY_MAGIC = b"ZTEL"
+TELEMETRY_VERSION = 1
+
+# frame, frame ms, update ms, draw ms, zombies, bullets, particles, wave, spawned, damage taken
+RECORD = struct.Struct("<IfffHHHHHf")
+RECORD_FIELDS = ("frame", "frame_ms", "update_ms", "draw_ms", "zombies", "bullets",
+                 "particles", "wave", "spawned", "damage")
+_HEADER = struct.Struct("<4sHB")  # magic, version, record format length
+
+
+class Telemetry:
+    """
+    Single-producer ring buffer of frame records. record() never blocks or allocates a
+    buffer; when the writer falls a full ring behind, new records are dropped and counted.
+    """
+
+    def __init__(self, path, capacity=None, flush_interval=None):
+        capacity = capacity if capacity is not None else TELEMETRY_CAPACITY
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval if flush_interval is not None else TELEMETRY_FLUSH_INTERVAL
+        self.buffer = bytearray(RECORD.size * capacity)
+        self.written = 0    # records produced (game thread only)
+        self.flushed = 0    # records written to disk (writer thread only)
+        self.dropped = 0
+        self.frame = 0
+        self.last_error = None
+
+        self._closed = False
+        self._wake = threading.Event()
+        self._file = self._open(path)
+        self._thread = threading.Thread(target=self._writer, name="telemetry", daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _open(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        f = open(path, "wb")
+        fmt = RECORD.format.encode()
+        f.write(_HEADER.pack(TELEMETRY_MAGIC, TELEMETRY_VERSION, len(fmt)) + fmt)
+        return f
+
+    def record(self, frame_ms, update_ms, draw_ms, zombies, bullets, particles, wave, spawned, damage):
+        """Pack one frame's metrics into the ring."""
+        self.frame += 1
+        if self.written - self.flushed >= self.capacity:
+            self.dropped += 1
+            return
+        RECORD.pack_into(
+            self.buffer, (self.written % self.capacity) * RECORD.size,
+            self.frame, frame_ms, update_ms, draw_ms,
+            min(zombies, 0xFFFF), min(bullets, 0xFFFF), min(particles, 0xFFFF),
+            wave, spawned, damage,
+        )
+        self.written += 1
+        if self.written - self.flushed >= self.capacity // 2:
+            self._wake.set()
+
+    def _flush(self):
+        end = self.written
+        start = self.flushed
+        if end == start:
+            return
+        size = RECORD.size
+        first = (start % self.capacity) * size
+        last = (end % self.capacity) * size
+        if first < last:
+            chunk = bytes(self.buffer[first:last])
+        else:
+            chunk = bytes(self.buffer[first:]) + bytes(self.buffer[:last])
+        self.flushed = end
+        try:
+            self._file.write(chunk)
+            self._file.flush()
+        except OSError as e:
+            self.last_error = e
+
+    def _writer(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._flush()
+
+    def close(self):
+        """Stop the writer, flush what's left and close the file."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self._flush()
+        self._file.close()
+
+
+def new_session_path():
+    """Telemetry file for a session starting now."""
+    return os.path.join(TELEMETRY_DIR, time.strftime("telemetry-%Y%m%d-%H%M%S.ztel"))
+
+
+def read_telemetry(path):
+    """Yield each record in a telemetry file as a dict."""
+    with open(path, "rb") as f:
+        magic, version, fmt_len = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != TELEMETRY_MAGIC or version != TELEMETRY_VERSION:
+            raise ValueError(f"{path} is not a version {TELEMETRY_VERSION} telemetry file")
+        record = struct.Struct(f.read(fmt_len).decode())
+        while True:
+            data = f.read(record.size)
+            if len(data) < record.size:
+                return
+            yield dict(zip(RECORD_FIELDS, record.unpack(data)))
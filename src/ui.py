@@ -3,6 +3,8 @@ UI elements - menus, HUD, game over screen.
 """
 import pygame
 import math
+import game_clock
+from fonts import load_fonts
 from settings import *
 
 
@@ -25,10 +27,16 @@ class UI:
     def _init_fonts(self):
         """Initialize fonts."""
         pygame.font.init()
-        self.font_title = pygame.font.SysFont("Impact", 72)
-        self.font_large = pygame.font.SysFont("Arial", 48, bold=True)
-        self.font_medium = pygame.font.SysFont("Arial", 28, bold=True)
-        self.font_small = pygame.font.SysFont("Arial", 20)
+        fonts = load_fonts({
+            "title": ("Impact", 72, False),
+            "large": ("Arial", 48, True),
+            "medium": ("Arial", 28, True),
+            "small": ("Arial", 20, False),
+        })
+        self.font_title = fonts["title"]
+        self.font_large = fonts["large"]
+        self.font_medium = fonts["medium"]
+        self.font_small = fonts["small"]
 
     # ─── Main Menu ─────────────────────────────────────────
     def draw_main_menu(self):
@@ -149,8 +157,8 @@ class UI:
         return buttons
 
     # ─── HUD ───────────────────────────────────────────────
-    def draw_hud(self, player, level_manager):
-        """Draw in-game HUD overlay."""
+    def draw_hud(self, player, level_manager, quality_label=None):
+        """Draw in-game HUD overlay, with the adaptive quality level if one is given."""
         w = SCREEN_WIDTH
 
         # Semi-transparent HUD background bar
@@ -197,6 +205,10 @@ class UI:
         )
         self.screen.blit(score_text, (w - 150, 10))
 
+        if quality_label:
+            quality_text = self.font_small.render(f"Quality: {quality_label}", True, LIGHT_GRAY)
+            self.screen.blit(quality_text, (w - quality_text.get_width() - 10, 55))
+
         # Wave announcement
         if level_manager.is_announcing():
             announce_surf = self.font_title.render(level_manager.get_wave_text(), True, NEON_RED)
@@ -209,13 +221,18 @@ class UI:
         # Between waves text
         if level_manager.between_waves and level_manager.wave_complete:
             remaining = max(0, level_manager.between_wave_duration -
-                          (pygame.time.get_ticks() - level_manager.between_wave_start))
+                          (game_clock.get_ticks() - level_manager.between_wave_start))
             text = self.font_medium.render(
                 f"Next wave in {remaining // 1000 + 1}...", True, YELLOW,
             )
             rect = text.get_rect(center=(w // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(text, rect)
 
+    def draw_debug_text(self, text):
+        """Draw a line of diagnostics along the bottom edge."""
+        surf = self.font_small.render(text, True, LIGHT_GRAY)
+        self.screen.blit(surf, (10, SCREEN_HEIGHT - surf.get_height() - 8))
+
     # ─── Game Over ─────────────────────────────────────────
     def draw_game_over(self, player, level_manager):
         """Draw game over screen."""
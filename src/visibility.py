@@ -0,0 +1,123 @@
+"""
+Visibility cache - cover tables precomputed from the static obstacle layout.
+Each player cell stores, per angular sector, whether a zombie in that direction is certainly
+blocked, certainly open, or near a boundary where the exact ray test is still needed.
+"""
+import math
+from settings import *
+from spatial import SpatialGrid
+from obstacle import is_behind_cover
+
+
+_SECTOR_WIDTH = math.tau / VISIBILITY_SECTORS
+
+
+def _angle_diff(a, b):
+    """Absolute difference between two angles, wrapped into [0, pi]."""
+    diff = abs(a - b) % math.tau
+    return math.tau - diff if diff > math.pi else diff
+
+
+def _sector_of(dx, dy):
+    """Get the angular sector index for a direction."""
+    return int((math.atan2(dy, dx) + math.pi) / _SECTOR_WIDTH) % VISIBILITY_SECTORS
+
+
+def _sector_center(i):
+    """Get the center angle of a sector."""
+    return -math.pi + (i + 0.5) * _SECTOR_WIDTH
+
+
+class VisibilityMap:
+    """
+    Lazily built per-cell cover tables.
+    Obstacles never move during a game, so a table is built the first time its
+    cell is queried and reused for the rest of the game.
+    """
+
+    def __init__(self, obstacles, cell_size=None):
+        cell_size = cell_size if cell_size is not None else VISIBILITY_CELL_SIZE
+        self.cell_size = cell_size
+        self.half_diag = cell_size * math.sqrt(2) / 2
+        self.obstacle_grid = SpatialGrid(COLLISION_GRID_CELL_SIZE)
+        for obstacle in obstacles or ():
+            self.obstacle_grid.insert_rect(obstacle, obstacle.collision_rect)
+
+        self._cover_tables = {}
+
+    def _cell_center(self, key):
+        cs = self.cell_size
+        return (key[0] * cs + cs / 2, key[1] * cs + cs / 2)
+
+    def _nearby_obstacles(self, cx, cy, radius):
+        """Obstacles whose center is within radius of a point."""
+        found = self.obstacle_grid.query(cx, cy, radius)
+        return [
+            o for o in dict.fromkeys(found)
+            if math.hypot(o.pos.x - cx, o.pos.y - cy) <= radius
+        ]
+
+    def _build_cover_table(self, key):
+        """
+        Per sector: -1 means never covered, a finite value means covered whenever the
+        zombie is at least that far away, and inf means the exact test must decide.
+        """
+        cx, cy = self._cell_center(key)
+        h = self.half_diag
+        candidates = self._nearby_obstacles(cx, cy, COVER_HIDE_DIST + h)
+        if not candidates:
+            return None
+
+        half_w = _SECTOR_WIDTH / 2
+        thresholds = [-1.0] * VISIBILITY_SECTORS
+        for obstacle in candidates:
+            d0 = math.hypot(obstacle.pos.x - cx, obstacle.pos.y - cy)
+            if d0 <= h:
+                # Player may stand on either side of it - always test exactly
+                thresholds = [t if t >= 0 else math.inf for t in thresholds]
+                continue
+
+            theta = math.atan2(obstacle.pos.y - cy, obstacle.pos.x - cx)
+            jitter = math.asin(h / d0)
+            outer_half = math.asin(min(1.0, COVER_LINE_DIST / (d0 - h)))
+            inner_half = math.asin(min(1.0, COVER_LINE_DIST / (d0 + h)))
+
+            for i in range(VISIBILITY_SECTORS):
+                diff = _angle_diff(_sector_center(i), theta)
+                lo = max(0.0, diff - half_w) - jitter
+                hi = min(math.pi, diff + half_w) + jitter
+                if lo >= outer_half:
+                    continue
+
+                definite = None
+                if d0 + h <= COVER_HIDE_DIST and hi < inner_half:
+                    c = math.cos(hi)
+                    if c > 0:
+                        # Obstacle lies between them once the zombie is this far out
+                        definite = max(d0 + h, (d0 + h) / (2 * c))
+
+                current = thresholds[i] if thresholds[i] >= 0 else math.inf
+                thresholds[i] = min(current, definite) if definite is not None else current
+
+        return thresholds, candidates
+
+    def is_player_covered(self, player_pos, zombie_pos):
+        """Check if the player is behind cover from a zombie (table lookup, exact at boundaries)."""
+        px, py = player_pos.x, player_pos.y
+        key = (int(px // self.cell_size), int(py // self.cell_size))
+        if key in self._cover_tables:
+            table = self._cover_tables[key]
+        else:
+            table = self._cover_tables[key] = self._build_cover_table(key)
+        if table is None:
+            return False
+
+        thresholds, candidates = table
+        dx = zombie_pos.x - px
+        dy = zombie_pos.y - py
+        value = thresholds[_sector_of(dx, dy)]
+        if value < 0:
+            return False
+        if value != math.inf and dx * dx + dy * dy >= value * value:
+            return True
+        return is_behind_cover(px, py, zombie_pos.x, zombie_pos.y, candidates)
@@ -3,22 +3,18 @@ Weapon system - handles shooting logic with spread and multi-bullet.
 """
 import math
 import random
-import pygame
 from settings import WEAPONS
-from bullet import Bullet
 
 
-def fire_weapon(player, assets):
-    """Fire the player's current weapon, returning a list of Bullet sprites."""
+def fire_weapon(player, bullets):
+    """Fire the player's current weapon into the BulletStore. Returns how many bullets spawned."""
     if not player.can_shoot():
-        return []
+        return 0
 
     player.shoot()
     weapon = WEAPONS[player.current_weapon]
-    bullets = []
 
     base_angle = player.angle
-    bullet_surface = assets.get(f"bullet_{player.current_weapon}")
 
     for _ in range(weapon["bullets_per_shot"]):
         # Apply spread
@@ -31,7 +27,6 @@ def fire_weapon(player, assets):
         bx = player.pos.x + math.cos(rad) * offset_dist
         by = player.pos.y - math.sin(rad) * offset_dist
 
-        bullet = Bullet(bx, by, angle, player.current_weapon, bullet_surface)
-        bullets.append(bullet)
+        bullets.spawn(bx, by, angle, player.current_weapon)
 
-    return bullets
+    return weapon["bullets_per_shot"]
@@ -0,0 +1,126 @@
+"""
+Streamed world - splits an effectively unbounded map into chunks around the player.
+Chunks near the player are active (obstacles simulated and drawn, zombies updated);
+distant chunks are suspended with their zombies parked as dormant until revisited.
+Chunk obstacles are generated procedurally from the world seed on first visit.
+"""
+import pygame
+import random
+from settings import *
+from obstacle import generate_obstacles
+
+
+class Chunk:
+    """A square piece of the world holding its obstacles and dormant zombies."""
+
+    def __init__(self, key, obstacles):
+        self.key = key
+        self.obstacles = obstacles
+        self.dormant_zombies = []
+
+
+class ChunkedWorld:
+    """Keeps the chunks around the player active and suspends the rest."""
+
+    def __init__(self, assets, player_start_pos, seed=None):
+        self.assets = assets
+        self.player_start_pos = player_start_pos
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.chunks = {}
+        self.active_keys = set()
+        self.center_key = None
+        self._dormant = 0
+
+        # Obstacles of active chunks only; updated in place as chunks stream
+        self.obstacles = pygame.sprite.Group()
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+
+    def chunk_of(self, x, y):
+        """Get the (col, row) key of the chunk containing a world position."""
+        return (int(x // CHUNK_SIZE), int(y // CHUNK_SIZE))
+
+    def _get_chunk(self, key):
+        """Get a chunk, generating its obstacles from the world seed on first visit."""
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            col, row = key
+            rng = random.Random(f"{self.seed}:{col}:{row}")
+            # Inset by half the spacing so neighbouring chunks keep their distance too
+            inset = OBSTACLE_MIN_DIST // 2
+            bounds = (
+                col * CHUNK_SIZE + inset, row * CHUNK_SIZE + inset,
+                (col + 1) * CHUNK_SIZE - inset, (row + 1) * CHUNK_SIZE - inset,
+            )
+            obstacles = generate_obstacles(
+                self.assets, self.player_start_pos,
+                count=CHUNK_OBSTACLE_COUNT, bounds=bounds, rng=rng,
+            )
+            chunk = self.chunks[key] = Chunk(key, obstacles.sprites())
+        return chunk
+
+    def update(self, player_pos, zombies):
+        """
+        Stream chunks around the player. Zombies in chunks that go dormant are taken
+        out of the ZombieStore, and put back when their chunk becomes active again.
+        Returns True if the active set changed.
+        """
+        center = self.chunk_of(player_pos.x, player_pos.y)
+        if center == self.center_key:
+            return False
+        self.center_key = center
+
+        r = CHUNK_ACTIVE_RADIUS
+        new_keys = {
+            (center[0] + dc, center[1] + dr)
+            for dr in range(-r, r + 1)
+            for dc in range(-r, r + 1)
+        }
+
+        # Park every zombie outside the new active area (stragglers included),
+        # then suspend the chunks that fell out of range
+        store = zombies.store
+        xs, ys = store.columns["x"], store.columns["y"]
+        # Backwards, so swap-removal only moves entries that were already checked
+        for i in range(store.count - 1, -1, -1):
+            if self.chunk_of(xs[i], ys[i]) not in new_keys:
+                self.park(zombies.take(store.handle_at(i)))
+        for key in self.active_keys - new_keys:
+            self.obstacles.remove(*self.chunks[key].obstacles)
+
+        # Activate chunks that came into range, waking their zombies
+        for key in new_keys - self.active_keys:
+            chunk = self._get_chunk(key)
+            self.obstacles.add(*chunk.obstacles)
+            for row in chunk.dormant_zombies:
+                zombies.put(row)
+            self._dormant -= len(chunk.dormant_zombies)
+            chunk.dormant_zombies = []
+
+        self.active_keys = new_keys
+        self.bounds = pygame.Rect(
+            (center[0] - r) * CHUNK_SIZE, (center[1] - r) * CHUNK_SIZE,
+            (2 * r + 1) * CHUNK_SIZE, (2 * r + 1) * CHUNK_SIZE,
+        )
+        return True
+
+    def is_active(self, x, y):
+        """Check whether a world position lies in an active chunk."""
+        return self.chunk_of(x, y) in self.active_keys
+
+    def park(self, row):
+        """Keep a zombie row (from ZombieStore.take) dormant in the chunk it stands in."""
+        self._get_chunk(self.chunk_of(row["x"], row["y"])).dormant_zombies.append(row)
+        self._dormant += 1
+
+    def take_dormant(self):
+        """Remove and return the rows of every parked zombie."""
+        zombies = []
+        for chunk in self.chunks.values():
+            zombies.extend(chunk.dormant_zombies)
+            chunk.dormant_zombies = []
+        self._dormant = 0
+        return zombies
+
+    def dormant_count(self):
+        """Get how many zombies are parked in suspended chunks."""
+        return self._dormant
@@ -1,114 +1,228 @@
 """
-Zombie entity - chases the player, scales with difficulty.
+Zombies - the horde, stored as component arrays in an EntityStore.
+Movement/AI, obstacle pushing, attacks and rendering run as systems over the arrays;
+type stats and rotated sprites are shared per zombie type.
 """
 import pygame
 import math
 import random
+import itertools
+import game_clock
+import quality
 from settings import *
-
-
-class Zombie(pygame.sprite.Sprite):
-    """Zombie that chases the player. Type determines stats."""
-
-    def __init__(self, x, y, zombie_type, asset_surface, difficulty):
-        super().__init__()
-        self.zombie_type = zombie_type
-        self.type_info = ZOMBIE_TYPES[zombie_type]
-        self.original_image = asset_surface
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.pos = pygame.math.Vector2(x, y)
-
-        # Stats scaled by difficulty
-        base_speed = difficulty["zombie_speed"]
-        self.speed = base_speed * self.type_info["speed_mult"]
-        self.max_hp = difficulty["zombie_hp"] * self.type_info["hp_mult"]
-        self.hp = self.max_hp
-        self.damage = difficulty["damage_per_hit"] * self.type_info["damage_mult"]
-        self.score_value = self.type_info["score"]
-
-        # Attack cooldown
-        self.attack_cooldown = 800  # ms between attacks
-        self.last_attack = 0
-
-        # Movement wobble for natural feel
-        self.wobble_offset = random.uniform(-0.5, 0.5)
-        self.wobble_timer = random.uniform(0, math.pi * 2)
-
-    def update(self, player_pos):
-        """Move toward the player."""
-        # Direction to player
-        direction = player_pos - self.pos
-        dist = direction.length()
-
-        if dist > 0:
-            direction = direction.normalize()
+from ecs import EntityStore
+from obstacle import push_out_of_obstacles
+
+
+ZOMBIE_KEYS = list(ZOMBIE_TYPES)
+ATTACK_COOLDOWN = 800  # ms between attacks
+
+# Round-robin slots spread staggered AI updates evenly across frames
+_ai_slots = itertools.count()
+
+
+class ZombieStore:
+    """All active zombies. Parked (dormant) zombies leave the store as plain rows."""
+
+    FIELDS = {
+        "x": "d", "y": "d",
+        "speed": "f",                      # velocity is speed along the steering direction
+        "wobble_offset": "f", "wobble_timer": "f",
+        "angle": "f",                      # heading in degrees
+        "hp": "f", "max_hp": "f",          # health
+        "damage": "f",
+        "last_attack": "q",                # attack cooldown start (ms)
+        "type": "B",                       # index into ZOMBIE_KEYS
+        "image_angle": "h",                # sprite: rotation of the drawn image
+        "w": "H", "h": "H",                # sprite: size of the drawn image
+        "ai_slot": "I",                    # AI stagger slot, also the network id
+    }
+
+    def __init__(self, assets, difficulty):
+        self.store = EntityStore(self.FIELDS, capacity=128)
+        self.difficulty = difficulty
+        self.images = [assets.get(f"zombie_{key}") for key in ZOMBIE_KEYS]
+        self.sizes = [ZOMBIE_TYPES[key]["size"] for key in ZOMBIE_KEYS]
+        self.hit_radii = [size / 2 for size in self.sizes]
+        self.scores = [ZOMBIE_TYPES[key]["score"] for key in ZOMBIE_KEYS]
+        # (type, angle) -> rotated image; at most 360 / rotation_step images per type
+        self._rotated = {}
+
+    def __len__(self):
+        return self.store.count
+
+    def spawn(self, x, y, zombie_type):
+        """Add a zombie of the given type at (x, y). Returns its handle."""
+        info = ZOMBIE_TYPES[zombie_type]
+        difficulty = self.difficulty
+        t = ZOMBIE_KEYS.index(zombie_type)
+        image = self.images[t]
+        max_hp = difficulty["zombie_hp"] * info["hp_mult"]
+        return self.store.create(
+            x=x, y=y,
+            speed=difficulty["zombie_speed"] * info["speed_mult"],
+            # Movement wobble for natural feel
+            wobble_offset=random.uniform(-0.5, 0.5),
+            wobble_timer=random.uniform(0, math.pi * 2),
+            hp=max_hp, max_hp=max_hp,
+            damage=difficulty["damage_per_hit"] * info["damage_mult"],
+            type=t,
+            w=image.get_width(), h=image.get_height(),
+            ai_slot=next(_ai_slots),
+        )
+
+    def destroy(self, handle):
+        self.store.destroy(handle)
+
+    def clear(self):
+        self.store.clear()
+
+    def take(self, handle):
+        """
+        Remove a zombie and return its components as a row dict (for parking),
+        or None if the handle is stale.
+        """
+        i = self.store.index_of(handle)
+        if i < 0:
+            return None
+        row = {name: column[i] for name, column in self.store.columns.items()}
+        self.store.destroy(handle)
+        return row
+
+    def rows(self):
+        """Row dicts of every zombie (as take() would return them)."""
+        columns = self.store.columns.items()
+        return [{name: column[i] for name, column in columns} for i in range(self.store.count)]
+
+    def put(self, row):
+        """Re-add a zombie from a row made by take(). Returns its new handle."""
+        return self.store.create(**row)
+
+    def _rotated_image(self, t, image_angle):
+        key = (t, image_angle)
+        image = self._rotated.get(key)
+        if image is None:
+            image = self._rotated[key] = pygame.transform.rotate(self.images[t], image_angle)
+        return image
+
+    def update(self, due, player_pos, flow_field=None):
+        """
+        Movement/AI system for the (index, steps, visible) entries from the AI scheduler.
+        Each zombie moves toward the player, following the shared flow field if given;
+        `steps` simulates several frames of movement at once, and zombies that are not
+        `visible` skip rotation.
+        """
+        c = self.store.columns
+        xs, ys, speeds, angles = c["x"], c["y"], c["speed"], c["angle"]
+        offsets, timers = c["wobble_offset"], c["wobble_timer"]
+        types, image_angles, ws, hs = c["type"], c["image_angle"], c["w"], c["h"]
+        step = quality.get("rotation_step")
+        pos = pygame.math.Vector2()
+
+        for i, steps, visible in due:
+            # Direction to player (routed around obstacles by the flow field)
+            pos.update(xs[i], ys[i])
+            if flow_field is not None:
+                direction = flow_field.sample(pos, player_pos)
+            else:
+                direction = player_pos - pos
+            dist = direction.length()
+            if dist <= 0:
+                continue
+            dx, dy = direction.x / dist, direction.y / dist
 
             # Add slight wobble
-            self.wobble_timer += 0.05
-            wobble = math.sin(self.wobble_timer) * self.wobble_offset
-            perpendicular = pygame.math.Vector2(-direction.y, direction.x)
-            move = direction + perpendicular * wobble
-            if move.length() > 0:
-                move = move.normalize()
-
-            self.pos += move * self.speed
-            self.rect.center = (int(self.pos.x), int(self.pos.y))
-
-            # Rotate toward player
-            angle = math.degrees(math.atan2(-direction.y, direction.x))
-            self.image = pygame.transform.rotate(self.original_image, angle)
-            self.rect = self.image.get_rect(center=self.rect.center)
-
-    def can_attack(self):
-        """Check attack cooldown."""
-        now = pygame.time.get_ticks()
-        if now - self.last_attack >= self.attack_cooldown:
-            self.last_attack = now
-            return True
-        return False
-
-    def take_damage(self, amount):
-        """Take damage, return True if dead."""
-        self.hp -= amount
-        return self.hp <= 0
-
-    def draw_health_bar(self, surface, camera):
-        """Draw health bar above zombie if damaged."""
-        if self.hp >= self.max_hp:
-            return
-        screen_rect = camera.apply(self)
-        bar_width = self.type_info["size"]
-        bar_height = 4
-        bar_x = screen_rect.centerx - bar_width // 2
-        bar_y = screen_rect.top - 8
-
-        # Background
-        pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
-        # Health fill
-        fill = max(0, (self.hp / self.max_hp) * bar_width)
-        color = HEALTH_GREEN if self.hp / self.max_hp > 0.5 else RED
-        pygame.draw.rect(surface, color, (bar_x, bar_y, int(fill), bar_height))
-
-
-def spawn_zombie(player_pos, difficulty, assets):
-    """Spawn a zombie at a random position away from the player."""
-    # Pick zombie type by weight
-    types = list(ZOMBIE_TYPES.keys())
-    weights = [ZOMBIE_TYPES[t]["weight"] for t in types]
-    zombie_type = random.choices(types, weights=weights, k=1)[0]
-
-    # Spawn at random edge position, away from player
-    min_dist = 400
-    max_dist = 800
-    angle = random.uniform(0, math.pi * 2)
-    dist = random.uniform(min_dist, max_dist)
-    x = player_pos.x + math.cos(angle) * dist
-    y = player_pos.y + math.sin(angle) * dist
-
-    # Clamp to world
-    x = max(20, min(x, WORLD_WIDTH - 20))
-    y = max(20, min(y, WORLD_HEIGHT - 20))
-
-    surface = assets.get(f"zombie_{zombie_type}")
-    return Zombie(x, y, zombie_type, surface, difficulty)
+            timers[i] += 0.05 * steps
+            wobble = math.sin(timers[i]) * offsets[i]
+            mx, my = dx - dy * wobble, dy + dx * wobble
+            length = math.hypot(mx, my)
+            if length > 0:
+                mx, my = mx / length, my / length
+
+            xs[i] += mx * speeds[i] * steps
+            ys[i] += my * speeds[i] * steps
+
+            if not visible:
+                continue
+
+            # Rotate toward player, snapped to the quality level's rotation step
+            angles[i] = math.degrees(math.atan2(-dy, dx))
+            image_angle = round(angles[i] / step) * step
+            if image_angle != image_angles[i]:
+                image_angles[i] = image_angle
+                image = self._rotated_image(types[i], image_angle)
+                ws[i], hs[i] = image.get_size()
+
+    def push_out(self, due, obstacles):
+        """Obstacle system: push the zombies just moved out of any obstacles."""
+        c = self.store.columns
+        xs, ys, ws, hs = c["x"], c["y"], c["w"], c["h"]
+        for i, _, _ in due:
+            moved = push_out_of_obstacles(xs[i], ys[i], ws[i], hs[i], obstacles)
+            if moved:
+                xs[i], ys[i] = moved
+
+    def attackers(self, target_rect):
+        """
+        Attack system: dense indices of zombies touching target_rect whose cooldown
+        has run out; their cooldown restarts.
+        """
+        c = self.store.columns
+        xs, ys, ws, hs, last_attacks = c["x"], c["y"], c["w"], c["h"], c["last_attack"]
+        left, top, right, bottom = target_rect.left, target_rect.top, target_rect.right, target_rect.bottom
+        now = game_clock.get_ticks()
+        hits = []
+        for i in range(self.store.count):
+            w, h = ws[i], hs[i]
+            zx = int(xs[i]) - w // 2
+            zy = int(ys[i]) - h // 2
+            if zx < right and zx + w > left and zy < bottom and zy + h > top:
+                if now - last_attacks[i] >= ATTACK_COOLDOWN:
+                    last_attacks[i] = now
+                    hits.append(i)
+        return hits
+
+    def get_draw_items(self, cam_x, cam_y):
+        """
+        Render system: (rect bottom, blits) per zombie for y-sorting with the other
+        sprites; blits is the image plus a health bar when damaged.
+        """
+        c = self.store.columns
+        xs, ys, ws, hs = c["x"], c["y"], c["w"], c["h"]
+        types, image_angles, hps, max_hps = c["type"], c["image_angle"], c["hp"], c["max_hp"]
+        health_bars = quality.get("health_bars")
+        rotated = self._rotated
+        items = []
+        for i in range(self.store.count):
+            w, h = ws[i], hs[i]
+            left = int(xs[i]) - w // 2 - cam_x
+            top = int(ys[i]) - h // 2 - cam_y
+            t = types[i]
+            image = rotated.get((t, image_angles[i])) or self._rotated_image(t, image_angles[i])
+            if health_bars and hps[i] < max_hps[i]:
+                bar_width = self.sizes[t]
+                ratio = hps[i] / max_hps[i]
+                fill = int(max(0, ratio * bar_width))
+                color = HEALTH_GREEN if ratio > 0.5 else RED
+                bar_surf = _get_health_bar_surface(bar_width, fill, color)
+                blits = ((image, (left, top)), (bar_surf, (left + w // 2 - bar_width // 2, top - 8)))
+            else:
+                blits = ((image, (left, top)),)
+            items.append((top + h + cam_y, blits))
+        return items
+
+
+_health_bar_cache = {}
+
+
+def _get_health_bar_surface(bar_width, fill, color, bar_height=4):
+    """Get a cached pre-rendered health bar for a given fill width and color."""
+    key = (bar_width, fill, color)
+    bar_surf = _health_bar_cache.get(key)
+    if bar_surf is None:
+        bar_surf = pygame.Surface((bar_width, bar_height))
+        bar_surf.fill(DARK_GRAY)
+        if fill > 0:
+            bar_surf.fill(color, (0, 0, fill, bar_height))
+        _health_bar_cache[key] = bar_surf
+    return bar_surf